@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""Time per byte of the big-integer (non power-of-two) encodings as the payload grows.
+
+Run with ``python benchmarks/bench_basex.py [encoding ...]``.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from multibase import decode, encode
+
+SIZES = (32, 256, 1024, 16 * 1024, 64 * 1024, 256 * 1024, 1024 * 1024)
+DEFAULT_ENCODINGS = ("base58btc", "base58flickr", "base36", "base10", "base32z")
+
+
+def best_of(func, arg, budget=1.0):
+    """Return the fastest of repeated calls to ``func(arg)`` within roughly ``budget`` seconds."""
+    best = float("inf")
+    deadline = time.perf_counter() + budget
+    while True:
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+        if time.perf_counter() > deadline:
+            return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "encodings", nargs="*", default=list(DEFAULT_ENCODINGS), help="encodings to run (default: %(default)s)"
+    )
+    args = parser.parse_args(argv)
+
+    print(f"{'encoding':<14}{'size':>10}{'encode ns/B':>14}{'decode ns/B':>14}")
+    for encoding in args.encodings:
+        for size in SIZES:
+            data = b"\x01" + os.urandom(size - 1)
+            encoded = encode(encoding, data)
+            assert decode(encoded) == data
+            encode_time = best_of(lambda d: encode(encoding, d), data)
+            decode_time = best_of(decode, encoded)
+            print(f"{encoding:<14}{size:>10}{encode_time / size * 1e9:>14.0f}{decode_time / size * 1e9:>14.0f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
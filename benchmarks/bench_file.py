@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""encode_file()/decode_file() against reading the whole file and calling encode()/decode().
+
+Run from the repository root with the package installed (``make setup``)::
+
+    python benchmarks/bench_file.py                    # 64 MiB, base64 and base32
+    python benchmarks/bench_file.py --size-mib 512 base16 base256emoji
+
+For every encoding, both approaches encode a file of random bytes and decode it
+back. The report shows the wall-clock time and the peak memory allocated by
+Python while doing it (the memory-mapped input itself is not counted, since the
+OS pages it in and out as needed).
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from multibase import decode, decode_file, encode, encode_file
+
+
+def read_all_encode(src, dst, encoding):
+    with open(src, "rb") as f:
+        data = f.read()
+    with open(dst, "wb") as f:
+        f.write(encode(encoding, data))
+
+
+def read_all_decode(src, dst):
+    with open(src, "rb") as f:
+        data = f.read()
+    with open(dst, "wb") as f:
+        f.write(decode(data))
+
+
+def measure(func, *args):
+    """Return the time taken by ``func(*args)`` and the peak memory it allocated, in MiB."""
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("encodings", nargs="*", default=["base64", "base32"], help="encodings to run")
+    parser.add_argument("--size-mib", type=int, default=64, help="size of the file to encode, in MiB")
+    args = parser.parse_args(argv)
+
+    print(f"{'encoding':<16}{'approach':<12}{'enc s':>8}{'enc MiB':>10}{'dec s':>8}{'dec MiB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        src, encoded, decoded = (os.path.join(tmp, name) for name in ("src", "encoded", "decoded"))
+        with open(src, "wb") as f:
+            for _ in range(args.size_mib):
+                f.write(os.urandom(1024 * 1024))
+
+        approaches = {"read-all": (read_all_encode, read_all_decode), "mmap": (encode_file, decode_file)}
+        for encoding in args.encodings:
+            for name, (encode_func, decode_func) in approaches.items():
+                encode_seconds, encode_peak = measure(encode_func, src, encoded, encoding)
+                decode_seconds, decode_peak = measure(decode_func, encoded, decoded)
+                print(
+                    f"{encoding:<16}{name:<12}{encode_seconds:>8.2f}{encode_peak:>10.1f}"
+                    f"{decode_seconds:>8.2f}{decode_peak:>10.1f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
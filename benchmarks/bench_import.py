@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""Wall-clock cost of ``import multibase`` in a fresh interpreter.
+
+Run from the repository root with the package installed (``make setup``)::
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --target 5 --runs 50
+    python benchmarks/bench_import.py --baseline 1a2b3c4 --max-ratio 1.2
+
+Every run starts a new interpreter, once for ``python -c pass`` and once for
+``python -c "import multibase"``; the best time of each is kept and the
+difference is reported as the import overhead. The script exits with status 1
+if the overhead is above ``--target`` milliseconds.
+
+If the ``--baseline`` git ref exists, the package as of that ref is exported
+into a temporary directory and both trees are imported alternately under
+``python -X importtime``; the script also exits with status 1 if the working
+tree takes more than ``--max-ratio`` times as long as the baseline. Bytecode is
+written and reused, as in an installed package, even if
+``PYTHONDONTWRITEBYTECODE`` is set.
+"""
+
+import argparse
+import io
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+# Milliseconds ``import multibase`` may add on top of a bare interpreter start
+DEFAULT_TARGET_MS = 6.0
+# The last release before the converters were rewritten, compared against if it exists
+DEFAULT_BASELINE = "v2.0.0"
+# Import time the working tree may take, relative to the baseline
+DEFAULT_MAX_RATIO = 1.5
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def interpreter_env(path):
+    """Return the environment for an interpreter importing the package in ``path``, with bytecode caching on."""
+    env = {key: value for key, value in os.environ.items() if key not in ("PYTHONDONTWRITEBYTECODE", "PYTHONPATH")}
+    env["PYTHONPATH"] = str(path)
+    return env
+
+
+def time_interpreter(code, runs):
+    """Return the wall-clock times, in milliseconds, of ``runs`` fresh interpreters running ``code``."""
+    env = interpreter_env(ROOT)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def import_time(path):
+    """Return the ``-X importtime`` time of ``import multibase``, in milliseconds, for the package in ``path``."""
+    command = [sys.executable, "-X", "importtime", "-c", "import multibase"]
+    result = subprocess.run(command, cwd=path, env=interpreter_env(path), check=True, capture_output=True, text=True)
+    # Lines look like "import time:  self [us] | cumulative | name", with nested names indented
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "multibase":
+            return int(cumulative) / 1000
+    raise RuntimeError(f"No import time reported for multibase in {path}")
+
+
+def ref_exists(ref):
+    """Return whether ``ref`` names a commit in the repository."""
+    command = ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"]
+    return subprocess.run(command, cwd=ROOT, capture_output=True).returncode == 0
+
+
+def export_tree(ref, path):
+    """Write the ``multibase`` package as of git ``ref`` to ``path``."""
+    archive = subprocess.run(["git", "archive", ref, "multibase"], cwd=ROOT, check=True, capture_output=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(path, filter="data")
+
+
+def compare_to_baseline(ref, runs):
+    """Return the best ``import multibase`` times, in milliseconds, of ``ref`` and of the working tree."""
+    with tempfile.TemporaryDirectory() as baseline_path:
+        export_tree(ref, baseline_path)
+        # Write the bytecode caches before timing anything
+        import_time(baseline_path)
+        import_time(ROOT)
+        # Alternate between the two, so that both see the same machine load
+        times = [(import_time(baseline_path), import_time(ROOT)) for _ in range(runs)]
+    return min(before for before, _ in times), min(after for _, after in times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="number of interpreters started for each measurement")
+    parser.add_argument(
+        "--target", type=float, default=DEFAULT_TARGET_MS, help="maximum acceptable import overhead in milliseconds"
+    )
+    parser.add_argument(
+        "--baseline", default=DEFAULT_BASELINE, help="git ref to compare against, skipped if it doesn't exist"
+    )
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=DEFAULT_MAX_RATIO,
+        help="maximum acceptable import time, as a multiple of the baseline's",
+    )
+    args = parser.parse_args(argv)
+
+    # Warm up the OS caches and write the bytecode caches before timing anything
+    time_interpreter("import multibase", 1)
+    bare = time_interpreter("pass", args.runs)
+    imported = time_interpreter("import multibase", args.runs)
+
+    print(f"{'':<24}{'best ms':>10}{'median ms':>12}")
+    print(f"{'python -c pass':<24}{min(bare):>10.1f}{statistics.median(bare):>12.1f}")
+    print(f"{'import multibase':<24}{min(imported):>10.1f}{statistics.median(imported):>12.1f}")
+    overhead = min(imported) - min(bare)
+    print(f"\nimport overhead: {overhead:.1f} ms (target {args.target:.1f} ms)")
+    status = 0 if overhead <= args.target else 1
+
+    if not ref_exists(args.baseline):
+        print(f"baseline {args.baseline}: not found, comparison skipped")
+        return status
+    baseline, current = compare_to_baseline(args.baseline, args.runs)
+    ratio = current / baseline
+    print(
+        f"baseline {args.baseline}: {baseline:.2f} ms, working tree {current:.2f} ms (-X importtime), "
+        f"{ratio:.2f}x (maximum {args.max_ratio:.2f}x)"
+    )
+    return status if ratio <= args.max_ratio else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""Nanoseconds per call of encode()/decode() for key- and CID-sized inputs.
+
+Run from the repository root with the package installed (``make setup``)::
+
+    python benchmarks/bench_small.py                     # base58btc, 34-byte inputs
+    python benchmarks/bench_small.py --size 36 --target 5000 base58btc base36
+
+Every call converts a multihash-like payload (a 0x12 0x20 header followed by
+random bytes). The script exits with status 1 if any encode or decode call takes
+longer than ``--target`` nanoseconds.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+from multibase import decode, encode
+
+# Nanoseconds a base58btc encode() or decode() of a 34-byte multihash may take
+DEFAULT_TARGET_NS = 10000.0
+
+
+def ns_per_call(func, arg, number=2000, repeat=20):
+    """Return the best time per call of ``func(arg)``, in nanoseconds."""
+    return min(timeit.repeat(lambda: func(arg), number=number, repeat=repeat)) / number * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("encodings", nargs="*", default=["base58btc"], help="encodings to run")
+    parser.add_argument("--size", type=int, default=34, help="size of the payload, in bytes")
+    parser.add_argument(
+        "--target", type=float, default=DEFAULT_TARGET_NS, help="maximum acceptable time per call in nanoseconds"
+    )
+    args = parser.parse_args(argv)
+
+    data = b"\x12\x20" + os.urandom(args.size - 2)
+    slowest = 0.0
+    print(f"{'encoding':<16}{'size':>6}{'encode ns':>12}{'decode ns':>12}")
+    for encoding in args.encodings:
+        encoded = encode(encoding, data)
+        assert decode(encoded) == data
+        encode_ns = ns_per_call(lambda d: encode(encoding, d), data)
+        decode_ns = ns_per_call(decode, encoded)
+        slowest = max(slowest, encode_ns, decode_ns)
+        print(f"{encoding:<16}{args.size:>6}{encode_ns:>12.0f}{decode_ns:>12.0f}")
+    print(f"\nslowest call: {slowest:.0f} ns (target {args.target:.0f} ns)")
+    return 0 if slowest <= args.target else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
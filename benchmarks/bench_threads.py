@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Scaling of multibase.concurrent.map_encode()/map_decode() over a thread pool.
+
+Run from the repository root with the package installed (``make setup``)::
+
+    python benchmarks/bench_threads.py                      # base58btc and base64, 1 thread up to the CPU count
+    python benchmarks/bench_threads.py --threads 1 2 4 8 base32
+
+Every run converts the same items, so on a free-threaded (no-GIL) build the
+speedup over one thread should grow close to linearly up to the number of cores.
+With the GIL enabled it stays around 1x.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from multibase import concurrent, encode
+
+
+def best_time(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("encodings", nargs="*", default=["base58btc", "base64"], help="encodings to run")
+    parser.add_argument("--threads", type=int, nargs="+", help="thread counts to run, defaults to powers of two")
+    parser.add_argument("--items", type=int, default=20000, help="number of items to convert")
+    parser.add_argument("--size", type=int, default=64, help="size of every item, in bytes")
+    args = parser.parse_args(argv)
+    threads = args.threads or sorted({1 << n for n in range(cpus.bit_length())} | {cpus})
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {cpus} CPUs")
+    print(f"{'encoding':<16}{'threads':>8}{'enc s':>9}{'dec s':>9}{'speedup':>9}")
+    items = [b"\x01" + os.urandom(args.size - 1) for _ in range(args.items)]
+    for encoding in args.encodings:
+        encoded = [encode(encoding, item) for item in items]
+        baseline = None
+        for count in threads:
+            with ThreadPoolExecutor(count) as executor:
+                encode_seconds = best_time(lambda: concurrent.map_encode(executor, encoding, items))
+                decode_seconds = best_time(lambda: concurrent.map_decode(executor, encoded))
+            total = encode_seconds + decode_seconds
+            baseline = baseline or total
+            print(f"{encoding:<16}{count:>8}{encode_seconds:>9.3f}{decode_seconds:>9.3f}{baseline / total:>8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
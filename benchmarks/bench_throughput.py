@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+"""Throughput, latency and peak memory of every encoding across payload sizes.
+
+Run from the repository root with the package installed (``make setup``)::
+
+    python benchmarks/bench_throughput.py                       # print a report
+    python benchmarks/bench_throughput.py --save baseline.json  # store a baseline
+    python benchmarks/bench_throughput.py --compare baseline.json --threshold 0.15
+
+``--compare`` exits with status 1 if any encode/decode throughput dropped by more
+than ``--threshold`` (a fraction) compared to the baseline. The stdlib
+``base64``/``binascii`` codecs are measured alongside as ``stdlib:*`` reference lines.
+"""
+
+import argparse
+import base64
+import binascii
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from multibase import decode, encode, list_encodings
+
+DEFAULT_SIZES = (32, 1024, 64 * 1024, 1024 * 1024, 16 * 1024 * 1024)
+
+REFERENCES = {
+    "stdlib:base16": (binascii.hexlify, binascii.unhexlify),
+    "stdlib:base32": (base64.b32encode, base64.b32decode),
+    "stdlib:base64": (base64.b64encode, base64.b64decode),
+}
+
+
+def time_call(func, arg, budget):
+    """Return the best time of repeated ``func(arg)`` calls within roughly ``budget`` seconds."""
+    best = float("inf")
+    deadline = time.perf_counter() + budget
+    while True:
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+        if time.perf_counter() > deadline:
+            return best
+
+
+def peak_memory(func, arg):
+    """Return the peak memory allocated while running ``func(arg)``, in bytes."""
+    tracemalloc.start()
+    try:
+        func(arg)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(func, arg, size, budget):
+    elapsed = time_call(func, arg, budget)
+    return {
+        "mb_s": size / elapsed / 1e6,
+        "latency_us": elapsed * 1e6,
+        "peak_kib": peak_memory(func, arg) / 1024,
+    }
+
+
+def codecs():
+    """Yield ``(name, encode, decode)`` for every multibase encoding and stdlib reference."""
+    for encoding in list_encodings():
+        yield encoding, (lambda data, encoding=encoding: encode(encoding, data)), decode
+    for name, (ref_encode, ref_decode) in REFERENCES.items():
+        yield name, ref_encode, ref_decode
+
+
+def run(sizes, names, budget, max_call_seconds):
+    results = {}
+    for name, codec_encode, codec_decode in codecs():
+        if names and name not in names:
+            continue
+        results[name] = {}
+        for size in sizes:
+            data = os.urandom(size)
+            start = time.perf_counter()
+            encoded = codec_encode(data)
+            codec_decode(encoded)
+            if time.perf_counter() - start > max_call_seconds:
+                # Larger payloads would only take longer; don't spend minutes on them
+                print(f"{name}: skipping sizes above {size} bytes", file=sys.stderr)
+                break
+            results[name][str(size)] = {
+                "encode": measure(codec_encode, data, size, budget),
+                "decode": measure(codec_decode, encoded, size, budget),
+            }
+            print_row(name, size, results[name][str(size)])
+    return results
+
+
+def print_row(name, size, result):
+    encode_result, decode_result = result["encode"], result["decode"]
+    print(
+        f"{name:<18}{size:>10}"
+        f"{encode_result['mb_s']:>12.2f}{encode_result['latency_us']:>14.1f}{encode_result['peak_kib']:>12.0f}{'':>4}"
+        f"{decode_result['mb_s']:>12.2f}{decode_result['latency_us']:>14.1f}{decode_result['peak_kib']:>12.0f}"
+    )
+
+
+def compare(results, baseline, threshold):
+    """Print the ratio of each throughput to the baseline and return the list of regressions."""
+    regressions = []
+    print(f"\n{'encoding':<18}{'size':>10}{'encode x':>12}{'decode x':>12}")
+    for name, sizes in results.items():
+        for size, result in sizes.items():
+            base = baseline.get(name, {}).get(size)
+            if base is None:
+                continue
+            ratios = []
+            for operation in ("encode", "decode"):
+                ratio = result[operation]["mb_s"] / base[operation]["mb_s"]
+                ratios.append(ratio)
+                if ratio < 1 - threshold:
+                    regressions.append((name, size, operation, ratio))
+            flags = " ".join("!" if ratio < 1 - threshold else "" for ratio in ratios)
+            print(f"{name:<18}{size:>10}{ratios[0]:>12.2f}{ratios[1]:>12.2f}  {flags}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("encodings", nargs="*", help="encodings to run (default: all, plus stdlib references)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="payload sizes in bytes")
+    parser.add_argument("--budget", type=float, default=0.2, help="seconds spent timing each measurement")
+    parser.add_argument(
+        "--max-call-seconds", type=float, default=2.0, help="skip larger sizes once one round trip takes this long"
+    )
+    parser.add_argument("--save", metavar="FILE", help="write the results to FILE as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare the results against the JSON baseline in FILE")
+    parser.add_argument("--threshold", type=float, default=0.1, help="throughput drop that counts as a regression")
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'encoding':<18}{'size':>10}"
+        f"{'enc MB/s':>12}{'enc us/call':>14}{'enc KiB':>12}{'':>4}"
+        f"{'dec MB/s':>12}{'dec us/call':>14}{'dec KiB':>12}"
+    )
+    results = run(args.sizes, set(args.encodings), args.budget, args.max_call_seconds)
+
+    if args.save:
+        document = {
+            "meta": {
+                "python": sys.version,
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            },
+            "results": results,
+        }
+        with open(args.save, "w") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+            for name, size, operation, ratio in regressions:
+                print(f"  {name} {operation} at {size} bytes: {ratio:.2f}x baseline")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
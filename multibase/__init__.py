@@ -12,15 +12,49 @@ from .exceptions import (  # noqa: F401
 )
 from .multibase import (  # noqa: F401
     ENCODINGS,
+    CacheInfo,
+    CachingDecoder,
     ComposedDecoder,
     Decoder,
     Encoder,
     Encoding,
     decode,
+    decode_into,
+    decode_many,
+    decode_str,
     encode,
+    encode_many,
+    encode_shortest,
+    encode_str,
+    encoded_length,
     get_codec,
     get_encoding_info,
     is_encoded,
     is_encoding_supported,
     list_encodings,
+    max_decoded_length,
+    transcode,
+    validate,
 )
+
+# The streaming helpers are imported on first use, to keep mmap and friends off the import path
+_STREAM_NAMES = frozenset(
+    (
+        "FileConversion",
+        "IncrementalDecoder",
+        "IncrementalEncoder",
+        "decode_file",
+        "encode_file",
+        "open_decoder",
+        "open_encoder",
+    )
+)
+
+
+def __getattr__(name):
+    if name in _STREAM_NAMES:
+        from . import stream
+
+        value = globals()[name] = getattr(stream, name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,116 @@
+"""Streaming multibase encoding and decoding for asyncio streams.
+
+The helpers read from an :py:class:`asyncio.StreamReader` (or anything with an
+``async read(n)`` method) and write to an :py:class:`asyncio.StreamWriter` (or
+anything with ``write()`` and ``async drain()``) one chunk at a time. They give
+the event loop a turn between chunks, and chunks of at least
+``executor_threshold`` bytes are converted in an executor so that large bodies
+don't block the loop. Only the encodings that can be streamed are supported,
+see :py:func:`multibase.open_encoder`.
+
+This module is not imported by ``import multibase``; use ``from multibase import aio``.
+"""
+
+import asyncio
+
+from .multibase import get_codec, get_encoding_info
+from .stream import _EMOJI_PREFIX, CHUNK_SIZE, _check_streamable, _ChunkDecoder
+
+# Chunks of at least this many bytes are converted in an executor instead of on the event loop
+EXECUTOR_THRESHOLD = 256 * 1024
+
+
+async def _convert(function, chunk, executor, executor_threshold):
+    if len(chunk) >= executor_threshold:
+        return await asyncio.get_running_loop().run_in_executor(executor, function, chunk)
+    result = function(chunk)
+    # Let other tasks run between chunks
+    await asyncio.sleep(0)
+    return result
+
+
+async def _write(writer, data):
+    if data:
+        writer.write(data)
+        await writer.drain()
+
+
+async def encode_stream(
+    reader, writer, encoding, chunk_size=CHUNK_SIZE, executor=None, executor_threshold=EXECUTOR_THRESHOLD
+):
+    """
+    Multibase encodes everything read from ``reader`` into ``writer``
+
+    The multibase prefix is written first, then the data chunk by chunk. The writer
+    is drained after every chunk but not closed.
+
+    :param reader: stream to read the data to encode from, e.g. an :py:class:`asyncio.StreamReader`
+    :param writer: stream to write the encoded data to, e.g. an :py:class:`asyncio.StreamWriter`
+    :param str encoding: encoding to use, should be one of the supported encodings
+    :param int chunk_size: approximate number of input bytes to encode at a time
+    :param executor: :py:class:`concurrent.futures.Executor` for large chunks, defaults to the loop's default executor
+    :param int executor_threshold: chunks of at least this many bytes are encoded in the executor
+    :return: number of input bytes encoded
+    :rtype: int
+    :raises UnsupportedEncodingError: if the encoding is not supported or can not be streamed
+    """
+    codec = get_encoding_info(encoding)
+    group_bytes, _ = _check_streamable(codec)
+    chunk_size = max(group_bytes, chunk_size - chunk_size % group_bytes)
+    encode = codec.converter.encode
+    await _write(writer, codec.code)
+
+    total = 0
+    pending = b""
+    while True:
+        data = await reader.read(chunk_size)
+        if not data:
+            break
+        total += len(data)
+        data = pending + data
+        aligned = len(data) - len(data) % group_bytes
+        pending = data[aligned:]
+        if aligned:
+            await _write(writer, await _convert(encode, data[:aligned], executor, executor_threshold))
+    if pending:
+        await _write(writer, encode(pending))
+    return total
+
+
+async def decode_stream(reader, writer, chunk_size=CHUNK_SIZE, executor=None, executor_threshold=EXECUTOR_THRESHOLD):
+    """
+    Decodes the multibase encoded data read from ``reader`` into ``writer``
+
+    The encoding is detected from the prefix at the start of ``reader``. The writer
+    is drained after every chunk but not closed.
+
+    :param reader: stream to read the encoded data from, e.g. an :py:class:`asyncio.StreamReader`
+    :param writer: stream to write the decoded data to, e.g. an :py:class:`asyncio.StreamWriter`
+    :param int chunk_size: number of encoded bytes to read at a time
+    :param executor: :py:class:`concurrent.futures.Executor` for large chunks, defaults to the loop's default executor
+    :param int executor_threshold: chunks of at least this many bytes are decoded in the executor
+    :return: the encoding of the data
+    :rtype: str
+    :raises InvalidMultibaseStringError: if the encoding can not be determined
+    :raises UnsupportedEncodingError: if the encoding can not be streamed
+    :raises DecodingError: if decoding fails
+    """
+    # Same loop as stream._read_head(), which can't await the reads
+    head = b""
+    eof = False
+    while len(head) < len(_EMOJI_PREFIX) and not eof:
+        data = await reader.read(chunk_size)
+        eof = not data
+        head += data
+    codec = get_codec(head)
+    chunks = _ChunkDecoder(codec)
+
+    data = head[len(codec.code) :]
+    while True:
+        chunk = chunks.feed(data, final=eof)
+        if chunk:
+            await _write(writer, await _convert(chunks.decode, chunk, executor, executor_threshold))
+        if eof:
+            return codec.encoding
+        data = await reader.read(chunk_size)
+        eof = not data
@@ -0,0 +1,231 @@
+"""The ``multibase`` command-line tool, also available as ``python -m multibase``.
+
+Every subcommand reads stdin and writes stdout. By default the whole input is
+one value, which is streamed in chunks for the encodings that allow it (see
+:py:func:`multibase.open_encoder`); other encodings need the whole value in
+memory. With ``--lines`` every input line is a separate value and gets one
+output line; values that fail are reported on stderr, leave an empty output line
+and make the exit status 1.
+"""
+
+import argparse
+import itertools
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .exceptions import MultibaseError, UnsupportedEncodingError
+from .multibase import decode, decode_many, encode, encode_many, get_codec, list_encodings
+from .stream import CHUNK_SIZE, StreamEncoder, _check_streamable, _ChunkDecoder, _read_head
+
+# Number of lines read at a time in --lines mode
+LINES_BATCH = 16 * 1024
+
+
+class _CountingReader:
+    """Binary reader that counts the bytes read from ``fileobj``."""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.count = 0
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self.count += len(data)
+        return data
+
+    def readline(self):
+        line = self._fileobj.readline()
+        self.count += len(line)
+        return line
+
+
+class _CountingWriter:
+    """Binary writer that counts the bytes written to ``fileobj``."""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.count = 0
+
+    def write(self, data):
+        self.count += len(data)
+        return self._fileobj.write(data)
+
+    def flush(self):
+        self._fileobj.flush()
+
+
+class _WholeEncoder:
+    """Stand-in for :py:class:`multibase.stream.StreamEncoder` for the encodings that can't be streamed."""
+
+    def __init__(self, fileobj, encoding):
+        self._fileobj = fileobj
+        self._encoding = encoding
+        self._parts = []
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+
+    def close(self):
+        self._fileobj.write(encode(self._encoding, b"".join(self._parts)))
+
+
+def _open_encoder(fileobj, encoding, chunk_size):
+    try:
+        return StreamEncoder(fileobj, encoding, chunk_size=chunk_size)
+    except UnsupportedEncodingError:
+        # Raised again by encode() if the encoding isn't supported at all
+        encode(encoding, b"")
+        return _WholeEncoder(fileobj, encoding)
+
+
+def _decode_stream(reader, write, chunk_size):
+    """Decode everything in ``reader`` chunk by chunk, passing the decoded data to ``write``."""
+    head, eof = _read_head(reader.read, chunk_size)
+    codec = get_codec(head)
+    try:
+        _check_streamable(codec)
+    except UnsupportedEncodingError:
+        write(decode((head + reader.read()).rstrip(b"\r\n")))
+        return
+    chunks = _ChunkDecoder(codec)
+    data = head[len(codec.code) :]
+    held = b""
+    while True:
+        # Hold back trailing line breaks, so that a final newline isn't decoded
+        data = held + data
+        value = data.rstrip(b"\r\n")
+        held = data[len(value) :]
+        write(chunks.decode(chunks.feed(value, final=eof)))
+        if eof:
+            return
+        data = reader.read(chunk_size)
+        eof = not data
+
+
+def _stream(args, reader, writer):
+    if args.command == "detect":
+        head, _ = _read_head(reader.read, args.chunk_size)
+        writer.write(get_codec(head).encoding.encode() + b"\n")
+        return 0
+
+    output = writer
+    if args.command in ("encode", "transcode"):
+        output = _open_encoder(writer, args.encoding, args.chunk_size)
+    if args.command == "encode":
+        for data in iter(lambda: reader.read(args.chunk_size), b""):
+            output.write(data)
+    else:
+        _decode_stream(reader, output.write, args.chunk_size)
+    if output is not writer:
+        output.close()
+        writer.write(b"\n")
+    return 0
+
+
+def _convert_lines(command, encoding, lines):
+    """Convert a batch of values, returning the output line (or the exception) for each."""
+    if command == "encode":
+        return encode_many(encoding, lines, return_exceptions=True)
+    if command == "detect":
+        results = []
+        for line in lines:
+            try:
+                results.append(get_codec(line).encoding.encode())
+            except MultibaseError as e:
+                results.append(e)
+        return results
+    results = decode_many(lines, return_exceptions=True)
+    if command == "transcode":
+        decoded = [result for result in results if not isinstance(result, Exception)]
+        encoded = iter(encode_many(encoding, decoded, return_exceptions=True))
+        results = [result if isinstance(result, Exception) else next(encoded) for result in results]
+    return results
+
+
+def _lines(args, reader, writer):
+    executor = ProcessPoolExecutor(args.jobs) if args.jobs > 1 else None
+    status = 0
+    number = 0
+    try:
+        while True:
+            lines = [line.rstrip(b"\r\n") for line in itertools.islice(iter(reader.readline, b""), LINES_BATCH)]
+            if not lines:
+                return status
+            if executor is None:
+                results = _convert_lines(args.command, args.encoding, lines)
+            else:
+                size = -(-len(lines) // args.jobs)
+                batches = [lines[start : start + size] for start in range(0, len(lines), size)]
+                futures = [executor.submit(_convert_lines, args.command, args.encoding, batch) for batch in batches]
+                results = [result for future in futures for result in future.result()]
+            for result in results:
+                number += 1
+                if isinstance(result, Exception):
+                    print(f"multibase: line {number}: {result}", file=sys.stderr)
+                    status = 1
+                    result = b""
+                writer.write(result + b"\n")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _positive_int(value):
+    """argparse type for the options that must be a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a whole number of at least 1, got {value!r}")
+    return number
+
+
+def _parser():
+    parser = argparse.ArgumentParser(prog="multibase", description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    commands = {
+        "encode": "encode stdin",
+        "decode": "decode stdin",
+        "detect": "print the encoding of stdin",
+        "transcode": "decode stdin and encode it again in another encoding",
+    }
+    for command, help in commands.items():
+        subparser = subparsers.add_parser(command, help=help, description=help)
+        if command in ("encode", "transcode"):
+            subparser.add_argument("-e", "--encoding", required=True, choices=list_encodings(), help="encoding to use")
+        subparser.add_argument("--lines", action="store_true", help="treat every line as a separate value")
+        subparser.add_argument(
+            "--jobs",
+            type=_positive_int,
+            default=1,
+            help="number of processes converting lines in parallel (with --lines)",
+        )
+        subparser.add_argument(
+            "--chunk-size", type=_positive_int, default=CHUNK_SIZE, help="bytes read from stdin at a time"
+        )
+        subparser.add_argument("--stats", action="store_true", help="report the throughput on stderr when done")
+        subparser.set_defaults(encoding=None)
+    return parser
+
+
+def main(argv=None):
+    args = _parser().parse_args(argv)
+    reader = _CountingReader(sys.stdin.buffer)
+    writer = _CountingWriter(sys.stdout.buffer)
+    start = time.perf_counter()
+    try:
+        status = (_lines if args.lines else _stream)(args, reader, writer)
+    except MultibaseError as e:
+        print(f"multibase: {e}", file=sys.stderr)
+        status = 1
+    writer.flush()
+    if args.stats:
+        elapsed = time.perf_counter() - start
+        print(
+            f"multibase: {reader.count} bytes in, {writer.count} bytes out in {elapsed:.3f} s "
+            f"({reader.count / max(elapsed, 1e-9) / 1e6:.1f} MB/s)",
+            file=sys.stderr,
+        )
+    return status
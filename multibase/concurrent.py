@@ -0,0 +1,75 @@
+"""Batch encoding and decoding spread over a :py:class:`concurrent.futures.Executor`.
+
+The items are split into batches that are converted with
+:py:func:`multibase.encode_many`/:py:func:`multibase.decode_many` on the
+executor's workers, and the results are put back in input order. The codecs keep
+no per-call state, so with a :py:class:`~concurrent.futures.ThreadPoolExecutor`
+this scales with the number of cores on free-threaded (no-GIL) Python builds; on
+builds with the GIL, a :py:class:`~concurrent.futures.ProcessPoolExecutor` gives
+the same scaling at the cost of pickling the items.
+
+This module is not imported by ``import multibase``; use ``from multibase import concurrent``.
+"""
+
+import os
+
+from .multibase import decode_many, encode_many, get_encoding_info
+
+# Smallest number of items submitted to the executor at once, so that tiny batches
+# don't spend more time in the executor than converting
+MIN_BATCH_SIZE = 64
+
+
+def _batches(items, batch_size):
+    items = list(items)
+    if batch_size is None:
+        # A few batches per CPU, so that uneven item sizes still balance out
+        batch_size = max(MIN_BATCH_SIZE, -(-len(items) // (4 * (os.cpu_count() or 1))))
+    return [items[start : start + batch_size] for start in range(0, len(items), batch_size)]
+
+
+def map_encode(executor, encoding, items, batch_size=None, return_exceptions=False):
+    """
+    Encodes each of the given items using the encoding that is specified, on the executor's workers
+
+    :param executor: :py:class:`concurrent.futures.Executor` to run the batches on
+    :param str encoding: encoding to use, should be one of the supported encoding
+    :param items: iterable of data to encode
+    :type items: iterable of str or bytes
+    :param int batch_size: number of items per batch, defaults to a few batches per CPU
+    :param return_exceptions: if True, an item that fails to encode gets the exception in its
+        place in the result instead of aborting the whole batch
+    :type return_exceptions: bool
+    :return: multibase encoded data, in the same order as ``items``
+    :rtype: list
+    :raises UnsupportedEncodingError: if the encoding is not supported
+    """
+    get_encoding_info(encoding)
+    futures = [
+        executor.submit(encode_many, encoding, batch, return_exceptions) for batch in _batches(items, batch_size)
+    ]
+    return [result for future in futures for result in future.result()]
+
+
+def map_decode(executor, items, return_encoding=False, batch_size=None, return_exceptions=False):
+    """
+    Decodes each of the given multibase encoded items, on the executor's workers
+
+    :param executor: :py:class:`concurrent.futures.Executor` to run the batches on
+    :param items: iterable of multibase encoded data
+    :type items: iterable of str or bytes
+    :param return_encoding: if True, every result is a tuple (encoding, decoded_data)
+    :type return_encoding: bool
+    :param int batch_size: number of items per batch, defaults to a few batches per CPU
+    :param return_exceptions: if True, an item that fails to decode gets the exception in its
+        place in the result instead of aborting the whole batch
+    :type return_exceptions: bool
+    :return: decoded data, in the same order as ``items``
+    :rtype: list
+    :raises InvalidMultibaseStringError: if an item is not multibase encoded
+    :raises DecodingError: if decoding an item fails
+    """
+    futures = [
+        executor.submit(decode_many, batch, return_encoding, return_exceptions) for batch in _batches(items, batch_size)
+    ]
+    return [result for future in futures for result in future.result()]
@@ -1,23 +1,301 @@
-from io import BytesIO
-from itertools import zip_longest
+import binascii
 
 from baseconv import BaseConverter
-from morphys import ensure_bytes
+
+# Marks bytes that are not part of an alphabet in decode translation tables
+_INVALID = 0xFF
+# Marks characters that are not part of an alphabet in str.translate decode tables
+_INVALID_CHAR = "\ufffd"
+# Divisors above this many bits are divided through a Newton reciprocal rather than long division
+_FAST_DIVMOD_BITS = 1 << 13
+# Powers of the base above this many bits are recomputed per call instead of cached on the converter
+_MAX_CACHED_POWER_BITS = 1 << 23
+# Big-integer payloads up to this many bytes (keys, hashes, CIDs) are converted a few
+# digits per step with a digit-pair table, which beats setting up divide and conquer
+_SMALL_INPUT_BYTES = 128
+
+
+def ensure_buffer(data):
+    """Return ``data`` as a byte buffer, without copying buffer-protocol objects.
+
+    bytes are returned unchanged and other buffers (bytearray, memoryview, mmap,
+    array, ...) as a flat unsigned-byte memoryview over the same memory. str is
+    UTF-8 encoded and anything else is passed to ``ensure_bytes`` as before.
+    """
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    try:
+        view = memoryview(data)
+    except TypeError:
+        from morphys import ensure_bytes
+
+        return ensure_bytes(data, "utf8")
+    if not view.c_contiguous:
+        return view.tobytes()
+    return view.cast("B")
+
+
+def as_bytes(data):
+    """Return ``data`` as bytes, copying it only if it is some other kind of buffer."""
+    data = ensure_buffer(data)
+    return data if isinstance(data, bytes) else data.tobytes()
+
+
+def ascii_bytes(data):
+    """Return the ASCII str ``data`` as bytes, or raise ValueError naming the first non-ASCII character."""
+    try:
+        return data.encode("ascii")
+    except UnicodeEncodeError as e:
+        raise ValueError(f"Non-alphabet character: {data[e.start]!r}") from None
+
+
+def output_view(out, size):
+    """Return a writable byte view of the first ``size`` bytes of ``out``, or raise if it is too small."""
+    view = memoryview(out).cast("B")
+    if len(view) < size:
+        raise ValueError(f"Output buffer too small: {size} bytes needed, {len(view)} available")
+    return view[:size]
+
+
+class _cached_attribute:
+    """Minimal :py:func:`functools.cached_property`, which would put functools on the import path.
+
+    The value is computed on first access and stored in the instance ``__dict__``,
+    which then shadows this non-data descriptor. Racing threads may both compute
+    it, but every computation gives the same value.
+    """
+
+    def __init__(self, func):
+        self._func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self._name] = self._func(instance)
+        return value
+
+
+def _build_decode_table(alphabet):
+    """Return a 256-entry :py:meth:`bytes.translate` table mapping each character to its digit value."""
+    table = bytearray([_INVALID] * 256)
+    for value, char in enumerate(alphabet):
+        table[char] = value
+    return bytes(table)
+
+
+def _reciprocal(divisor):
+    """Return ``floor(2 ** (2 * n) / divisor)`` where ``n`` is the bit length of ``divisor``.
+
+    Uses Newton iteration seeded from the reciprocal of the top half of the
+    divisor, so the cost is a few multiplications rather than a long division.
+    """
+    n = divisor.bit_length()
+    if n <= _FAST_DIVMOD_BITS:
+        return (1 << (2 * n)) // divisor
+    k = n // 2 + 1
+    estimate = _reciprocal(divisor >> (n - k)) << (n - k)
+    error = (1 << (2 * n)) - divisor * estimate
+    estimate += (estimate * error) >> (2 * n)
+    # The estimate is now within a few units; finish with an exact (and cheap,
+    # since the quotient is tiny) correction step
+    correction, _ = divmod((1 << (2 * n)) - divisor * estimate, divisor)
+    return estimate + correction
+
+
+def _divmod(dividend, divisor, reciprocal):
+    """Compute ``divmod(dividend, divisor)`` for ``dividend < divisor ** 2`` using a precomputed reciprocal."""
+    shift = 2 * divisor.bit_length()
+    quotient = (dividend * reciprocal) >> shift
+    correction, remainder = divmod(dividend - quotient * divisor, divisor)
+    return quotient + correction, remainder
 
 
 class BaseStringConverter(BaseConverter):
+    """Big-integer converter for alphabets whose size is not a power of two.
+
+    The payload is treated as one big-endian integer. Conversion in both
+    directions is divide and conquer: the digit string is split into blocks of
+    ``LEAF_DIGITS * 2 ** level`` digits that are combined (when decoding) or
+    separated (when encoding) with cached powers of the base, so the work is
+    dominated by a few large multiplications instead of one pass per digit.
+
+    The translation tables are built on first use, so that creating a converter
+    (which ``import multibase`` does for every encoding) stays cheap.
+    """
+
+    def __init__(self, digits):
+        super().__init__(digits)
+        base = len(digits)
+        self.base = base
+        # Largest number of digits whose value still fits a single 30-bit
+        # CPython int digit, so leaf conversions stay on small-int fast paths
+        leaf_digits = 1
+        while base ** (leaf_digits + 1) < 1 << 30:
+            leaf_digits += 1
+        self.leaf_digits = leaf_digits
+        self._alphabet = digits.encode("ascii")
+        # _powers[level] == base ** (leaf_digits * 2 ** level); _reciprocals holds
+        # the matching _reciprocal() values, computed only once encoding needs them.
+        # Both only ever gain entries, and every entry is the same whichever thread
+        # computes it, so concurrent calls at worst repeat some work
+        self._powers = [base**leaf_digits]
+        self._reciprocals = {}
+
+    @_cached_attribute
+    def bits_per_char(self):
+        # math is only imported once a converter's layout is needed
+        import math
+
+        return math.log2(self.base)
+
+    @_cached_attribute
+    def _small_input_digits(self):
+        return int(-(-_SMALL_INPUT_BYTES * 8 // self.bits_per_char))
+
+    @_cached_attribute
+    def _alphabet_table(self):
+        return self.digits.encode("ascii").ljust(256, b"\x00")
+
+    @_cached_attribute
+    def _decode_table(self):
+        return _build_decode_table(self.digits.encode("ascii"))
+
+    @_cached_attribute
+    def _digit_pairs(self):
+        # The characters of every two-digit value, indexed by the value
+        digits = self.digits.encode("ascii")
+        return [bytes((high, low)) for high in digits for low in digits]
+
+    def encoded_length(self, size):
+        """Upper bound on the number of characters ``size`` bytes encode to."""
+        # A value below 256 ** size needs at most this many digits, and zero is one digit
+        return max(1, int(-(-size * 8 // self.bits_per_char)))
+
+    def max_decoded_length(self, data):
+        """Upper bound on the number of bytes the characters of ``data`` decode to."""
+        return int(-(-len(data) * self.bits_per_char // 8))
+
+    def _power(self, level):
+        powers = self._powers
+        if level < len(powers):
+            return powers[level]
+        # Extend a copy and publish it with a single assignment, so that threads
+        # sharing the converter never see the list while it is being appended to
+        powers = list(powers)
+        cached = len(powers)
+        while len(powers) <= level:
+            powers.append(powers[-1] * powers[-1])
+            # Don't keep huge powers alive for the lifetime of the process
+            if powers[-1].bit_length() <= _MAX_CACHED_POWER_BITS:
+                cached = len(powers)
+        if cached > len(self._powers):
+            self._powers = powers[:cached]
+        return powers[level]
+
+    def _power_reciprocal(self, level):
+        power = self._power(level)
+        if power.bit_length() <= _FAST_DIVMOD_BITS:
+            return power, None
+        reciprocal = self._reciprocals.get(level)
+        if reciprocal is None:
+            reciprocal = _reciprocal(power)
+            if power.bit_length() <= _MAX_CACHED_POWER_BITS:
+                self._reciprocals[level] = reciprocal
+        return power, reciprocal
+
+    def int_to_digits(self, number):
+        """Convert a non-negative integer to its digit values, most significant first."""
+        leaf_digits = self.leaf_digits
+        chars = int(number.bit_length() / self.bits_per_char) + 2
+        levels = max(0, (-(-chars // leaf_digits) - 1).bit_length())
+
+        blocks = [number]
+        for level in range(levels - 1, -1, -1):
+            power, reciprocal = self._power_reciprocal(level)
+            split = []
+            for block in blocks:
+                if reciprocal is None:
+                    split.extend(divmod(block, power))
+                else:
+                    split.extend(_divmod(block, power, reciprocal))
+            blocks = split
+
+        base = self.base
+        values = bytearray(len(blocks) * leaf_digits)
+        for position in range(leaf_digits - 1, -1, -1):
+            values[position::leaf_digits] = bytes([block % base for block in blocks])
+            blocks = [block // base for block in blocks]
+        return bytes(values).lstrip(b"\x00") or b"\x00"
+
+    def _small_int_to_chars(self, number):
+        """Encode a small non-negative integer four digits per step, looking the characters up in pairs."""
+        pairs = self._digit_pairs
+        square = self.base * self.base
+        fourth = square * square
+        chunks = []
+        while number:
+            number, low = divmod(number, fourth)
+            high, low = divmod(low, square)
+            chunks += (pairs[low], pairs[high])
+        chunks.reverse()
+        zero = pairs[0][:1]
+        return b"".join(chunks).lstrip(zero) or zero
+
     def encode(self, bytes):
+        bytes = ensure_buffer(bytes)
         number = int.from_bytes(bytes, byteorder="big", signed=False)
-        return ensure_bytes(super().encode(number))
+        if len(bytes) <= _SMALL_INPUT_BYTES:
+            return self._small_int_to_chars(number)
+        return self.int_to_digits(number).translate(self._alphabet_table)
 
-    def bytes_to_int(self, bytes):
-        length = len(bytes)
-        base = len(self.digits)
-        value = 0
+    def encode_str(self, bytes_):
+        """Encode ``bytes_`` to a str."""
+        return self.encode(bytes_).decode("ascii")
 
-        for i, x in enumerate(bytes):
-            value += self.digits.index(chr(x)) * base ** (length - (i + 1))
-        return value
+    def bytes_to_int(self, bytes):
+        bytes = as_bytes(bytes)
+        values = bytes.translate(self._decode_table)
+        invalid = values.find(_INVALID)
+        if invalid != -1:
+            raise ValueError(f"Non-alphabet character: {bytes[invalid : invalid + 1]!r}")
+
+        base = self.base
+        if len(values) <= self._small_input_digits:
+            # Fold two digits per step
+            if len(values) % 2:
+                values = b"\x00" + values
+            square = base * base
+            number = 0
+            for high, low in zip(values[::2], values[1::2]):
+                number = number * square + high * base + low
+            return number
+
+        leaf_digits = self.leaf_digits
+        values = values.rjust(-(-len(values) // leaf_digits) * leaf_digits, b"\x00")
+        blocks = [0] * (len(values) // leaf_digits)
+        for position in range(leaf_digits):
+            blocks = [block * base + value for block, value in zip(blocks, values[position::leaf_digits])]
+
+        level = 0
+        while len(blocks) > 1:
+            if len(blocks) % 2:
+                blocks.insert(0, 0)
+            power = self._power(level)
+            blocks = [high * power + low for high, low in zip(blocks[::2], blocks[1::2])]
+            level += 1
+        return blocks[0] if blocks else 0
+
+    def validate(self, bytes):
+        """Check that ``bytes`` only uses this converter's alphabet, without decoding it."""
+        invalid = as_bytes(bytes).translate(None, self._alphabet)
+        if invalid:
+            raise ValueError(f"Non-alphabet character: {invalid[:1]!r}")
 
     def decode(self, bytes):
         decoded_int = self.bytes_to_int(bytes)
@@ -26,136 +304,516 @@ class BaseStringConverter(BaseConverter):
         decoded_data = decoded_int.to_bytes((decoded_int.bit_length() + 7) // 8, byteorder="big")
         return decoded_data
 
+    def decode_str(self, data):
+        """Decode the str ``data``."""
+        return self.decode(ascii_bytes(data))
+
+
+class Base58StringConverter(BaseStringConverter):
+    """Base58 converter that keeps leading zero bytes.
+
+    As in the base58 spec, every leading zero byte is encoded as a leading zero
+    digit ("1" in the bitcoin alphabet) and every leading zero digit decodes back
+    to a zero byte, so the empty input encodes to the empty string. The rest is
+    converted as a big integer.
+    """
+
+    def _split_zeros(self, data, zero):
+        stripped = data.lstrip(zero)
+        return len(data) - len(stripped), stripped
+
+    def encoded_length(self, size):
+        # Every leading zero byte takes one digit, no more than any other byte
+        return int(-(-size * 8 // self.bits_per_char))
+
+    def max_decoded_length(self, data):
+        data = data if isinstance(data, str) else as_bytes(data)
+        zeros, rest = self._split_zeros(data, self.digits[0] if isinstance(data, str) else self._alphabet[:1])
+        return zeros + (super().max_decoded_length(rest) if rest else 0)
+
+    def encode(self, bytes):
+        zeros, rest = self._split_zeros(as_bytes(bytes), b"\x00")
+        encoded = self._alphabet[:1] * zeros
+        return encoded + super().encode(rest) if rest else encoded
+
+    def decode(self, bytes):
+        zeros, rest = self._split_zeros(as_bytes(bytes), self._alphabet[:1])
+        decoded = b"\x00" * zeros
+        return decoded + super().decode(rest) if rest else decoded
+
 
 class Base16StringConverter(BaseStringConverter):
+    """Hex converter built on :py:mod:`binascii`.
+
+    Every byte maps to exactly two digits, so encoding and decoding are exact-length
+    (leading zero bytes are kept) and decoding is case-insensitive.
+    """
+
+    # Each byte maps to exactly two digits, so base16 can be processed in chunks
+    group_bytes = 1
+    group_chars = 2
+
     def __init__(self, digits):
         super().__init__(digits)
         self.uppercase = digits.isupper()
+        self.bits_per_char = 4
+        # Decoding is case-insensitive, so validation accepts both cases
+        self._alphabet = (digits.lower() + digits.upper()).encode("ascii")
+
+    def encoded_length(self, size):
+        return size * 2
+
+    def max_decoded_length(self, data):
+        return len(data) // 2
 
     def encode(self, bytes):
-        result = "".join([f"{byte:02x}" for byte in bytes])
-        if self.uppercase:
-            result = result.upper()
-        return ensure_bytes(result)
+        encoded = binascii.hexlify(ensure_buffer(bytes))
+        return encoded.upper() if self.uppercase else encoded
+
+    def encode_str(self, bytes_):
+        encoded = ensure_buffer(bytes_).hex()
+        return encoded.upper() if self.uppercase else encoded
 
     def decode(self, data):
-        # Base16 decode is case-insensitive, normalize to our digits case
-        if isinstance(data, bytes):
-            data_str = data.decode("utf-8")
-        else:
-            data_str = data
-        # Convert to match our digits case
-        if self.uppercase:
-            data_str = data_str.upper()
-        else:
-            data_str = data_str.lower()
-        return super().decode(data_str.encode("utf-8"))
+        try:
+            return binascii.unhexlify(data if isinstance(data, str) else ensure_buffer(data))
+        except ValueError:
+            # Raise the same errors as validate() rather than binascii's
+            self.validate(data)
+            raise
+
+    def decode_str(self, data):
+        return self.decode(data)
+
+    def validate(self, bytes):
+        bytes = ensure_buffer(bytes)
+        super().validate(bytes)
+        if len(bytes) % 2:
+            raise ValueError(f"Odd number of hex digits: {len(bytes)}")
 
 
 class BaseByteStringConverter:
-    ENCODE_GROUP_BYTES = 1
-    ENCODING_BITS = 1
-    DECODING_BITS = 1
+    """Bit-packing converter for alphabets whose size is a power of two.
+
+    Input is processed in groups of ``group_bytes`` bytes, each of which maps to
+    ``group_chars`` characters of ``bits`` bits (e.g. 3 bytes to 4 characters for
+    base64). Rather than looping over every character, each output position of a
+    group is computed for all groups at once: the input is split into strided
+    slices, every slice is mapped through a precomputed 256-entry table with
+    :py:meth:`bytes.translate`, and slices contributing to the same position are
+    OR-ed together as big integers (the bit fields never overlap, so no carries
+    cross byte lanes). The results are then interleaved back into place.
+
+    The tables and plans are built on first use, so that creating a converter
+    (which ``import multibase`` does for every encoding) stays cheap.
+    """
 
     def __init__(self, digits, pad=False):
         self.digits = digits
         self.pad = pad
 
-    def _chunk_with_padding(self, iterable, n, fillvalue=None):
-        "Collect data into fixed-length chunks or blocks"
-        # _chunk_with_padding('ABCDEFG', 3, 'x') --> ABC DEF Gxx"
-        args = [iter(iterable)] * n
-        return zip_longest(*args, fillvalue=fillvalue)
-
-    def _chunk_without_padding(self, iterable, n):
-        return map("".join, zip(*[iter(iterable)] * n))
-
-    def _encode_bytes(self, bytes_, group_bytes, encoding_bits, decoding_bits, output_chars):
-        buffer = BytesIO(bytes_)
-        encoded_bytes = BytesIO()
-        input_length = len(bytes_)
-
-        while True:
-            byte_ = buffer.read(group_bytes)
-            if not byte_:
-                break
-
-            # convert all bytes to a binary format and concatenate them into a 24bit string
-            binstringfmt = f"{{:0{encoding_bits}b}}"
-            binstring = "".join([binstringfmt.format(x) for x in byte_])
-            # break the 24 bit length string into pieces of 6 bits each and convert them to integer
-            digits = (int("".join(x), 2) for x in self._chunk_with_padding(binstring, decoding_bits, "0"))
-
-            for digit in digits:
-                # convert binary representation to an integer
-                encoded_bytes.write(ensure_bytes(self.digits[digit]))
-
-        result = encoded_bytes.getvalue()
+        bits = len(digits).bit_length() - 1
+        if len(digits) != 1 << bits or not 1 <= bits <= 7:
+            raise ValueError(f"Alphabet size must be a power of two between 2 and 128, got {len(digits)}")
+        self.bits = self.bits_per_char = bits
+        # Smallest number of bits that is a whole number of both bytes and characters
+        group_bits = bits
+        while group_bits % 8:
+            group_bits += bits
+        self.group_bytes = group_bits // 8
+        self.group_chars = group_bits // bits
+        self._alphabet = digits.encode("ascii")
+
+    @_cached_attribute
+    def _partial_group_chars(self):
+        # Number of characters a trailing partial group can legitimately have
+        return frozenset(-(-n * 8 // self.bits) for n in range(self.group_bytes))
+
+    @_cached_attribute
+    def _alphabet_table(self):
+        mask = (1 << self.bits) - 1
+        return bytes(self._alphabet[x & mask] for x in range(256))
+
+    @_cached_attribute
+    def _decode_table(self):
+        return _build_decode_table(self._alphabet)
+
+    @_cached_attribute
+    def _encode_plan(self):
+        return self._build_plan(8, self.bits, self.group_chars, self._alphabet_table)
+
+    @_cached_attribute
+    def _decode_plan(self):
+        return self._build_plan(self.bits, 8, self.group_bytes, None)
+
+    @staticmethod
+    def _build_plan(src_bits, dst_bits, dst_count, final_table):
+        """Work out, for each output unit of a group, which input units feed it.
+
+        Every entry is a list of ``(input index, table)`` pairs, where the table
+        moves the relevant bits of that input unit into their final position. When
+        an output unit is fed by a single input unit the ``final_table`` (the
+        alphabet) is folded into its table, otherwise it is applied after merging.
+        """
+        plan = []
+        for k in range(dst_count):
+            start, end = k * dst_bits, (k + 1) * dst_bits
+            parts = []
+            for i in range(start // src_bits, (end - 1) // src_bits + 1):
+                src_start = i * src_bits
+                lo, hi = max(start, src_start), min(end, src_start + src_bits)
+                width_mask = (1 << (hi - lo)) - 1
+                src_shift = src_start + src_bits - hi
+                dst_shift = end - hi
+                table = bytes(((x >> src_shift) & width_mask) << dst_shift for x in range(256))
+                parts.append((i, table))
+            if len(parts) == 1 and final_table is not None:
+                parts = [(parts[0][0], parts[0][1].translate(final_table))]
+                plan.append((parts, None))
+            else:
+                plan.append((parts, final_table))
+        return plan
+
+    @staticmethod
+    def _repack(units, count, in_size, plan, out_size, out=None):
+        """Convert ``count`` whole groups of ``in_size`` units to groups of ``out_size`` units.
+
+        The result is written to the byte view ``out`` if given, otherwise returned as bytes.
+        """
+        if count == 0:
+            return b""
+        if in_size == 1:
+            lanes = [units if isinstance(units, bytes) else units.tobytes()]
+        else:
+            stop = count * in_size
+            lanes = [units[i:stop:in_size] for i in range(in_size)]
+            if not isinstance(units, bytes):
+                lanes = [lane.tobytes() for lane in lanes]
+
+        result = out
+        if result is None and out_size > 1:
+            result = bytearray(count * out_size)
+        for k, (parts, final_table) in enumerate(plan):
+            if len(parts) == 1:
+                i, table = parts[0]
+                lane = lanes[i].translate(table)
+            else:
+                merged = 0
+                for i, table in parts:
+                    merged |= int.from_bytes(lanes[i].translate(table), "big")
+                lane = merged.to_bytes(count, "big")
+                if final_table is not None:
+                    lane = lane.translate(final_table)
+            if result is None:
+                return lane
+            result[k::out_size] = lane
+        return bytes(result) if out is None else None
+
+    def encoded_length(self, size):
+        """Number of characters ``size`` bytes encode to, including padding."""
+        if self.pad:
+            return -(-size // self.group_bytes) * self.group_chars
+        return -(-size * 8 // self.bits)
 
-        # Add padding if needed (RFC 4648)
+    def max_decoded_length(self, data):
+        """Number of bytes the characters of ``data`` decode to, if they are valid."""
+        chars = len(data)
         if self.pad:
-            remainder = input_length % group_bytes
-            if remainder > 0:
-                # For partial groups, we need to pad the output
-                # The padding makes the output length a multiple of output_chars
-                chars_produced = len(result)
-                # Calculate padding needed to reach next multiple of output_chars
-                padding_needed = output_chars - (chars_produced % output_chars)
-                result += ensure_bytes("=" * padding_needed)
-
-        return result
-
-    def _decode_bytes(self, bytes_, group_bytes, decoding_bits, encoding_bits):
+            # Padding only ever fills out the last group
+            tail = data[-self.group_chars :]
+            tail = tail.encode("ascii", "replace") if isinstance(tail, str) else bytes(tail)
+            chars -= len(tail) - len(tail.rstrip(b"="))
+        return chars * self.bits // 8
+
+    def _decode_values(self, bytes_):
+        """Strip the padding off ``bytes_`` and map every character to its digit value."""
+        bytes_ = as_bytes(bytes_)
         # Remove padding if present
         if self.pad:
             bytes_ = bytes_.rstrip(b"=")
 
-        buffer = BytesIO()
-        decoded_bytes = BytesIO()
+        values = bytes_.translate(self._decode_table)
+        invalid = values.find(_INVALID)
+        if invalid != -1:
+            raise ValueError(f"Non-alphabet character: {bytes_[invalid : invalid + 1]!r}")
+        return values
 
-        for byte_ in bytes_.decode():
-            idx = self.digits.index(byte_)
-            buffer.write(bytes([idx]))
+    def encode_into(self, out, bytes_):
+        """Encode ``bytes_`` straight into the writable buffer ``out``.
 
-        buffer.seek(0)
-        while True:
-            byte_ = buffer.read(group_bytes)
-            if not byte_:
-                break
-
-            # convert all bytes to a binary format and concatenate them into a 8, 16, 24bit string
-            binstringfmt = f"{{:0{decoding_bits}b}}"
-            binstring = "".join([binstringfmt.format(x) for x in byte_])
-
-            # break the 24 bit length string into pieces of 8 bits each and convert them to integer
-            digits = [int("".join(x), 2) for x in self._chunk_without_padding(binstring, encoding_bits)]
+        :return: the number of bytes written
+        :rtype: int
+        :raises ValueError: if ``out`` is too small
+        """
+        bytes_ = ensure_buffer(bytes_)
+        size = self.encoded_length(len(bytes_))
+        out = output_view(out, size)
+        group_bytes, group_chars = self.group_bytes, self.group_chars
+        count, remainder = divmod(len(bytes_), group_bytes)
+        self._repack(bytes_, count, group_bytes, self._encode_plan, group_chars, out[: count * group_chars])
+
+        if remainder:
+            # Zero-fill the trailing partial group and keep only the characters
+            # that carry input bits
+            offset = count * group_chars
+            tail = bytes(bytes_[count * group_bytes :]) + bytes(group_bytes - remainder)
+            chars = -(-remainder * 8 // self.bits)
+            out[offset : offset + chars] = self._repack(tail, 1, group_bytes, self._encode_plan, group_chars)[:chars]
+            # Add padding if needed (RFC 4648)
+            out[offset + chars :] = b"=" * (size - offset - chars)
+
+        return size
+
+    def _decode_values_into(self, out, values):
+        size = len(values) * self.bits // 8
+        out = output_view(out, size)
+        group_bytes, group_chars = self.group_bytes, self.group_chars
+        count, remainder = divmod(len(values), group_chars)
+        self._repack(values, count, group_chars, self._decode_plan, group_bytes, out[: count * group_bytes])
+
+        if remainder:
+            offset = count * group_bytes
+            tail = values[count * group_chars :] + bytes(group_chars - remainder)
+            out[offset:] = self._repack(tail, 1, group_chars, self._decode_plan, group_bytes)[: size - offset]
+
+        return size
+
+    def decode_into(self, out, bytes_):
+        """Decode ``bytes_`` straight into the writable buffer ``out``.
+
+        :return: the number of bytes written
+        :rtype: int
+        :raises ValueError: if the data is invalid or ``out`` is too small
+        """
+        return self._decode_values_into(out, self._decode_values(bytes_))
+
+    def validate(self, bytes_):
+        """Check the alphabet, padding and length of ``bytes_`` without decoding it."""
+        bytes_ = as_bytes(bytes_)
+        chars = bytes_.rstrip(b"=") if self.pad else bytes_
+        invalid = chars.translate(None, self._alphabet)
+        if invalid:
+            raise ValueError(f"Non-alphabet character: {invalid[:1]!r}")
+        remainder = len(chars) % self.group_chars
+        if remainder not in self._partial_group_chars:
+            raise ValueError(f"Invalid length: {len(chars)} characters")
+        if self.pad:
+            padding = self.group_chars - remainder if remainder else 0
+            if len(bytes_) - len(chars) != padding:
+                raise ValueError(f"Expected {padding} padding characters, got {len(bytes_) - len(chars)}")
+
+    def encode(self, bytes_):
+        bytes_ = ensure_buffer(bytes_)
+        out = bytearray(self.encoded_length(len(bytes_)))
+        self.encode_into(out, bytes_)
+        return bytes(out)
+
+    def decode(self, bytes_):
+        values = self._decode_values(bytes_)
+        out = bytearray(len(values) * self.bits // 8)
+        self._decode_values_into(out, values)
+        return bytes(out)
+
+    def encode_str(self, bytes_):
+        """Encode ``bytes_`` to a str, straight from the output buffer."""
+        bytes_ = ensure_buffer(bytes_)
+        out = bytearray(self.encoded_length(len(bytes_)))
+        self.encode_into(out, bytes_)
+        return out.decode("ascii")
+
+    def decode_str(self, data):
+        """Decode the str ``data``."""
+        return self.decode(ascii_bytes(data))
+
+    def encode_many(self, items):
+        """Encode a batch of byte strings with a single pass of the engine.
+
+        Every item is zero-filled to a whole number of groups so that the batch can
+        be concatenated and encoded at once, and each result is then cut back to
+        the characters that carry input bits.
+        """
+        group_bytes, group_chars = self.group_bytes, self.group_chars
+        sizes = [len(item) for item in items]
+        joined = b"".join(item.ljust(-(-len(item) // group_bytes) * group_bytes, b"\x00") for item in items)
+        encoded = self._repack(joined, len(joined) // group_bytes, group_bytes, self._encode_plan, group_chars)
+
+        results = []
+        offset = 0
+        for size in sizes:
+            groups = -(-size // group_bytes)
+            chars = -(-size * 8 // self.bits)
+            result = encoded[offset : offset + chars]
+            if self.pad and size % group_bytes:
+                result += b"=" * (groups * group_chars - chars)
+            results.append(result)
+            offset += groups * group_chars
+        return results
+
+    def decode_many(self, items):
+        """Decode a batch of encoded strings with a single pass of the engine.
+
+        The counterpart of :py:meth:`encode_many`: every item is filled with the
+        zero digit to a whole number of groups and the batch is decoded at once.
+        """
+        group_bytes, group_chars = self.group_bytes, self.group_chars
+        zero_digit = self._alphabet[:1]
+        sizes = []
+        pieces = []
+        for item in items:
+            if self.pad:
+                item = item.rstrip(b"=")
+            sizes.append(len(item))
+            pieces.append(item.ljust(-(-len(item) // group_chars) * group_chars, zero_digit))
+        joined = b"".join(pieces)
+
+        values = joined.translate(self._decode_table)
+        invalid = values.find(_INVALID)
+        if invalid != -1:
+            raise ValueError(f"Non-alphabet character: {joined[invalid : invalid + 1]!r}")
+        decoded = self._repack(values, len(values) // group_chars, group_chars, self._decode_plan, group_bytes)
+
+        results = []
+        offset = 0
+        for size in sizes:
+            results.append(decoded[offset : offset + size * self.bits // 8])
+            offset += -(-size // group_chars) * group_bytes
+        return results
+
+
+class StdlibByteStringConverter(BaseByteStringConverter):
+    """Bit-packing converter that hands the conversion to a stdlib codec when it can.
+
+    Subclasses name a stdlib codec whose alphabet has the same size. Its output is
+    mapped onto this converter's alphabet with :py:meth:`bytes.translate` and its
+    padding added or removed, so the result is exactly what the bit-packing engine
+    produces. The engine remains as the fallback: it reports invalid data, handles
+    the sizes the stdlib codec is slower at, and does all the work if the converter
+    is created with ``stdlib=False``.
+    """
 
-            for digit in digits:
-                decoded_bytes.write(bytes([digit]))
+    # Set by subclasses: the stdlib codec's alphabet, its encode and decode
+    # functions, and the payload size up to which it beats the bit-packing engine
+    # (None if it does at every size)
+    stdlib_alphabet: bytes | None = None
+    stdlib_max_size: int | None = None
 
-        return decoded_bytes.getvalue()
+    def __init__(self, digits, pad=False, stdlib=True):
+        super().__init__(digits, pad=pad)
+        self.stdlib = stdlib
 
-    def encode(self, bytes):
+    @staticmethod
+    def stdlib_encode(bytes_):
         raise NotImplementedError
 
-    def decode(self, bytes):
-        return NotImplementedError
-
+    @staticmethod
+    def stdlib_decode(bytes_):
+        raise NotImplementedError
 
-class Base64StringConverter(BaseByteStringConverter):
-    def encode(self, bytes):
-        return self._encode_bytes(ensure_bytes(bytes), 3, 8, 6, 4)
+    @_cached_attribute
+    def _from_stdlib_table(self):
+        # None when the alphabets are the same
+        return None if self._alphabet == self.stdlib_alphabet else bytes.maketrans(self.stdlib_alphabet, self._alphabet)
 
-    def decode(self, bytes):
-        return self._decode_bytes(ensure_bytes(bytes), 4, 6, 8)
+    @_cached_attribute
+    def _to_stdlib_table(self):
+        return None if self._alphabet == self.stdlib_alphabet else bytes.maketrans(self._alphabet, self.stdlib_alphabet)
 
+    def _use_stdlib(self, size):
+        return self.stdlib and (self.stdlib_max_size is None or size <= self.stdlib_max_size)
 
-class Base32StringConverter(BaseByteStringConverter):
-    def encode(self, bytes):
-        return self._encode_bytes(ensure_bytes(bytes), 5, 8, 5, 8)
-
-    def decode(self, bytes):
-        return self._decode_bytes(ensure_bytes(bytes), 8, 5, 8)
+    def _stdlib_encode(self, bytes_):
+        encoded = self.stdlib_encode(bytes_)
+        if self.pad:
+            table = self._from_stdlib_table
+            return encoded if table is None else encoded.translate(table)
+        # "=" only ever appears as padding, so it is dropped in the same pass
+        return encoded.translate(self._from_stdlib_table, b"=")
+
+    def _stdlib_decode(self, bytes_):
+        """Decode ``bytes_`` with the stdlib codec, or return None if it is invalid."""
+        chars = bytes_.rstrip(b"=") if self.pad else bytes_
+        # The stdlib codec would take characters outside this alphabet that are part
+        # of its own, so check the alphabet first
+        if chars.translate(None, self._alphabet):
+            return None
+        table = self._to_stdlib_table
+        if table is not None:
+            chars = chars.translate(table)
+        try:
+            return self.stdlib_decode(chars + b"=" * (-len(chars) % self.group_chars))
+        except binascii.Error:
+            return None
+
+    def encode(self, bytes_):
+        bytes_ = ensure_buffer(bytes_)
+        if self._use_stdlib(len(bytes_)):
+            return self._stdlib_encode(bytes_)
+        return super().encode(bytes_)
+
+    def encode_str(self, bytes_):
+        bytes_ = ensure_buffer(bytes_)
+        if self._use_stdlib(len(bytes_)):
+            return self._stdlib_encode(bytes_).decode("ascii")
+        return super().encode_str(bytes_)
+
+    def encode_into(self, out, bytes_):
+        bytes_ = ensure_buffer(bytes_)
+        if self._use_stdlib(len(bytes_)):
+            encoded = self._stdlib_encode(bytes_)
+            output_view(out, len(encoded))[:] = encoded
+            return len(encoded)
+        return super().encode_into(out, bytes_)
+
+    def decode(self, bytes_):
+        bytes_ = as_bytes(bytes_)
+        if self._use_stdlib(len(bytes_) * self.bits // 8):
+            decoded = self._stdlib_decode(bytes_)
+            if decoded is not None:
+                return decoded
+        # Let the engine decode (or report) what the stdlib codec refused
+        return super().decode(bytes_)
+
+    def decode_into(self, out, bytes_):
+        bytes_ = as_bytes(bytes_)
+        if self._use_stdlib(len(bytes_) * self.bits // 8):
+            decoded = self._stdlib_decode(bytes_)
+            if decoded is not None:
+                output_view(out, len(decoded))[:] = decoded
+                return len(decoded)
+        return super().decode_into(out, bytes_)
+
+
+def _b2a_base64(bytes_):
+    return binascii.b2a_base64(bytes_, newline=False)
+
+
+def _b32encode(bytes_):
+    # base64 imports re, which takes longer than the rest of ``import multibase``
+    from base64 import b32encode
+
+    return b32encode(bytes_)
+
+
+def _b32decode(bytes_):
+    from base64 import b32decode
+
+    return b32decode(bytes_)
+
+
+class Base64StringConverter(StdlibByteStringConverter):
+    # binascii's base64 codec is C code, and beats the engine at every size
+    stdlib_alphabet = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+    stdlib_encode = staticmethod(_b2a_base64)
+    stdlib_decode = staticmethod(binascii.a2b_base64)
+
+
+class Base32StringConverter(StdlibByteStringConverter):
+    # The stdlib base32 codec is written in Python; it only has lower per-call
+    # overhead than the engine, which wins from about 128 bytes on
+    stdlib_alphabet = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+    stdlib_encode = staticmethod(_b32encode)
+    stdlib_decode = staticmethod(_b32decode)
+    stdlib_max_size = 128
 
 
 class Base256EmojiConverter:
@@ -166,8 +824,16 @@ class Base256EmojiConverter:
     full compatibility. The alphabet is curated from Unicode emoji frequency
     data, excluding modifier-based emojis (such as flags) that are bigger
     than one single code point.
+
+    The lookup tables are built on first use.
     """
 
+    # One byte per emoji; encoded emoji vary in UTF-8 length, so there is no
+    # fixed number of encoded bytes per group
+    group_bytes = 1
+    group_chars = None
+    bits_per_char = 8
+
     # Hardcoded emoji alphabet matching js-multiformats and go-multibase
     # This is the exact same alphabet used in reference implementations
     # Source: js-multiformats/src/bases/base256emoji.ts and go-multibase/base256emoji.go
@@ -209,11 +875,51 @@ class Base256EmojiConverter:
         # Verify alphabet length
         if len(self._EMOJI_ALPHABET) != 256:
             raise ValueError(f"EMOJI_ALPHABET must contain exactly 256 characters, got {len(self._EMOJI_ALPHABET)}")
-        # Create mapping from byte value to emoji character
-        self.byte_to_emoji = {i: self._EMOJI_ALPHABET[i] for i in range(256)}
-        # Create reverse mapping from emoji character to byte value
-        # This matches the approach in js-multiformats and go-multibase
-        self.emoji_to_byte = {emoji: byte for byte, emoji in self.byte_to_emoji.items()}
+
+    @_cached_attribute
+    def byte_to_emoji(self):
+        """Mapping from byte value to emoji character."""
+        return {i: self._EMOJI_ALPHABET[i] for i in range(256)}
+
+    @_cached_attribute
+    def emoji_to_byte(self):
+        """Reverse mapping from emoji character to byte value, as in js-multiformats and go-multibase."""
+        return {emoji: byte for byte, emoji in self.byte_to_emoji.items()}
+
+    @_cached_attribute
+    def _utf8_lengths(self):
+        # Shortest and longest UTF-8 encoding of an emoji in the alphabet
+        lengths = {len(emoji.encode("utf-8")) for emoji in self._EMOJI_ALPHABET}
+        return min(lengths), max(lengths)
+
+    def encoded_length(self, size):
+        """Upper bound on the number of UTF-8 bytes ``size`` bytes encode to."""
+        return size * self._utf8_lengths[1]
+
+    def max_decoded_length(self, data):
+        """Upper bound on the number of bytes ``data`` decodes to, exact if it is a str."""
+        if isinstance(data, str):
+            return len(data)
+        return len(data) // self._utf8_lengths[0]
+
+    @_cached_attribute
+    def _delete_table(self):
+        # str.translate table that deletes every alphabet character
+        return str.maketrans("", "", self._EMOJI_ALPHABET)
+
+    @_cached_attribute
+    def _encode_table(self):
+        # str.translate table from each byte, read as a latin-1 character, to its emoji
+        return list(self._EMOJI_ALPHABET)
+
+    @_cached_attribute
+    def _decode_table(self):
+        # str.translate table from each emoji to its byte as a latin-1 character.
+        # Characters that are latin-1 themselves are mapped out of range, so that
+        # every non-alphabet character makes the final latin-1 encode fail
+        table = dict.fromkeys(range(256), _INVALID_CHAR)
+        table.update((ord(emoji), byte) for byte, emoji in enumerate(self._EMOJI_ALPHABET))
+        return table
 
     def encode(self, bytes_) -> bytes:
         """Encode bytes to emoji string.
@@ -223,19 +929,25 @@ class Base256EmojiConverter:
         :return: UTF-8 encoded emoji string
         :rtype: bytes
         """
-        bytes_ = ensure_bytes(bytes_)
-        result = []
-        for byte_val in bytes_:
-            result.append(self.byte_to_emoji[byte_val])
-        return "".join(result).encode("utf-8")
+        return self.encode_str(bytes_).encode("utf-8")
+
+    def encode_str(self, bytes_):
+        """Encode bytes to emoji string.
+
+        :param bytes_: Bytes to encode
+        :type bytes_: bytes or str
+        :return: emoji string
+        :rtype: str
+        """
+        return str(ensure_buffer(bytes_), "latin-1").translate(self._encode_table)
 
     def decode(self, bytes_) -> bytes:
         """Decode emoji string to bytes.
 
         Decodes character-by-character, matching the behavior of js-multiformats
         and go-multibase reference implementations. Each emoji in the alphabet
-        is a single Unicode code point, so we can safely iterate character by
-        character.
+        is a single Unicode code point, so every character is mapped to its byte
+        with a single :py:meth:`str.translate`.
 
         :param bytes_: UTF-8 encoded emoji string
         :type bytes_: bytes or str
@@ -243,22 +955,58 @@ class Base256EmojiConverter:
         :rtype: bytes
         :raises ValueError: if an invalid emoji character is encountered
         """
-        bytes_ = ensure_bytes(bytes_, "utf8")
         # Decode UTF-8 to get emoji string
-        emoji_str = bytes_.decode("utf-8")
-        result = bytearray()
-        # Iterate character by character (Python string iteration handles
-        # single code point emojis correctly, matching js-multiformats and go-multibase)
-        for char in emoji_str:
-            if char not in self.emoji_to_byte:
-                raise ValueError(f"Non-base256emoji character: {char}")
-            result.append(self.emoji_to_byte[char])
-        return bytes(result)
+        return self.decode_str(bytes_ if isinstance(bytes_, str) else str(ensure_buffer(bytes_), "utf-8"))
+
+    def decode_str(self, emoji_str):
+        """Decode emoji string to bytes.
+
+        :param emoji_str: emoji string
+        :type emoji_str: str
+        :return: Decoded bytes
+        :rtype: bytes
+        :raises ValueError: if an invalid emoji character is encountered
+        """
+        try:
+            return emoji_str.translate(self._decode_table).encode("latin-1")
+        except UnicodeEncodeError as e:
+            # translate() maps one character to one character, so positions line up
+            raise ValueError(f"Non-base256emoji character: {emoji_str[e.start]}") from None
+
+    def validate(self, bytes_):
+        """Check that ``bytes_`` is UTF-8 made only of alphabet emoji, without decoding it to bytes.
+
+        :param bytes_: UTF-8 encoded emoji string
+        :type bytes_: bytes
+        :raises ValueError: if the data is not valid UTF-8 or contains a non-alphabet character
+        """
+        invalid = str(ensure_buffer(bytes_), "utf-8").translate(self._delete_table)
+        if invalid:
+            raise ValueError(f"Non-base256emoji character: {invalid[0]}")
 
 
 class IdentityConverter:
+    group_bytes = 1
+    group_chars = 1
+    bits_per_char = 8
+
+    def encoded_length(self, size):
+        return size
+
+    def max_decoded_length(self, data):
+        return len(data.encode("utf-8")) if isinstance(data, str) else len(data)
+
     def encode(self, x):
-        return x
+        return as_bytes(x)
 
     def decode(self, x):
-        return x
+        return as_bytes(x)
+
+    def encode_str(self, x):
+        return str(ensure_buffer(x), "utf-8")
+
+    def decode_str(self, x):
+        return x.encode("utf-8")
+
+    def validate(self, x):
+        pass
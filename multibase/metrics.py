@@ -0,0 +1,211 @@
+"""Opt-in instrumentation of encoding and decoding calls.
+
+Once :py:func:`enable` has been called, :py:func:`multibase.encode`,
+:py:func:`multibase.decode` (and their ``_str`` and ``_into`` variants, which
+are counted as the same operation), :py:class:`multibase.Encoder` and
+:py:class:`multibase.Decoder` record, per operation and encoding:
+
+* the number of calls and the number of errors by exception class
+* the number of bytes in and out (str values are counted in characters)
+* the total time spent and a latency histogram
+* the number of :py:class:`multibase.CachingDecoder` calls answered from its
+  cache, which are not decoded and so not counted in any of the above
+
+:py:func:`snapshot` exports everything as a plain dict. While metrics are
+disabled, which is the default, every call pays for a single ``is not None``
+check.
+
+This module is not imported by ``import multibase``; use ``from multibase import metrics``.
+"""
+
+import bisect
+import threading
+import time
+
+from . import multibase as _multibase
+
+# Upper bounds, in seconds, of the latency histogram buckets; a last bucket
+# counts the calls slower than the largest bound
+LATENCY_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+# Key for the calls whose encoding could not be determined
+UNKNOWN_ENCODING = "unknown"
+
+
+def _size(data):
+    if isinstance(data, (str, bytes)):
+        return len(data)
+    try:
+        return memoryview(data).nbytes
+    except TypeError:
+        return 0
+
+
+def _encoding_name(encoding):
+    codec = _multibase.ENCODINGS_LOOKUP.get(encoding) if isinstance(encoding, (str, bytes)) else None
+    return UNKNOWN_ENCODING if codec is None else codec.encoding
+
+
+def _codec_name(data):
+    try:
+        return _multibase.get_codec(data).encoding
+    except Exception:
+        return UNKNOWN_ENCODING
+
+
+class _Recorder:
+    def __init__(self, latency_buckets, slow_call_seconds, on_slow_call):
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self.slow_call_seconds = slow_call_seconds
+        self.on_slow_call = on_slow_call
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def _empty_stats(self):
+        return {
+            "calls": 0,
+            "cache_hits": 0,
+            "errors": {},
+            "bytes_in": 0,
+            "bytes_out": 0,
+            "seconds": 0.0,
+            "latency": {"buckets": list(self.latency_buckets), "counts": [0] * (len(self.latency_buckets) + 1)},
+        }
+
+    def _stats_for(self, operation, encoding):
+        # Called with the lock held
+        stats = self._stats.get((operation, encoding))
+        if stats is None:
+            stats = self._stats[(operation, encoding)] = self._empty_stats()
+        return stats
+
+    def record(self, operation, encoding, seconds, bytes_in, bytes_out, error=None):
+        bucket = bisect.bisect_left(self.latency_buckets, seconds)
+        with self._lock:
+            stats = self._stats_for(operation, encoding)
+            stats["calls"] += 1
+            stats["bytes_in"] += bytes_in
+            stats["bytes_out"] += bytes_out
+            stats["seconds"] += seconds
+            stats["latency"]["counts"][bucket] += 1
+            if error is not None:
+                name = type(error).__name__
+                stats["errors"][name] = stats["errors"].get(name, 0) + 1
+        if self.on_slow_call is not None and seconds >= self.slow_call_seconds:
+            self.on_slow_call(operation, encoding, seconds, bytes_in)
+
+    def record_cache_hit(self, encoding):
+        with self._lock:
+            self._stats_for("decode", encoding)["cache_hits"] += 1
+
+    def observe_encode(self, func, encoding, data):
+        start = time.perf_counter()
+        try:
+            result = func(encoding, data)
+        except Exception as e:
+            self.record("encode", _encoding_name(encoding), time.perf_counter() - start, _size(data), 0, e)
+            raise
+        self.record("encode", _encoding_name(encoding), time.perf_counter() - start, _size(data), len(result))
+        return result
+
+    def observe_decode(self, func, data, return_encoding):
+        start = time.perf_counter()
+        try:
+            encoding, result = func(data, True)
+        except Exception as e:
+            self.record("decode", _codec_name(data), time.perf_counter() - start, _size(data), 0, e)
+            raise
+        self.record("decode", encoding, time.perf_counter() - start, _size(data), len(result))
+        return (encoding, result) if return_encoding else result
+
+    def observe_encode_into(self, func, encoding, out, data):
+        start = time.perf_counter()
+        try:
+            written = func(out, data)
+        except Exception as e:
+            self.record("encode", _encoding_name(encoding), time.perf_counter() - start, _size(data), 0, e)
+            raise
+        self.record("encode", _encoding_name(encoding), time.perf_counter() - start, _size(data), written)
+        return written
+
+    def observe_decode_into(self, func, out, data, return_encoding):
+        start = time.perf_counter()
+        try:
+            encoding, written = func(out, data, True)
+        except Exception as e:
+            self.record("decode", _codec_name(data), time.perf_counter() - start, _size(data), 0, e)
+            raise
+        self.record("decode", encoding, time.perf_counter() - start, _size(data), written)
+        return (encoding, written) if return_encoding else written
+
+    def snapshot(self):
+        result = {}
+        with self._lock:
+            for operation in ("encode", "decode"):
+                result[operation] = {codec.encoding: self._empty_stats() for codec in _multibase.ENCODINGS}
+            for (operation, encoding), stats in self._stats.items():
+                result[operation][encoding] = {
+                    **stats,
+                    "errors": dict(stats["errors"]),
+                    "latency": {"buckets": list(self.latency_buckets), "counts": list(stats["latency"]["counts"])},
+                }
+        return result
+
+
+def enable(latency_buckets=LATENCY_BUCKETS, slow_call_seconds=None, on_slow_call=None):
+    """
+    Start recording metrics, discarding any recorded so far
+
+    :param latency_buckets: upper bounds of the latency histogram buckets, in seconds
+    :type latency_buckets: iterable of float
+    :param slow_call_seconds: calls taking at least this many seconds are passed to ``on_slow_call``
+    :type slow_call_seconds: float
+    :param on_slow_call: called as ``on_slow_call(operation, encoding, seconds, bytes_in)`` after
+        every slow call, in the thread that made it
+    :type on_slow_call: callable
+    :raises ValueError: if only one of ``slow_call_seconds`` and ``on_slow_call`` is given
+    """
+    if (slow_call_seconds is None) != (on_slow_call is None):
+        raise ValueError("slow_call_seconds and on_slow_call must be given together")
+    _multibase._metrics = _Recorder(latency_buckets, slow_call_seconds, on_slow_call)
+
+
+def disable():
+    """Stop recording metrics and discard the ones recorded so far."""
+    _multibase._metrics = None
+
+
+def is_enabled():
+    """
+    Check if metrics are being recorded.
+
+    :rtype: bool
+    """
+    return _multibase._metrics is not None
+
+
+def reset():
+    """Discard the metrics recorded so far, keeping them enabled if they are."""
+    recorder = _multibase._metrics
+    if recorder is not None:
+        enable(recorder.latency_buckets, recorder.slow_call_seconds, recorder.on_slow_call)
+
+
+def snapshot():
+    """
+    Export the metrics recorded so far
+
+    The result maps ``"encode"`` and ``"decode"`` to a dict keyed by encoding name
+    (every encoding in :py:data:`multibase.ENCODINGS`, plus ``"unknown"`` for calls
+    whose encoding could not be determined). Each value is a dict with ``calls``,
+    ``cache_hits``, ``errors`` (counts by exception class name), ``bytes_in``,
+    ``bytes_out``, ``seconds`` and ``latency``, whose ``counts`` has one entry per
+    bound in ``buckets`` plus one for slower calls.
+
+    :return: the metrics, or an empty dict if metrics are disabled
+    :rtype: dict
+    """
+    recorder = _multibase._metrics
+    if recorder is None:
+        return {}
+    return recorder.snapshot()
@@ -1,14 +1,17 @@
-from collections import namedtuple
-
-from morphys import ensure_bytes
+from collections import OrderedDict, namedtuple
 
 from .converters import (
     Base16StringConverter,
     Base32StringConverter,
+    Base58StringConverter,
     Base64StringConverter,
     Base256EmojiConverter,
+    BaseByteStringConverter,
     BaseStringConverter,
     IdentityConverter,
+    as_bytes,
+    ensure_buffer,
+    output_view,
 )
 from .exceptions import (
     DecodingError,
@@ -16,12 +19,41 @@ from .exceptions import (
     UnsupportedEncodingError,
 )
 
-Encoding = namedtuple("Encoding", "encoding,code,converter")
+
+class Encoding(namedtuple("Encoding", "encoding,code,converter")):
+    """
+    A supported encoding: its name, its multibase prefix and its converter
+
+    The converter's layout is exposed as well: ``bits_per_char`` (fractional for the
+    bases that are not a power of two), ``group_bytes`` and ``group_chars`` (the number
+    of bytes converted together and the number of characters they map to, None where
+    the output depends on the whole input) and ``padded``.
+    """
+
+    __slots__ = ()
+
+    @property
+    def bits_per_char(self):
+        return self.converter.bits_per_char
+
+    @property
+    def group_bytes(self):
+        return getattr(self.converter, "group_bytes", None)
+
+    @property
+    def group_chars(self):
+        return getattr(self.converter, "group_chars", None)
+
+    @property
+    def padded(self):
+        return getattr(self.converter, "pad", False)
+
+
 CODE_LENGTH = 1
 ENCODINGS = [
     Encoding("identity", b"\x00", IdentityConverter()),
-    Encoding("base2", b"0", BaseStringConverter("01")),
-    Encoding("base8", b"7", BaseStringConverter("01234567")),
+    Encoding("base2", b"0", BaseByteStringConverter("01")),
+    Encoding("base8", b"7", BaseByteStringConverter("01234567")),
     Encoding("base10", b"9", BaseStringConverter("0123456789")),
     Encoding("base16", b"f", Base16StringConverter("0123456789abcdef")),
     Encoding("base16upper", b"F", Base16StringConverter("0123456789ABCDEF")),
@@ -36,8 +68,8 @@ ENCODINGS = [
     Encoding("base32z", b"h", BaseStringConverter("ybndrfg8ejkmcpqxot1uwisza345h769")),
     Encoding("base36", b"k", BaseStringConverter("0123456789abcdefghijklmnopqrstuvwxyz")),
     Encoding("base36upper", b"K", BaseStringConverter("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ")),
-    Encoding("base58flickr", b"Z", BaseStringConverter("123456789abcdefghijkmnopqrstuvwxyzABCDEFGHJKLMNPQRSTUVWXYZ")),
-    Encoding("base58btc", b"z", BaseStringConverter("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")),
+    Encoding("base58flickr", b"Z", Base58StringConverter("123456789abcdefghijkmnopqrstuvwxyzABCDEFGHJKLMNPQRSTUVWXYZ")),
+    Encoding("base58btc", b"z", Base58StringConverter("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")),
     Encoding("base64", b"m", Base64StringConverter("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")),
     Encoding(
         "base64pad",
@@ -57,10 +89,23 @@ ENCODINGS = [
     Encoding("base256emoji", "🚀".encode(), Base256EmojiConverter()),
 ]
 
+# ENCODINGS and the lookups are built at import and never modified afterwards, and
+# the converters keep no per-call state (only caches that any thread fills in with
+# the same values), so all of them can be shared between threads, free-threaded
+# builds included
 ENCODINGS_LOOKUP = {}
+# Codecs keyed by their code as a (single character) str, for decode_str()
+_CODE_STR_LOOKUP = {}
 for codec in ENCODINGS:
     ENCODINGS_LOOKUP[codec.encoding] = codec
     ENCODINGS_LOOKUP[codec.code] = codec
+    _CODE_STR_LOOKUP[codec.code.decode("utf-8")] = codec
+
+# The active multibase.metrics recorder, None while metrics are disabled
+_metrics = None
+
+# transcode() translation tables keyed by (source, target) encoding, None where the layouts differ
+_TRANSCODE_TABLES: dict[tuple[str, str], bytes | None] = {}
 
 
 def encode(encoding, data):
@@ -69,60 +114,119 @@ def encode(encoding, data):
 
     :param str encoding: encoding to use, should be one of the supported encoding
     :param data: data to encode
-    :type data: str or bytes
+    :type data: str or bytes-like object
     :return: multibase encoded data
     :rtype: bytes
     :raises UnsupportedEncodingError: if the encoding is not supported
     """
-    data = ensure_bytes(data, "utf8")
+    if _metrics is not None:
+        return _metrics.observe_encode(_encode, encoding, data)
+    return _encode(encoding, data)
+
+
+def _encode(encoding, data):
+    data = ensure_buffer(data)
     try:
         return ENCODINGS_LOOKUP[encoding].code + ENCODINGS_LOOKUP[encoding].converter.encode(data)
     except KeyError:
         raise UnsupportedEncodingError(f"Encoding {encoding} not supported.")
 
 
+def encode_str(encoding, data):
+    """
+    Encodes the given data using the encoding that is specified, returning a str
+
+    Equivalent to ``encode(encoding, data).decode()``, but the converters build the
+    str directly instead of going through bytes.
+
+    :param str encoding: encoding to use, should be one of the supported encoding
+    :param data: data to encode
+    :type data: str or bytes-like object
+    :return: multibase encoded data
+    :rtype: str
+    :raises UnsupportedEncodingError: if the encoding is not supported
+    """
+    if _metrics is not None:
+        return _metrics.observe_encode(_encode_str, encoding, data)
+    return _encode_str(encoding, data)
+
+
+def _encode_str(encoding, data):
+    data = ensure_buffer(data)
+    try:
+        codec = ENCODINGS_LOOKUP[encoding]
+    except KeyError:
+        raise UnsupportedEncodingError(f"Encoding {encoding} not supported.")
+    return codec.code.decode("utf-8") + codec.converter.encode_str(data)
+
+
 def get_codec(data):
     """
     Returns the codec used to encode the given data
 
     :param data: multibase encoded data
-    :type data: str or bytes
+    :type data: str or bytes-like object
     :return: the :py:obj:`multibase.Encoding` object for the data's codec
     :raises InvalidMultibaseStringError: if the codec is not supported
     """
-    data = ensure_bytes(data, "utf8")
+    data = ensure_buffer(data)
     # Check for base256emoji first (4-byte UTF-8 prefix)
     if len(data) >= 4:
-        emoji_prefix = data[:4]
+        emoji_prefix = bytes(data[:4])
         if emoji_prefix in ENCODINGS_LOOKUP:
             return ENCODINGS_LOOKUP[emoji_prefix]
 
     # Check for single-byte prefixes
     try:
-        key = data[:CODE_LENGTH]
+        key = bytes(data[:CODE_LENGTH])
         codec = ENCODINGS_LOOKUP[key]
     except KeyError:
-        raise InvalidMultibaseStringError(f"Can not determine encoding for {data}")
+        raise InvalidMultibaseStringError(f"Can not determine encoding for {as_bytes(data)}")
     else:
         return codec
 
 
-def is_encoded(data):
+def is_encoded(data, strict=False):
     """
     Checks if the given data is encoded or not
 
     :param data: multibase encoded data
     :type data: str or bytes
+    :param strict: if True, check the whole payload with :py:func:`validate` instead of only the prefix
+    :type strict: bool
     :return: if the data is encoded or not
     :rtype: bool
     """
     try:
-        get_codec(data)
+        if strict:
+            validate(data)
+        else:
+            get_codec(data)
         return True
     except (ValueError, InvalidMultibaseStringError):
         return False
 
 
+def validate(data):
+    """
+    Checks that the given data is a well-formed multibase string, without decoding it
+
+    The payload is checked against the alphabet, padding and length rules of its encoding.
+
+    :param data: multibase encoded data
+    :type data: str or bytes
+    :return: the :py:obj:`multibase.Encoding` object for the data's codec
+    :raises InvalidMultibaseStringError: if the codec is not supported or the payload is invalid
+    """
+    data = ensure_buffer(data)
+    codec = get_codec(data)
+    try:
+        codec.converter.validate(data[len(codec.code) :])
+    except ValueError as e:
+        raise InvalidMultibaseStringError(f"Invalid {codec.encoding} data: {e}") from e
+    return codec
+
+
 def is_encoding_supported(encoding):
     """
     Check if an encoding is supported.
@@ -160,12 +264,167 @@ def get_encoding_info(encoding):
     return ENCODINGS_LOOKUP[encoding]
 
 
+def encoded_length(encoding, size):
+    """
+    Returns the length of ``size`` bytes multibase encoded with ``encoding``, prefix included
+
+    The length is exact for identity and the power-of-two bases (base2, base8, base16,
+    base32 and base64 and their variants). For the other bases it is an upper bound, reached
+    when every byte is 0xff and approached when the top byte is non-zero. Smaller values
+    encode to fewer characters: in base10 and base36 leading zero bytes take no characters
+    at all (``b"\\0" * 33 + b"\\1"`` is 2 bytes in base10, against a bound of 83), and in
+    base58 one each (``b"\\0" * 34`` is 35 bytes in base58btc, against 48). For base256emoji
+    it is an upper bound that assumes every emoji takes 4 bytes in UTF-8.
+
+    :param str encoding: encoding to use, should be one of the supported encodings
+    :param int size: number of bytes to encode
+    :return: length of the encoded data, in bytes
+    :rtype: int
+    :raises UnsupportedEncodingError: if the encoding is not supported
+    :raises ValueError: if ``size`` is negative
+    """
+    codec = get_encoding_info(encoding)
+    if size < 0:
+        raise ValueError(f"Size must not be negative, got {size}")
+    return len(codec.code) + codec.converter.encoded_length(size)
+
+
+def max_decoded_length(data):
+    """
+    Returns the largest number of bytes the multibase encoded data can decode to, without decoding it
+
+    The length is exact for valid data in identity and the power-of-two bases, and for
+    base256emoji given as a str. Otherwise it is an upper bound.
+
+    :param data: multibase encoded data
+    :type data: str or bytes-like object
+    :return: upper bound on the length of the decoded data
+    :rtype: int
+    :raises InvalidMultibaseStringError: if the data is not multibase encoded
+    """
+    if isinstance(data, str):
+        codec = _CODE_STR_LOOKUP.get(data[:1])
+        if codec is None:
+            raise InvalidMultibaseStringError(f"Can not determine encoding for {data!r}")
+        return codec.converter.max_decoded_length(data[1:])
+    data = ensure_buffer(data)
+    codec = get_codec(data)
+    return codec.converter.max_decoded_length(memoryview(data)[len(codec.code) :])
+
+
+def encode_shortest(data, candidates=None):
+    """
+    Encodes the given data with whichever of the candidate encodings gives the shortest output
+
+    The candidates are compared with :py:func:`encoded_length`, so the data is only
+    encoded once. Ties go to the candidate listed first.
+
+    :param data: data to encode
+    :type data: str or bytes-like object
+    :param candidates: names of the encodings to choose from, defaults to every supported
+        encoding except identity
+    :type candidates: iterable of str
+    :return: multibase encoded data
+    :rtype: bytes
+    :raises UnsupportedEncodingError: if a candidate is not supported
+    :raises ValueError: if there are no candidates
+    """
+    data = ensure_buffer(data)
+    if candidates is None:
+        candidates = [codec.encoding for codec in ENCODINGS if codec.encoding != "identity"]
+    candidates = list(candidates)
+    if not candidates:
+        raise ValueError("No candidate encodings given")
+    size = len(data)
+    encoding = min(candidates, key=lambda candidate: encoded_length(candidate, size))
+    return encode(encoding, data)
+
+
+def transcode(data, to_encoding):
+    """
+    Re-encodes the multibase encoded data with another encoding
+
+    Between encodings with the same bit layout (base16 and base16upper, the base32
+    variants, the base64 variants, padded or not) the characters are mapped straight
+    to the target alphabet and the padding adjusted, without decoding the data. Other
+    pairs go through :py:func:`decode` and :py:func:`encode`. The result is the same
+    either way.
+
+    :param data: multibase encoded data
+    :type data: str or bytes-like object
+    :param str to_encoding: encoding to convert to, should be one of the supported encodings
+    :return: the data multibase encoded with ``to_encoding``
+    :rtype: bytes
+    :raises UnsupportedEncodingError: if the target encoding is not supported
+    :raises InvalidMultibaseStringError: if the data is not multibase encoded
+    :raises DecodingError: if decoding fails
+    """
+    target = get_encoding_info(to_encoding)
+    data = ensure_buffer(data)
+    source = get_codec(data)
+    table = _transcode_table(source, target)
+    if table is not None:
+        transcoded = _translate(source.converter, target.converter, table, as_bytes(data[len(source.code) :]))
+        if transcoded is not None:
+            return target.code + transcoded
+    return encode(to_encoding, decode(data))
+
+
+def _transcode_table(source, target):
+    """Return the translate table from ``source``'s alphabet to ``target``'s, or None if their layouts differ."""
+    key = (source.encoding, target.encoding)
+    try:
+        return _TRANSCODE_TABLES[key]
+    except KeyError:
+        pass
+    layouts = (Base16StringConverter, BaseByteStringConverter)
+    table = None
+    src, dst = source.converter, target.converter
+    if isinstance(src, layouts) and isinstance(dst, layouts) and src.bits_per_char == dst.bits_per_char:
+        table = bytearray(range(256))
+        digits = src.digits
+        if isinstance(src, Base16StringConverter):
+            # base16 decoding is case-insensitive
+            digits += digits.swapcase()
+        for char, digit in zip(digits, dst.digits * 2):
+            table[ord(char)] = ord(digit)
+        table = bytes(table)
+    _TRANSCODE_TABLES[key] = table
+    return table
+
+
+def _translate(src, dst, table, chars):
+    """Map the encoded ``chars`` from ``src``'s alphabet to ``dst``'s, or return None to leave errors to decode()."""
+    if getattr(src, "pad", False):
+        chars = chars.rstrip(b"=")
+    if chars.translate(None, src._alphabet):
+        return None
+    if isinstance(src, Base16StringConverter):
+        if len(chars) % 2:
+            return None
+    else:
+        # Keep only the characters decode() uses, with the bits past the last byte cleared
+        # like encode() leaves them
+        size = len(chars) * src.bits // 8
+        keep = -(-size * 8 // src.bits)
+        extra = keep * src.bits - size * 8
+        if not keep:
+            chars = b""
+        elif keep < len(chars) or extra:
+            last = src._decode_table[chars[keep - 1]] & -(1 << extra)
+            chars = chars[: keep - 1] + src.digits[last].encode("ascii")
+    translated = chars.translate(table)
+    if getattr(dst, "pad", False) and len(chars) % dst.group_chars:
+        translated += b"=" * (dst.group_chars - len(chars) % dst.group_chars)
+    return translated
+
+
 def decode(data, return_encoding=False):
     """
     Decode the multibase decoded data
 
     :param data: multibase encoded data
-    :type data: str or bytes
+    :type data: str or bytes-like object
     :param return_encoding: if True, return tuple (encoding, decoded_data)
     :type return_encoding: bool
     :return: decoded data, or tuple (encoding, decoded_data) if return_encoding=True
@@ -173,9 +432,22 @@ def decode(data, return_encoding=False):
     :raises InvalidMultibaseStringError: if the data is not multibase encoded
     :raises DecodingError: if decoding fails
     """
-    data = ensure_bytes(data, "utf8")
+    if _metrics is not None:
+        return _metrics.observe_decode(_decode, data, return_encoding)
+    return _decode(data, return_encoding)
+
+
+def _accepted_codec(codec, codecs):
+    """Return ``codec``, or raise if it is not in the ``codecs`` prefix table (None accepts every codec)."""
+    if codecs is not None and codec.code not in codecs:
+        raise InvalidMultibaseStringError(f"Encoding {codec.encoding} is not accepted by this decoder")
+    return codec
+
+
+def _decode(data, return_encoding, codecs=None):
+    data = ensure_buffer(data)
     try:
-        codec = get_codec(data)
+        codec = _accepted_codec(get_codec(data), codecs)
         # Handle base256emoji which has a 4-byte prefix
         prefix_length = len(codec.code)
         decoded = codec.converter.decode(data[prefix_length:])
@@ -192,6 +464,195 @@ def decode(data, return_encoding=False):
         raise DecodingError(f"Failed to decode multibase data: {e}") from e
 
 
+def decode_str(data, return_encoding=False):
+    """
+    Decode the multibase encoded str
+
+    The prefix is looked up straight from the str and the payload is handed to the
+    converter as a str, so it is never UTF-8 encoded as a whole. Other inputs are
+    passed on to :py:func:`decode`.
+
+    :param data: multibase encoded data
+    :type data: str
+    :param return_encoding: if True, return tuple (encoding, decoded_data)
+    :type return_encoding: bool
+    :return: decoded data, or tuple (encoding, decoded_data) if return_encoding=True
+    :rtype: bytes or tuple
+    :raises InvalidMultibaseStringError: if the data is not multibase encoded
+    :raises DecodingError: if decoding fails
+    """
+    if _metrics is not None:
+        return _metrics.observe_decode(_decode_str, data, return_encoding)
+    return _decode_str(data, return_encoding)
+
+
+def _decode_str(data, return_encoding, codecs=None):
+    if not isinstance(data, str):
+        return _decode(data, return_encoding, codecs)
+    # Every code, base256emoji's included, is a single character
+    codec = _CODE_STR_LOOKUP.get(data[:1])
+    if codec is None:
+        raise InvalidMultibaseStringError(f"Can not determine encoding for {data!r}")
+    _accepted_codec(codec, codecs)
+    try:
+        decoded = codec.converter.decode_str(data[1:])
+    except Exception as e:
+        raise DecodingError(f"Failed to decode multibase data: {e}") from e
+    if return_encoding:
+        return (codec.encoding, decoded)
+    return decoded
+
+
+def _write_into(out, offset, converter_into, converter_convert, data):
+    """Convert ``data`` into ``out`` from ``offset`` on, returning the end offset."""
+    view = memoryview(out).cast("B")[offset:]
+    if converter_into is not None:
+        return offset + converter_into(view, data)
+    converted = converter_convert(data)
+    output_view(view, len(converted))[:] = converted
+    return offset + len(converted)
+
+
+def decode_into(out, data, return_encoding=False):
+    """
+    Decode the multibase encoded data into a preallocated writable buffer
+
+    :param out: writable buffer (e.g. a bytearray or memoryview) to write the decoded data to
+    :param data: multibase encoded data
+    :type data: str or bytes-like object
+    :param return_encoding: if True, return tuple (encoding, bytes_written)
+    :type return_encoding: bool
+    :return: number of bytes written, or tuple (encoding, bytes_written) if return_encoding=True
+    :rtype: int or tuple
+    :raises InvalidMultibaseStringError: if the data is not multibase encoded
+    :raises DecodingError: if decoding fails, including when ``out`` is too small
+    """
+    if _metrics is not None:
+        return _metrics.observe_decode_into(_decode_into, out, data, return_encoding)
+    return _decode_into(out, data, return_encoding)
+
+
+def _decode_into(out, data, return_encoding, codecs=None):
+    data = ensure_buffer(data)
+    codec = _accepted_codec(get_codec(data), codecs)
+    converter = codec.converter
+    try:
+        written = _write_into(
+            out, 0, getattr(converter, "decode_into", None), converter.decode, data[len(codec.code) :]
+        )
+    except Exception as e:
+        raise DecodingError(f"Failed to decode multibase data: {e}") from e
+    if return_encoding:
+        return (codec.encoding, written)
+    return written
+
+
+def encode_many(encoding, items, return_exceptions=False):
+    """
+    Encodes each of the given items using the encoding that is specified
+
+    :param str encoding: encoding to use, should be one of the supported encoding
+    :param items: iterable of data to encode
+    :type items: iterable of str or bytes
+    :param return_exceptions: if True, an item that fails to encode gets the exception in its
+        place in the result instead of aborting the whole batch
+    :type return_exceptions: bool
+    :return: multibase encoded data, in the same order as ``items``
+    :rtype: list
+    :raises UnsupportedEncodingError: if the encoding is not supported
+    """
+    codec = get_encoding_info(encoding)
+    code, converter = codec.code, codec.converter
+    items = [as_bytes(item) for item in items]
+    if hasattr(converter, "encode_many"):
+        # Converters that can process a whole batch in one pass
+        try:
+            return [code + encoded for encoded in converter.encode_many(items)]
+        except Exception:
+            # Fall back to one item at a time to find the culprit
+            pass
+
+    results = []
+    converter_encode = converter.encode
+    for item in items:
+        try:
+            results.append(code + converter_encode(item))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
+
+def decode_many(items, return_encoding=False, return_exceptions=False):
+    """
+    Decodes each of the given multibase encoded items
+
+    Items are bucketed by codec first, so each converter runs over all of its items
+    in one go, and the results are put back in input order.
+
+    :param items: iterable of multibase encoded data, possibly in different encodings
+    :type items: iterable of str or bytes
+    :param return_encoding: if True, each result is a tuple (encoding, decoded_data)
+    :type return_encoding: bool
+    :param return_exceptions: if True, an item that fails to decode gets the
+        :py:exc:`InvalidMultibaseStringError` or :py:exc:`DecodingError` in its place in the
+        result instead of aborting the whole batch
+    :type return_exceptions: bool
+    :return: decoded data, in the same order as ``items``
+    :rtype: list
+    :raises InvalidMultibaseStringError: if an item is not multibase encoded
+    :raises DecodingError: if decoding an item fails
+    """
+    results = []
+    buckets = {}
+    for index, item in enumerate(items):
+        data = as_bytes(item)
+        # The same lookups as get_codec(), without the per-call overhead
+        codec = ENCODINGS_LOOKUP.get(data[:4]) if data[:1] == b"\xf0" else None
+        if codec is None:
+            codec = ENCODINGS_LOOKUP.get(data[:CODE_LENGTH])
+        if codec is None:
+            error = InvalidMultibaseStringError(f"Can not determine encoding for {data}")
+            if not return_exceptions:
+                raise error
+            results.append(error)
+            continue
+        results.append(None)
+        bucket = buckets.get(codec)
+        if bucket is None:
+            bucket = buckets[codec] = []
+        bucket.append((index, data))
+
+    for codec, bucket in buckets.items():
+        encoding, prefix_length, converter = codec.encoding, len(codec.code), codec.converter
+        if hasattr(converter, "decode_many"):
+            # Converters that can process a whole bucket in one pass
+            try:
+                decoded_items = converter.decode_many([data[prefix_length:] for _, data in bucket])
+            except Exception:
+                # Fall back to one item at a time to find the culprit
+                pass
+            else:
+                for (index, _), decoded in zip(bucket, decoded_items):
+                    results[index] = (encoding, decoded) if return_encoding else decoded
+                continue
+
+        converter_decode = converter.decode
+        for index, data in bucket:
+            try:
+                decoded = converter_decode(data[prefix_length:])
+            except Exception as e:
+                error = DecodingError(f"Failed to decode multibase data: {e}")
+                error.__cause__ = e
+                if not return_exceptions:
+                    raise error
+                results[index] = error
+                continue
+            results[index] = (encoding, decoded) if return_encoding else decoded
+    return results
+
+
 class Encoder:
     """Reusable encoder for a specific encoding."""
 
@@ -213,20 +674,91 @@ class Encoder:
         Encode data using this encoder's encoding.
 
         :param data: data to encode
-        :type data: str or bytes
+        :type data: str or bytes-like object
         :return: multibase encoded data
         :rtype: bytes
         """
-        data = ensure_bytes(data, "utf8")
+        if _metrics is not None:
+            return _metrics.observe_encode(_encode, self.encoding, data)
+        data = ensure_buffer(data)
         return self._codec.code + self._codec.converter.encode(data)
 
+    def encode_str(self, data):
+        """
+        Encode data using this encoder's encoding, returning a str.
+
+        :param data: data to encode
+        :type data: str or bytes-like object
+        :return: multibase encoded data
+        :rtype: str
+        """
+        if _metrics is not None:
+            return _metrics.observe_encode(_encode_str, self.encoding, data)
+        data = ensure_buffer(data)
+        return self._codec.code.decode("utf-8") + self._codec.converter.encode_str(data)
+
+    def encode_into(self, out, data):
+        """
+        Encode data into a preallocated writable buffer, prefix included.
+
+        :param out: writable buffer (e.g. a bytearray or memoryview) to write the encoded data to
+        :param data: data to encode
+        :type data: str or bytes-like object
+        :return: number of bytes written
+        :rtype: int
+        :raises ValueError: if ``out`` is too small
+        """
+        if _metrics is not None:
+            return _metrics.observe_encode_into(self._encode_into, self.encoding, out, data)
+        return self._encode_into(out, data)
+
+    def _encode_into(self, out, data):
+        data = ensure_buffer(data)
+        code, converter = self._codec.code, self._codec.converter
+        encode_into = getattr(converter, "encode_into", None)
+        if encode_into is None:
+            encoded = converter.encode(data)
+            output_view(out, len(code) + len(encoded))[:] = code + encoded
+            return len(code) + len(encoded)
+        # The converters that encode in place know their exact output length, so check it before writing anything
+        view = output_view(out, len(code) + converter.encoded_length(len(data)))
+        view[: len(code)] = code
+        return len(code) + encode_into(view[len(code) :], data)
+
 
 class Decoder:
-    """Reusable decoder for multibase data."""
+    """Reusable decoder for multibase data.
 
-    def __init__(self):
-        """Initialize a decoder."""
-        pass
+    A decoder can be restricted to a subset of the encodings, in which case data in
+    any other encoding is rejected from its prefix, before any conversion work.
+    """
+
+    def __init__(self, encodings=None):
+        """
+        Initialize a decoder.
+
+        :param encodings: the encodings to accept, defaults to all supported encodings
+        :type encodings: iterable of str
+        :raises UnsupportedEncodingError: if an encoding is not supported
+        """
+        # Prefix table of the accepted codecs, None if every codec is accepted
+        self._codecs = None
+        if encodings is not None:
+            self._codecs = {}
+            for encoding in encodings:
+                codec = get_encoding_info(encoding)
+                self._codecs[codec.code] = codec
+
+    @property
+    def encodings(self):
+        """
+        The names of the encodings this decoder accepts.
+
+        :rtype: list
+        """
+        if self._codecs is None:
+            return list_encodings()
+        return [codec.encoding for codec in self._codecs.values()]
 
     def decode(self, data, return_encoding=False):
         """
@@ -238,10 +770,60 @@ class Decoder:
         :type return_encoding: bool
         :return: decoded data, or tuple (encoding, decoded_data) if return_encoding=True
         :rtype: bytes or tuple
-        :raises InvalidMultibaseStringError: if the data is not multibase encoded
+        :raises InvalidMultibaseStringError: if the data is not multibase encoded or not in an accepted encoding
         :raises DecodingError: if decoding fails
         """
-        return decode(data, return_encoding=return_encoding)
+        if self._codecs is None:
+            return decode(data, return_encoding=return_encoding)
+        if _metrics is not None:
+            return _metrics.observe_decode(self._decode, data, return_encoding)
+        return _decode(data, return_encoding, self._codecs)
+
+    def _decode(self, data, return_encoding):
+        return _decode(data, return_encoding, self._codecs)
+
+    def _decode_str(self, data, return_encoding):
+        return _decode_str(data, return_encoding, self._codecs)
+
+    def decode_str(self, data, return_encoding=False):
+        """
+        Decode a multibase encoded str.
+
+        :param data: multibase encoded data
+        :type data: str
+        :param return_encoding: if True, return tuple (encoding, decoded_data)
+        :type return_encoding: bool
+        :return: decoded data, or tuple (encoding, decoded_data) if return_encoding=True
+        :rtype: bytes or tuple
+        :raises InvalidMultibaseStringError: if the data is not multibase encoded or not in an accepted encoding
+        :raises DecodingError: if decoding fails
+        """
+        if self._codecs is None:
+            return decode_str(data, return_encoding=return_encoding)
+        if _metrics is not None:
+            return _metrics.observe_decode(self._decode_str, data, return_encoding)
+        return _decode_str(data, return_encoding, self._codecs)
+
+    def decode_into(self, out, data, return_encoding=False):
+        """
+        Decode multibase encoded data into a preallocated writable buffer.
+
+        :param out: writable buffer (e.g. a bytearray or memoryview) to write the decoded data to
+        :param data: multibase encoded data
+        :type data: str or bytes-like object
+        :param return_encoding: if True, return tuple (encoding, bytes_written)
+        :type return_encoding: bool
+        :return: number of bytes written, or tuple (encoding, bytes_written) if return_encoding=True
+        :rtype: int or tuple
+        :raises InvalidMultibaseStringError: if the data is not multibase encoded or not in an accepted encoding
+        :raises DecodingError: if decoding fails, including when ``out`` is too small
+        """
+        if _metrics is not None:
+            return _metrics.observe_decode_into(self._decode_into, out, data, return_encoding)
+        return _decode_into(out, data, return_encoding, self._codecs)
+
+    def _decode_into(self, out, data, return_encoding):
+        return _decode_into(out, data, return_encoding, self._codecs)
 
     def or_(self, other_decoder):
         """
@@ -257,8 +839,160 @@ class Decoder:
         return ComposedDecoder([self, other_decoder])
 
 
+def _merged_codecs(decoders):
+    """Merge the prefix tables of ``decoders`` into one, returning False if they can't be merged.
+
+    Only plain :py:class:`Decoder` objects (and composed decoders made of them) can
+    be merged, since any other decoder may do more than look up the prefix. The
+    merged table is None if one of the decoders accepts every codec.
+    """
+    merged = {}
+    for decoder in decoders:
+        if type(decoder) is Decoder:
+            codecs = decoder._codecs
+        elif type(decoder) is ComposedDecoder and decoder._dispatch is not None:
+            codecs = decoder._dispatch._codecs
+        else:
+            return False
+        if codecs is None:
+            return None
+        for code, codec in codecs.items():
+            merged.setdefault(code, codec)
+    return merged
+
+
+CacheInfo = namedtuple("CacheInfo", "hits,misses,evictions,entries,size")
+
+
+class CachingDecoder(Decoder):
+    """Decoder that keeps the most recently decoded inputs in a bounded LRU cache.
+
+    Useful when the same identifiers are decoded over and over. Inputs are cached
+    by their bytes, so ``"zfoo"`` and ``b"zfoo"`` share an entry; failed decodes are
+    not cached. Cached results are immutable bytes and the cache can be shared
+    between threads.
+    """
+
+    def __init__(self, max_entries=4096, max_bytes=16 * 1024 * 1024, max_input_size=1024, encodings=None):
+        """
+        Initialize a caching decoder.
+
+        :param max_entries: maximum number of cached inputs
+        :type max_entries: int
+        :param max_bytes: maximum total size of the cached inputs and their decoded data
+        :type max_bytes: int
+        :param max_input_size: inputs longer than this are decoded without being cached
+        :type max_input_size: int
+        :param encodings: the encodings to accept, defaults to all supported encodings
+        :type encodings: iterable of str
+        :raises UnsupportedEncodingError: if an encoding is not supported
+        """
+        # threading is only imported once a cache is made, to keep it off the import path
+        import threading
+
+        super().__init__(encodings)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_input_size = max_input_size
+        self._cache = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def _cached(self, decode_function, data, return_encoding):
+        key = data if isinstance(data, (str, bytes)) else ensure_buffer(data)
+        if len(key) > self.max_input_size:
+            return decode_function(data, return_encoding=return_encoding)
+        # Key on bytes: str and bytes inputs share entries, and other buffers can't
+        # be keys (and may change after being cached)
+        key = as_bytes(key)
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if entry is None:
+            # Decode outside the lock, so a slow decode doesn't hold up other threads
+            entry = decode_function(key, return_encoding=True)
+            self._store(key, entry)
+        elif _metrics is not None:
+            # Misses are recorded by the decode above, hits only as hits
+            _metrics.record_cache_hit(entry[0])
+        return entry if return_encoding else entry[1]
+
+    def _store(self, key, entry):
+        size = len(key) + len(entry[1])
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._cache:
+                # Another thread decoded the same input in the meantime
+                return
+            self._cache[key] = entry
+            self._size += size
+            while len(self._cache) > self.max_entries or self._size > self.max_bytes:
+                old_key, (_, old_decoded) = self._cache.popitem(last=False)
+                self._size -= len(old_key) + len(old_decoded)
+                self._evictions += 1
+
+    def decode(self, data, return_encoding=False):
+        """
+        Decode multibase encoded data, from the cache if it was decoded before.
+
+        :param data: multibase encoded data
+        :type data: str or bytes
+        :param return_encoding: if True, return tuple (encoding, decoded_data)
+        :type return_encoding: bool
+        :return: decoded data, or tuple (encoding, decoded_data) if return_encoding=True
+        :rtype: bytes or tuple
+        :raises InvalidMultibaseStringError: if the data is not multibase encoded
+        :raises DecodingError: if decoding fails
+        """
+        return self._cached(super().decode, data, return_encoding)
+
+    def decode_str(self, data, return_encoding=False):
+        """
+        Decode a multibase encoded str, from the cache if it was decoded before.
+
+        :param data: multibase encoded data
+        :type data: str
+        :param return_encoding: if True, return tuple (encoding, decoded_data)
+        :type return_encoding: bool
+        :return: decoded data, or tuple (encoding, decoded_data) if return_encoding=True
+        :rtype: bytes or tuple
+        :raises InvalidMultibaseStringError: if the data is not multibase encoded
+        :raises DecodingError: if decoding fails
+        """
+        return self._cached(super().decode_str, data, return_encoding)
+
+    def cache_info(self):
+        """
+        Report the cache statistics.
+
+        :return: hits, misses and evictions so far, and the current number of entries and their size in bytes
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, len(self._cache), self._size)
+
+    def cache_clear(self):
+        """Empty the cache and reset its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._size = 0
+            self._hits = self._misses = self._evictions = 0
+
+
 class ComposedDecoder:
-    """A decoder that tries multiple decoders in sequence."""
+    """A decoder that tries multiple decoders in sequence.
+
+    When all the decoders are plain (possibly restricted) :py:class:`Decoder` objects,
+    their prefix tables are merged into one decoder up front, so decoding is a single
+    lookup instead of a trial of each decoder in turn.
+    """
 
     def __init__(self, decoders):
         """
@@ -268,6 +1002,11 @@ class ComposedDecoder:
         :type decoders: list
         """
         self.decoders = decoders
+        codecs = _merged_codecs(decoders)
+        # A single decoder that does the work of all of them, None if they couldn't be merged
+        self._dispatch = None
+        if codecs is not False:
+            self._dispatch = Decoder(None if codecs is None else [codec.encoding for codec in codecs.values()])
 
     def decode(self, data, return_encoding=False):
         """
@@ -281,6 +1020,13 @@ class ComposedDecoder:
         :rtype: bytes or tuple
         :raises DecodingError: if all decoders fail
         """
+        if self._dispatch is not None:
+            try:
+                return self._dispatch.decode(data, return_encoding=return_encoding)
+            except (InvalidMultibaseStringError, DecodingError) as e:
+                # Every decoder would have failed the same way
+                raise DecodingError(f"All decoders failed. Last error: {e}") from e
+
         last_error = None
         for decoder in self.decoders:
             try:
@@ -289,3 +1035,14 @@ class ComposedDecoder:
                 last_error = e
                 continue
         raise DecodingError(f"All decoders failed. Last error: {last_error}") from last_error
+
+    def or_(self, other_decoder):
+        """
+        Compose this decoder with another, trying this one first.
+
+        :param other_decoder: another decoder to try if this one fails
+        :type other_decoder: Decoder
+        :return: a composed decoder
+        :rtype: ComposedDecoder
+        """
+        return ComposedDecoder([*self.decoders, other_decoder])
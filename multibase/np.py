@@ -0,0 +1,166 @@
+"""Vectorized encoding and decoding of NumPy arrays of fixed-length binary values.
+
+Every row of an ``(N, L)`` uint8 array (e.g. N hashes of L bytes each) is one
+value, and all rows are converted at once with array shifts, masks and alphabet
+lookups instead of one Python call per value. Only the encodings whose alphabet
+size is a power of two are supported (base2, base8, base16, base32 and base64
+and their variants), since only those map every group of bytes to a fixed
+number of characters. The results match :py:func:`multibase.encode` and
+:py:func:`multibase.decode` byte for byte.
+
+This module needs NumPy (``pip install py-multibase[numpy]``) and is not imported
+by ``import multibase``; use ``from multibase import np``.
+"""
+
+import numpy
+
+from .converters import Base16StringConverter, BaseByteStringConverter
+from .exceptions import DecodingError, InvalidMultibaseStringError, UnsupportedEncodingError
+from .multibase import get_codec, get_encoding_info
+
+_GROUP_DTYPES = (numpy.uint8, numpy.uint16, numpy.uint32, numpy.uint64)
+
+
+def _layout(codec):
+    """Return the bits per character, group sizes and alphabet of ``codec``, or raise if it has no fixed layout."""
+    converter = codec.converter
+    if isinstance(converter, Base16StringConverter):
+        return 4, 1, 2, converter.digits
+    if isinstance(converter, BaseByteStringConverter):
+        return converter.bits, converter.group_bytes, converter.group_chars, converter.digits
+    raise UnsupportedEncodingError(
+        f"Encoding {codec.encoding} can not be converted as an array, only the power-of-two bases can."
+    )
+
+
+def _pack(values, in_bits, out_bits, in_count, out_count):
+    """Regroup ``(..., in_count)`` fields of ``in_bits`` bits into ``(..., out_count)`` fields of ``out_bits`` bits."""
+    # Use the narrowest integer that holds a whole group
+    dtype = next(dtype for dtype in _GROUP_DTYPES if numpy.iinfo(dtype).bits >= in_bits * in_count)
+    in_shifts = numpy.arange(in_count - 1, -1, -1, dtype=dtype) * dtype(in_bits)
+    # The fields don't overlap, so summing them is the same as OR-ing them
+    groups = (values.astype(dtype) << in_shifts).sum(axis=-1, dtype=dtype)
+    out_shifts = numpy.arange(out_count - 1, -1, -1, dtype=dtype) * dtype(out_bits)
+    return ((groups[..., None] >> out_shifts) & dtype((1 << out_bits) - 1)).astype(numpy.uint8)
+
+
+def _as_rows(arr):
+    """Return ``arr`` as a 2-D uint8 array, viewing a 1-D ``S`` array as one row per value."""
+    arr = numpy.asarray(arr)
+    if arr.dtype.kind == "S" and arr.ndim == 1:
+        arr = numpy.ascontiguousarray(arr)
+        return arr.view(numpy.uint8).reshape(len(arr), arr.dtype.itemsize)
+    if arr.dtype != numpy.uint8 or arr.ndim != 2:
+        raise ValueError(f"Expected an (N, L) uint8 array or a 1-D bytes (S) array, got {arr.dtype} {arr.shape}")
+    return arr
+
+
+def encode_array(encoding, arr, contiguous=False):
+    """
+    Encodes every row of ``arr`` using the encoding that is specified
+
+    :param str encoding: encoding to use, should be one of the power-of-two bases
+    :param arr: the values to encode, one per row
+    :type arr: (N, L) uint8 array
+    :param bool contiguous: if True, return the encoded values back to back in one bytes object
+    :return: the multibase encoded values, as an (N,) array of M-byte ``S`` strings or, with
+        ``contiguous``, as N * M bytes
+    :rtype: numpy.ndarray or bytes
+    :raises UnsupportedEncodingError: if the encoding is not supported or is not a power-of-two base
+    :raises ValueError: if ``arr`` is not a 2-D uint8 array
+    """
+    codec = get_encoding_info(encoding)
+    bits, group_bytes, group_chars, digits = _layout(codec)
+    arr = numpy.asarray(arr)
+    if arr.dtype != numpy.uint8 or arr.ndim != 2:
+        raise ValueError(f"Expected an (N, L) uint8 array, got {arr.dtype} {arr.shape}")
+    rows, length = arr.shape
+    groups = -(-length // group_bytes)
+    chars = -(-length * 8 // bits)
+    size = codec.converter.encoded_length(length)
+
+    alphabet = numpy.frombuffer(digits.encode("ascii"), dtype=numpy.uint8)
+    if group_bytes == 1:
+        # base2 and base16: look every byte up in a table of its characters
+        table = alphabet[_pack(numpy.arange(256, dtype=numpy.uint8)[:, None], 8, bits, 1, group_chars)]
+        # Gathering whole rows as single integers is much faster than as pairs or octets of bytes
+        encoded = table.view(f"u{group_chars}").reshape(256)[arr].view(numpy.uint8)
+    else:
+        # Zero-fill the trailing partial group, like the scalar converters do
+        padded = numpy.zeros((rows, groups * group_bytes), dtype=numpy.uint8)
+        padded[:, :length] = arr
+        encoded = alphabet[_pack(padded.reshape(rows, groups, group_bytes), 8, bits, group_bytes, group_chars)]
+
+    out = numpy.empty((rows, len(codec.code) + size), dtype=numpy.uint8)
+    out[:, : len(codec.code)] = numpy.frombuffer(codec.code, dtype=numpy.uint8)
+    # An explicit shape, since -1 can't be worked out for zero rows
+    out[:, len(codec.code) : len(codec.code) + chars] = encoded.reshape(rows, groups * group_chars)[:, :chars]
+    out[:, len(codec.code) + chars :] = ord("=")
+    if contiguous:
+        return out.tobytes()
+    return out.view(f"S{out.shape[1]}").reshape(rows)
+
+
+def decode_array(arr, return_encoding=False, contiguous=False):
+    """
+    Decodes every value of ``arr``, which must all have the same encoding and length
+
+    The encoding is detected from the prefix of the first value. An array with no
+    values decodes to a ``(0, 0)`` array (or ``b""``), with None as its encoding.
+
+    :param arr: the multibase encoded values
+    :type arr: (N,) ``S`` array (e.g. from :py:func:`encode_array`) or (N, M) uint8 array
+    :param bool return_encoding: if True, return tuple (encoding, decoded_data)
+    :param bool contiguous: if True, return the decoded values back to back in one bytes object
+    :return: the decoded values as an (N, L) uint8 array or, with ``contiguous``, as N * L bytes;
+        or tuple (encoding, decoded_data) if return_encoding=True
+    :rtype: numpy.ndarray, bytes or tuple
+    :raises InvalidMultibaseStringError: if a value is not multibase encoded with the first value's encoding
+    :raises UnsupportedEncodingError: if the encoding is not a power-of-two base
+    :raises DecodingError: if decoding fails
+    :raises ValueError: if ``arr`` has the wrong type or shape
+    """
+    arr = _as_rows(arr)
+    rows = len(arr)
+    if not rows:
+        result = b"" if contiguous else numpy.empty((0, 0), dtype=numpy.uint8)
+        return (None, result) if return_encoding else result
+    codec = get_codec(arr[0].tobytes())
+    bits, group_bytes, group_chars, digits = _layout(codec)
+    code = numpy.frombuffer(codec.code, dtype=numpy.uint8)
+    if not (arr[:, : len(code)] == code).all():
+        raise InvalidMultibaseStringError(f"Not every value is encoded with {codec.encoding}")
+
+    encoded = arr[:, len(code) :]
+    chars = encoded.shape[1]
+    if getattr(codec.converter, "pad", False):
+        # Padding has to line up across rows, since every row decodes to the same length
+        first = encoded[0].tobytes()
+        chars = len(first.rstrip(b"="))
+        if not (encoded[:, chars:] == ord("=")).all():
+            raise DecodingError("Failed to decode multibase data: rows have different padding")
+
+    table = numpy.full(256, 0xFF, dtype=numpy.uint8)
+    for value, char in enumerate(digits.encode("ascii")):
+        table[char] = value
+    if isinstance(codec.converter, Base16StringConverter):
+        # base16 decoding is case-insensitive
+        for value, char in enumerate(digits.swapcase().encode("ascii")):
+            table[char] = value
+    values = table[encoded[:, :chars]]
+    invalid = numpy.flatnonzero((values == 0xFF).any(axis=1))
+    if len(invalid):
+        raise DecodingError(f"Failed to decode multibase data: non-alphabet character in value {invalid[0]}")
+    if isinstance(codec.converter, Base16StringConverter) and chars % 2:
+        raise DecodingError(f"Failed to decode multibase data: odd number of hex digits: {chars}")
+
+    length = chars * bits // 8
+    groups = -(-chars // group_chars)
+    padded = numpy.zeros((rows, groups * group_chars), dtype=numpy.uint8)
+    padded[:, :chars] = values
+    out = _pack(padded.reshape(rows, groups, group_chars), bits, 8, group_chars, group_bytes)
+    out = out.reshape(rows, groups * group_bytes)[:, :length]
+    result = out.tobytes() if contiguous else numpy.ascontiguousarray(out)
+    if return_encoding:
+        return (codec.encoding, result)
+    return result
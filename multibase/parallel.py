@@ -0,0 +1,145 @@
+"""Multi-process encoding and decoding of very large payloads.
+
+For the encodings whose output for a group of input bytes depends only on that
+group (base2, base8, base16, base32, base64 and their variants, base256emoji and
+identity), a payload can be split on group boundaries and every shard converted
+independently. The payload is handed to the worker processes through
+:py:mod:`multiprocessing.shared_memory` rather than pickled, and the encoded
+shards are stitched back together in order.
+
+This module is not imported by ``import multibase``; use ``from multibase import parallel``.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .converters import as_bytes, ensure_buffer
+from .exceptions import DecodingError
+from .multibase import ENCODINGS_LOOKUP, get_codec, get_encoding_info
+from .multibase import decode as _decode
+from .multibase import encode as _encode
+from .stream import _check_streamable
+
+# Payloads smaller than this are converted in the calling process, where
+# spawning workers and copying to shared memory would cost more than it saves
+PARALLEL_THRESHOLD = 8 * 1024 * 1024
+
+
+def _convert_shard(name, encoding, start, stop, decoding):
+    # Workers share the parent's resource tracker, so the block stays owned by
+    # (and is unlinked by) the parent
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        shard = bytes(shm.buf[start:stop])
+    finally:
+        shm.close()
+    converter = ENCODINGS_LOOKUP[encoding].converter
+    return converter.decode(shard) if decoding else converter.encode(shard)
+
+
+def _shard_bounds(length, workers, align):
+    """Split ``length`` units into at most ``workers`` ranges whose inner boundaries are multiples of ``align``."""
+    size = -(-length // workers)
+    size = max(align, -(-size // align) * align)
+    return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+
+def _run(payload, encoding, bounds, workers, executor, decoding):
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(payload)))
+    try:
+        shm.buf[: len(payload)] = payload
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                executor.submit(_convert_shard, shm.name, encoding, start, stop, decoding) for start, stop in bounds
+            ]
+            return b"".join(future.result() for future in futures)
+        finally:
+            if own_executor:
+                executor.shutdown()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def encode(encoding, data, workers=None, executor=None, threshold=PARALLEL_THRESHOLD):
+    """
+    Encodes the given data using the encoding that is specified, on several processes
+
+    :param str encoding: encoding to use, should be one of the supported encoding
+    :param data: data to encode
+    :type data: str or bytes
+    :param int workers: number of worker processes, defaults to the number of CPUs
+    :param executor: an existing :py:class:`concurrent.futures.ProcessPoolExecutor` to submit shards to
+    :param int threshold: payloads smaller than this many bytes are encoded in the calling process
+    :return: multibase encoded data
+    :rtype: bytes
+    :raises UnsupportedEncodingError: if the encoding is not supported or can not be split into shards
+    """
+    codec = get_encoding_info(encoding)
+    group_bytes, _ = _check_streamable(codec)
+    data = ensure_buffer(data)
+    workers = workers or os.cpu_count() or 1
+    if len(data) < threshold or workers == 1:
+        return _encode(encoding, data)
+
+    bounds = _shard_bounds(len(data), workers, group_bytes)
+    return codec.code + _run(data, codec.encoding, bounds, workers, executor, decoding=False)
+
+
+def decode(data, return_encoding=False, workers=None, executor=None, threshold=PARALLEL_THRESHOLD):
+    """
+    Decode the multibase encoded data, on several processes
+
+    :param data: multibase encoded data
+    :type data: str or bytes
+    :param return_encoding: if True, return tuple (encoding, decoded_data)
+    :type return_encoding: bool
+    :param int workers: number of worker processes, defaults to the number of CPUs
+    :param executor: an existing :py:class:`concurrent.futures.ProcessPoolExecutor` to submit shards to
+    :param int threshold: payloads smaller than this many bytes are decoded in the calling process
+    :return: decoded data, or tuple (encoding, decoded_data) if return_encoding=True
+    :rtype: bytes or tuple
+    :raises InvalidMultibaseStringError: if the data is not multibase encoded
+    :raises UnsupportedEncodingError: if the encoding can not be split into shards
+    :raises DecodingError: if decoding fails
+    """
+    data = ensure_buffer(data)
+    codec = get_codec(data)
+    _, group_chars = _check_streamable(codec)
+    workers = workers or os.cpu_count() or 1
+    if len(data) < threshold or workers == 1:
+        return _decode(data, return_encoding=return_encoding)
+
+    payload = memoryview(data)[len(codec.code) :]
+    if getattr(codec.converter, "pad", False):
+        # Shards only strip padding at their own end, so reject padding anywhere else up front
+        padded = as_bytes(data)
+        if padded.find(b"=", len(codec.code), len(padded.rstrip(b"="))) != -1:
+            raise DecodingError("Failed to decode multibase data: padding before the end of the data")
+
+    if group_chars is None:
+        # base256emoji: move every boundary back onto the start of a UTF-8 sequence
+        bounds = []
+        start = 0
+        for _, stop in _shard_bounds(len(payload), workers, 1):
+            while stop < len(payload) and payload[stop] & 0xC0 == 0x80:
+                stop -= 1
+            if stop > start:
+                bounds.append((start, stop))
+                start = stop
+        if start < len(payload):
+            bounds.append((start, len(payload)))
+    else:
+        bounds = _shard_bounds(len(payload), workers, group_chars)
+
+    try:
+        decoded = _run(payload, codec.encoding, bounds, workers, executor, decoding=True)
+    except Exception as e:
+        raise DecodingError(f"Failed to decode multibase data: {e}") from e
+    if return_encoding:
+        return (codec.encoding, decoded)
+    return decoded
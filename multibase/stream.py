@@ -0,0 +1,460 @@
+"""Streaming multibase encoding and decoding over binary file-like objects."""
+
+import io
+import mmap
+import os
+from collections import namedtuple
+
+from .converters import as_bytes, ensure_buffer
+from .exceptions import DecodingError, UnsupportedEncodingError
+from .multibase import get_codec, get_encoding_info
+
+# Default number of input bytes processed per chunk
+CHUNK_SIZE = 64 * 1024
+# Default number of input bytes converted per block by encode_file() and decode_file()
+FILE_BLOCK_SIZE = 4 * 1024 * 1024
+
+FileConversion = namedtuple("FileConversion", "encoding,bytes_in,bytes_out")
+
+# The only multi-byte prefix; every other prefix is one byte, none of them its first
+_EMOJI_PREFIX = "🚀".encode()
+
+
+def _read_head(read, size):
+    """Call ``read(size)`` until the data holds the longest prefix, returning it and whether the input ended.
+
+    A single read may return less than asked for (pipes, sockets, raw files), so
+    the prefix may take several.
+    """
+    head = b""
+    while len(head) < len(_EMOJI_PREFIX):
+        data = read(size)
+        if not data:
+            return head, True
+        head += data
+    return head, False
+
+
+def _check_streamable(codec):
+    """Return the group sizes of ``codec``'s converter, or raise if it can not be processed in chunks."""
+    group_bytes = getattr(codec.converter, "group_bytes", None)
+    if group_bytes is None:
+        raise UnsupportedEncodingError(
+            f"Encoding {codec.encoding} can not be streamed, its output depends on the whole input."
+        )
+    return group_bytes, codec.converter.group_chars
+
+
+def _utf8_boundary(data):
+    """Return the length of the longest prefix of ``data`` that does not end in a partial UTF-8 sequence."""
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 == 0x80:
+            # Continuation byte, keep looking for the lead byte
+            continue
+        if byte < 0x80:
+            needed = 1
+        elif byte >> 5 == 0b110:
+            needed = 2
+        elif byte >> 4 == 0b1110:
+            needed = 3
+        else:
+            needed = 4
+        return len(data) - back if needed > back else len(data)
+    return len(data)
+
+
+class StreamEncoder(io.BufferedIOBase):
+    """Writable stream that multibase encodes everything written to it into ``fileobj``.
+
+    The multibase prefix is written immediately. Data is encoded in chunks that are
+    a multiple of the encoding's group size; the trailing partial group (and any
+    padding) is only written on :py:meth:`close`, which does not close ``fileobj``.
+    """
+
+    def __init__(self, fileobj, encoding, chunk_size=CHUNK_SIZE):
+        """
+        :param fileobj: binary file-like object to write the encoded data to
+        :param encoding: encoding to use, should be one of the supported encodings
+        :type encoding: str
+        :param chunk_size: approximate number of input bytes to encode at a time
+        :type chunk_size: int
+        :raises UnsupportedEncodingError: if the encoding is not supported or can not be streamed
+        """
+        codec = get_encoding_info(encoding)
+        group_bytes, _ = _check_streamable(codec)
+        self.encoding = codec.encoding
+        self._fileobj = fileobj
+        self._converter = codec.converter
+        self._chunk_size = max(group_bytes, chunk_size - chunk_size % group_bytes)
+        self._group_bytes = group_bytes
+        self._pending = b""
+        fileobj.write(codec.code)
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError("write to closed file")
+        view = memoryview(data).cast("B")
+        size = len(view)
+        if self._pending:
+            # Complete the pending partial group first
+            needed = self._group_bytes - len(self._pending)
+            self._pending += bytes(view[:needed])
+            view = view[needed:]
+            if len(self._pending) < self._group_bytes:
+                return size
+            self._fileobj.write(self._converter.encode(self._pending))
+            self._pending = b""
+
+        aligned = len(view) - len(view) % self._group_bytes
+        for start in range(0, aligned, self._chunk_size):
+            chunk = bytes(view[start : min(start + self._chunk_size, aligned)])
+            self._fileobj.write(self._converter.encode(chunk))
+        self._pending = bytes(view[aligned:])
+        return size
+
+    def flush(self):
+        if hasattr(self._fileobj, "flush"):
+            self._fileobj.flush()
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._pending:
+                self._fileobj.write(self._converter.encode(self._pending))
+                self._pending = b""
+            self.flush()
+        finally:
+            super().close()
+
+
+class _ChunkDecoder:
+    """Cuts encoded data into chunks that can each be decoded on their own.
+
+    Shared by :py:class:`StreamDecoder` and :py:mod:`multibase.aio`: :py:meth:`feed`
+    returns the decodable part of everything fed so far, and :py:meth:`decode`
+    converts such a part, so the two steps can run in different places.
+    """
+
+    def __init__(self, codec):
+        _, self._group_chars = _check_streamable(codec)
+        self._converter = codec.converter
+        self._pad = getattr(codec.converter, "pad", False)
+        self._padded = False
+        self._pending = b""
+
+    def feed(self, data, final=False):
+        """Return the longest decodable prefix of the pending data plus ``data``; the rest stays pending."""
+        data = self._pending + data
+        if final:
+            split = len(data)
+        elif self._group_chars is None:
+            split = _utf8_boundary(data)
+        else:
+            split = len(data) - len(data) % self._group_chars
+        chunk, self._pending = data[:split], data[split:]
+        if chunk:
+            if self._padded:
+                # decode() strips any number of trailing "=", so groups of only padding are still padding
+                if chunk.strip(b"="):
+                    raise DecodingError("Failed to decode multibase data: data after padding")
+                return b""
+            self._padded = self._pad and chunk.endswith(b"=")
+        return chunk
+
+    def decode(self, chunk):
+        try:
+            return self._converter.decode(chunk)
+        except Exception as e:
+            raise DecodingError(f"Failed to decode multibase data: {e}") from e
+
+
+class IncrementalEncoder:
+    """Push-style encoder, in the style of :py:class:`codecs.IncrementalEncoder`.
+
+    Every :py:meth:`feed` returns the encoding of the data fed so far that is not
+    part of a trailing partial group, with the multibase prefix in front of the
+    first output. Only that partial group is kept between calls. :py:meth:`flush`
+    returns the rest of the message and readies the encoder for the next one.
+    """
+
+    def __init__(self, encoding):
+        """
+        :param encoding: encoding to use, should be one of the supported encodings
+        :type encoding: str
+        :raises UnsupportedEncodingError: if the encoding is not supported or can not be streamed
+        """
+        codec = get_encoding_info(encoding)
+        self._group_bytes, _ = _check_streamable(codec)
+        self.encoding = codec.encoding
+        self._code = codec.code
+        self._converter = codec.converter
+        self.reset()
+
+    def reset(self):
+        """Drop the pending data and start a new message."""
+        self._prefix = self._code
+        self._pending = b""
+
+    def feed(self, data):
+        """
+        Encodes ``data`` as the next part of the message
+
+        :param data: data to encode
+        :type data: str or bytes-like object
+        :return: the encoded data that ``data`` completes, possibly empty
+        :rtype: bytes
+        """
+        data = self._pending + ensure_buffer(data)
+        aligned = len(data) - len(data) % self._group_bytes
+        self._pending = data[aligned:]
+        encoded = self._prefix + self._converter.encode(data[:aligned]) if aligned else self._prefix
+        self._prefix = b""
+        return encoded
+
+    def flush(self):
+        """
+        Encodes the trailing partial group (and any padding) and ends the message
+
+        :return: the rest of the encoded message
+        :rtype: bytes
+        """
+        encoded = self._prefix + self._converter.encode(self._pending) if self._pending else self._prefix
+        self.reset()
+        return encoded
+
+
+class IncrementalDecoder:
+    """Push-style decoder, in the style of :py:class:`codecs.IncrementalDecoder`.
+
+    The encoding is detected from the prefix at the start of the first data fed
+    and is available as :py:attr:`encoding` from then on (None before). Every
+    :py:meth:`feed` returns the data that the input so far fully determines; only
+    the trailing partial group (or partial UTF-8 sequence for base256emoji) is
+    kept between calls. :py:meth:`flush` returns the rest of the message and
+    readies the decoder for the next one.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Drop the pending data and start a new message."""
+        self.encoding = None
+        self._head = b""
+        self._chunks = None
+
+    def feed(self, data):
+        """
+        Decodes ``data`` as the next part of the message
+
+        :param data: multibase encoded data
+        :type data: bytes-like object
+        :return: the decoded data that ``data`` completes, possibly empty
+        :rtype: bytes
+        :raises InvalidMultibaseStringError: if the encoding can not be determined
+        :raises UnsupportedEncodingError: if the encoding can not be streamed
+        :raises DecodingError: if decoding fails
+        """
+        data = as_bytes(data)
+        if self._chunks is None:
+            data = self._head + data
+            if len(data) < len(_EMOJI_PREFIX) and _EMOJI_PREFIX.startswith(data):
+                # Not enough to tell the prefix yet
+                self._head = data
+                return b""
+            data = self._start(data)
+        return self._chunks.decode(self._chunks.feed(data))
+
+    def flush(self):
+        """
+        Decodes the pending data and ends the message
+
+        :return: the rest of the decoded message
+        :rtype: bytes
+        :raises InvalidMultibaseStringError: if no encoding could be determined
+        :raises DecodingError: if decoding fails
+        """
+        try:
+            data = self._start(self._head) if self._chunks is None else b""
+            return self._chunks.decode(self._chunks.feed(data, final=True))
+        finally:
+            self.reset()
+
+    def _start(self, data):
+        """Detect the encoding from ``data``, returning what follows the prefix."""
+        codec = get_codec(data)
+        self._chunks = _ChunkDecoder(codec)
+        self.encoding = codec.encoding
+        self._head = b""
+        return data[len(codec.code) :]
+
+
+class StreamDecoder(io.BufferedIOBase):
+    """Readable stream that decodes the multibase encoded data read from ``fileobj``.
+
+    The encoding is detected from the first bytes of ``fileobj`` when the stream is
+    created and is available as :py:attr:`encoding`. Closing the stream does not
+    close ``fileobj``.
+    """
+
+    def __init__(self, fileobj, chunk_size=CHUNK_SIZE):
+        """
+        :param fileobj: binary file-like object to read the encoded data from
+        :param chunk_size: number of encoded bytes to read from ``fileobj`` at a time
+        :type chunk_size: int
+        :raises InvalidMultibaseStringError: if the encoding can not be determined
+        :raises UnsupportedEncodingError: if the encoding can not be streamed
+        """
+        head, eof = _read_head(fileobj.read, chunk_size)
+        codec = get_codec(head)
+        self._chunks = _ChunkDecoder(codec)
+        self.encoding = codec.encoding
+        self._fileobj = fileobj
+        self._chunk_size = chunk_size
+        self._decoded = self._chunks.decode(self._chunks.feed(head[len(codec.code) :], final=eof))
+        self._eof = eof
+
+    def readable(self):
+        return True
+
+    def _fill(self):
+        """Decode the next chunk of ``fileobj``, returning False once it is exhausted."""
+        if self._eof:
+            return False
+        data = self._fileobj.read(self._chunk_size)
+        self._eof = not data
+        self._decoded += self._chunks.decode(self._chunks.feed(data, final=self._eof))
+        return True
+
+    def read(self, size=-1):
+        if self.closed:
+            raise ValueError("read from closed file")
+        if size is None or size < 0:
+            while self._fill():
+                pass
+            result, self._decoded = self._decoded, b""
+            return result
+        while len(self._decoded) < size and self._fill():
+            pass
+        result, self._decoded = self._decoded[:size], self._decoded[size:]
+        return result
+
+    def read1(self, size=-1):
+        return self.read(size)
+
+
+def open_encoder(fileobj, encoding, chunk_size=CHUNK_SIZE):
+    """
+    Opens a writable stream that multibase encodes the data written to it into ``fileobj``
+
+    Close the returned stream (or use it as a context manager) to write the final
+    partial group; ``fileobj`` itself is left open.
+
+    :param fileobj: binary file-like object to write the encoded data to
+    :param str encoding: encoding to use, should be one of the supported encodings
+    :param int chunk_size: approximate number of input bytes to encode at a time
+    :return: a writable stream
+    :rtype: StreamEncoder
+    :raises UnsupportedEncodingError: if the encoding is not supported or can not be streamed
+    """
+    return StreamEncoder(fileobj, encoding, chunk_size=chunk_size)
+
+
+def open_decoder(fileobj, chunk_size=CHUNK_SIZE):
+    """
+    Opens a readable stream that decodes the multibase encoded data in ``fileobj``
+
+    The encoding is detected from the prefix at the start of ``fileobj``.
+
+    :param fileobj: binary file-like object to read the encoded data from
+    :param int chunk_size: number of encoded bytes to read from ``fileobj`` at a time
+    :return: a readable stream
+    :rtype: StreamDecoder
+    :raises InvalidMultibaseStringError: if the encoding can not be determined
+    :raises UnsupportedEncodingError: if the encoding can not be streamed
+    """
+    return StreamDecoder(fileobj, chunk_size=chunk_size)
+
+
+def _map_file(fileobj):
+    """Return a read-only memoryview of the whole of ``fileobj``, and the mmap to close after releasing it."""
+    if os.fstat(fileobj.fileno()).st_size == 0:
+        # Empty files can't be mapped
+        return memoryview(b""), None
+    mapped = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped), mapped
+
+
+def encode_file(src_path, dst_path, encoding, block_size=FILE_BLOCK_SIZE):
+    """
+    Multibase encodes the file at ``src_path`` into ``dst_path``
+
+    The source file is memory-mapped and converted block by block, so memory use
+    does not grow with the file size.
+
+    :param src_path: path of the file to encode
+    :param dst_path: path of the file to write the encoded data to, replaced if it exists
+    :param str encoding: encoding to use, should be one of the supported encodings
+    :param int block_size: approximate number of input bytes to encode at a time
+    :return: the encoding, and the number of bytes read and written
+    :rtype: FileConversion
+    :raises UnsupportedEncodingError: if the encoding is not supported or can not be streamed
+    """
+    codec = get_encoding_info(encoding)
+    group_bytes, _ = _check_streamable(codec)
+    block_size = max(group_bytes, block_size - block_size % group_bytes)
+    encode = codec.converter.encode
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        view, mapped = _map_file(src)
+        try:
+            written = dst.write(codec.code)
+            for start in range(0, len(view), block_size):
+                written += dst.write(encode(view[start : start + block_size]))
+            return FileConversion(codec.encoding, len(view), written)
+        finally:
+            view.release()
+            if mapped is not None:
+                mapped.close()
+
+
+def decode_file(src_path, dst_path, block_size=FILE_BLOCK_SIZE):
+    """
+    Decodes the multibase encoded file at ``src_path`` into ``dst_path``
+
+    The encoding is detected from the prefix at the start of the file. The source
+    file is memory-mapped and converted block by block, so memory use does not grow
+    with the file size.
+
+    :param src_path: path of the multibase encoded file
+    :param dst_path: path of the file to write the decoded data to, replaced if it exists
+    :param int block_size: approximate number of encoded bytes to decode at a time
+    :return: the detected encoding, and the number of bytes read and written
+    :rtype: FileConversion
+    :raises InvalidMultibaseStringError: if the encoding can not be determined
+    :raises UnsupportedEncodingError: if the encoding can not be streamed
+    :raises DecodingError: if decoding fails
+    """
+    with open(src_path, "rb") as src:
+        view, mapped = _map_file(src)
+        try:
+            codec = get_codec(bytes(view[:4]))
+            chunks = _ChunkDecoder(codec)
+            # Opened only once the encoding is known, so that bad input leaves no output file
+            with open(dst_path, "wb") as dst:
+                written = 0
+                start = len(codec.code)
+                while True:
+                    stop = min(start + block_size, len(view))
+                    written += dst.write(chunks.decode(chunks.feed(view[start:stop], final=stop == len(view))))
+                    if stop == len(view):
+                        return FileConversion(codec.encoding, len(view), written)
+                    start = stop
+        finally:
+            view.release()
+            if mapped is not None:
+                mapped.close()
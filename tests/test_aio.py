@@ -0,0 +1,100 @@
+"""Tests for `multibase.aio`."""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from multibase import (
+    DecodingError,
+    InvalidMultibaseStringError,
+    UnsupportedEncodingError,
+    aio,
+    encode,
+)
+from tests.test_stream import STREAMABLE_ENCODINGS
+
+
+class BytesWriter:
+    """Minimal StreamWriter stand-in that collects everything written to it."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.drains = 0
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        self.drains += 1
+
+
+def make_reader(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def run(coroutine_function, data, *args, **kwargs):
+    """Run ``coroutine_function`` over a reader of ``data``, returning its result and the written bytes."""
+
+    async def main():
+        writer = BytesWriter()
+        result = await coroutine_function(make_reader(data), writer, *args, **kwargs)
+        return result, bytes(writer.data)
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("encoding", STREAMABLE_ENCODINGS)
+@pytest.mark.parametrize("length", (0, 1, 2, 7, 100, 1001))
+def test_aio_roundtrip(encoding, length):
+    data = b"\x00" * (length % 3) + os.urandom(length)
+    total, encoded = run(aio.encode_stream, data, encoding, chunk_size=13)
+    assert total == len(data)
+    assert encoded == encode(encoding, data)
+
+    result, decoded = run(aio.decode_stream, encoded, chunk_size=7)
+    assert result == encoding
+    assert decoded == data
+
+
+def test_aio_executor():
+    data = os.urandom(10000)
+    with ThreadPoolExecutor(1) as executor:
+        _, encoded = run(aio.encode_stream, data, "base64", chunk_size=1000, executor=executor, executor_threshold=500)
+        _, decoded = run(aio.decode_stream, encoded, chunk_size=1000, executor=executor, executor_threshold=500)
+    assert encoded == encode("base64", data)
+    assert decoded == data
+
+
+def test_aio_yields_between_chunks():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await aio.encode_stream(make_reader(os.urandom(1000)), BytesWriter(), "base32", chunk_size=100)
+        task.cancel()
+
+    asyncio.run(main())
+    assert len(ticks) >= 10
+
+
+def test_aio_errors():
+    with pytest.raises(UnsupportedEncodingError):
+        run(aio.encode_stream, b"foo", "base58btc")
+    with pytest.raises(UnsupportedEncodingError):
+        run(aio.decode_stream, b"zStV1DL6CwTryKyV")
+    with pytest.raises(InvalidMultibaseStringError):
+        run(aio.decode_stream, b"")
+    with pytest.raises(DecodingError):
+        run(aio.decode_stream, b"mZm9v!mFy", chunk_size=4)
+    with pytest.raises(DecodingError, match="after padding"):
+        run(aio.decode_stream, b"MZm8=Zm9v", chunk_size=4)
@@ -0,0 +1,97 @@
+"""Tests for `multibase.cli`."""
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from multibase import decode, encode
+from multibase.cli import main
+from tests.test_stream import NON_STREAMABLE_ENCODINGS, STREAMABLE_ENCODINGS
+
+
+def run(monkeypatch, capsys, argv, data):
+    """Run the tool with ``data`` on stdin, returning the exit status, stdout bytes and stderr text."""
+    stdout = io.BytesIO()
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(stdout))
+    status = main(argv)
+    return status, stdout.getvalue(), capsys.readouterr().err
+
+
+@pytest.mark.parametrize("encoding", STREAMABLE_ENCODINGS + NON_STREAMABLE_ENCODINGS)
+def test_cli_roundtrip(monkeypatch, capsys, encoding):
+    data = b"\x01" + os.urandom(1000)
+    status, encoded, _ = run(monkeypatch, capsys, ["encode", "-e", encoding, "--chunk-size", "64"], data)
+    assert status == 0
+    assert encoded == encode(encoding, data) + b"\n"
+
+    status, decoded, _ = run(monkeypatch, capsys, ["decode", "--chunk-size", "7"], encoded)
+    assert status == 0
+    assert decoded == data
+
+    status, detected, _ = run(monkeypatch, capsys, ["detect"], encoded)
+    assert detected == encoding.encode() + b"\n"
+
+
+def test_cli_transcode(monkeypatch, capsys):
+    status, output, _ = run(monkeypatch, capsys, ["transcode", "-e", "base58btc"], b"maGVsbG8gd29ybGQ\r\n")
+    assert status == 0
+    assert output == b"zStV1DL6CwTryKyV\n"
+
+
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_cli_lines(monkeypatch, capsys, jobs):
+    values = [b"foo", b"", b"hello world"]
+    lines = b"".join(value + b"\n" for value in values)
+    status, encoded, _ = run(monkeypatch, capsys, ["encode", "-e", "base32", "--lines", "--jobs", str(jobs)], lines)
+    assert status == 0
+    assert encoded.splitlines() == [encode("base32", value) for value in values]
+
+    status, output, _ = run(monkeypatch, capsys, ["transcode", "-e", "base16", "--lines", "--jobs", str(jobs)], encoded)
+    assert output.splitlines() == [encode("base16", value) for value in values]
+
+    status, output, _ = run(monkeypatch, capsys, ["detect", "--lines", "--jobs", str(jobs)], b"zStV\r\nmZg\n")
+    assert output == b"base58btc\nbase64\n"
+
+
+def test_cli_lines_errors(monkeypatch, capsys):
+    status, output, err = run(monkeypatch, capsys, ["decode", "--lines"], b"mZm9v\nqfoo\nmZm9v!\nzStV1DL6CwTryKyV\n")
+    assert status == 1
+    assert output == b"foo\n\n\nhello world\n"
+    assert "line 2:" in err
+    assert "line 3:" in err
+
+
+def test_cli_errors(monkeypatch, capsys):
+    status, _, err = run(monkeypatch, capsys, ["decode"], b"qfoo")
+    assert status == 1
+    assert err.startswith("multibase: ")
+    status, _, _ = run(monkeypatch, capsys, ["decode"], b"mZm9v!mFy")
+    assert status == 1
+    with pytest.raises(SystemExit):
+        run(monkeypatch, capsys, ["encode", "-e", "base1"], b"foo")
+
+
+@pytest.mark.parametrize("option", ("--chunk-size", "--jobs"))
+@pytest.mark.parametrize("value", ("0", "-1", "x"))
+def test_cli_positive_options(monkeypatch, capsys, option, value):
+    with pytest.raises(SystemExit) as excinfo:
+        run(monkeypatch, capsys, ["encode", "-e", "base64", option, value], b"foo")
+    assert excinfo.value.code == 2
+    assert "at least 1" in capsys.readouterr().err
+
+
+def test_cli_stats(monkeypatch, capsys):
+    status, _, err = run(monkeypatch, capsys, ["encode", "-e", "base64", "--stats"], b"foobar")
+    assert status == 0
+    assert "6 bytes in, 10 bytes out" in err
+
+
+def test_cli_module():
+    result = subprocess.run(
+        [sys.executable, "-m", "multibase", "decode"], input=b"zStV1DL6CwTryKyV\n", capture_output=True, check=True
+    )
+    assert decode(b"zStV1DL6CwTryKyV") == result.stdout
@@ -0,0 +1,96 @@
+"""Tests for `multibase.concurrent` and for sharing the codecs between threads."""
+
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from multibase import DecodingError, concurrent, decode, encode, list_encodings
+from multibase.converters import BaseStringConverter
+
+BASE58_DIGITS = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+@pytest.fixture
+def switch_often():
+    # Switch threads as often as possible to shake out races on builds with the GIL
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(target, count=8):
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run():
+        barrier.wait()
+        try:
+            target()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_shared_codecs_stress(switch_often):
+    payloads = {encoding: [os.urandom(size) for size in (0, 1, 7, 100, 1000)] for encoding in list_encodings()}
+
+    def convert():
+        for _ in range(5):
+            for encoding, items in payloads.items():
+                for data in items:
+                    assert decode(encode(encoding, b"\x01" + data)) == b"\x01" + data
+
+    run_threads(convert)
+
+
+def test_fresh_basex_converter_stress(switch_often):
+    # A fresh converter starts without cached powers, so every thread races to fill them in
+    data = [b"\x01" + os.urandom(size) for size in (3000, 700, 5000, 1500)]
+    reference = BaseStringConverter(BASE58_DIGITS)
+    expected = [reference.encode(item) for item in data]
+    shared = BaseStringConverter(BASE58_DIGITS)
+
+    def convert():
+        for item, encoded in zip(data, expected):
+            assert shared.encode(item) == encoded
+            assert shared.decode(encoded) == item
+
+    run_threads(convert)
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 7])
+def test_map_encode_decode(batch_size):
+    items = [b"\x01" + os.urandom(size) for size in range(200)]
+    with ThreadPoolExecutor(4) as executor:
+        encoded = concurrent.map_encode(executor, "base58btc", items, batch_size=batch_size)
+        assert encoded == [encode("base58btc", item) for item in items]
+        assert concurrent.map_decode(executor, encoded, batch_size=batch_size) == items
+        decoded = concurrent.map_decode(executor, encoded[:3], return_encoding=True, batch_size=batch_size)
+        assert decoded == [("base58btc", item) for item in items[:3]]
+
+
+def test_map_process_pool():
+    items = [os.urandom(100) for _ in range(100)]
+    with ProcessPoolExecutor(2) as executor:
+        encoded = concurrent.map_encode(executor, "base32", items, batch_size=30)
+        assert concurrent.map_decode(executor, encoded, batch_size=30) == items
+
+
+def test_map_errors():
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(DecodingError):
+            concurrent.map_decode(executor, ["mZm9v", "mZm9v!"], batch_size=1)
+        results = concurrent.map_decode(executor, ["mZm9v", "mZm9v!"], batch_size=1, return_exceptions=True)
+        assert results[0] == b"foo"
+        assert isinstance(results[1], DecodingError)
+        assert concurrent.map_encode(executor, "base64", []) == []
@@ -0,0 +1,124 @@
+"""Tests for `multibase.metrics`."""
+
+import pytest
+
+from multibase import (
+    CachingDecoder,
+    Decoder,
+    DecodingError,
+    Encoder,
+    InvalidMultibaseStringError,
+    UnsupportedEncodingError,
+    decode,
+    decode_into,
+    decode_str,
+    encode,
+    encode_str,
+    list_encodings,
+    metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def disable_metrics():
+    yield
+    metrics.disable()
+
+
+def test_disabled_by_default():
+    assert not metrics.is_enabled()
+    encode("base64", b"foobar")
+    assert metrics.snapshot() == {}
+
+
+def test_counts_calls_and_bytes():
+    metrics.enable()
+    encode("base64", b"foobar")
+    Encoder("base64").encode(b"foo")
+    encode_str("base64", b"f")
+    decode(b"mZm9vYmFy")
+    Decoder().decode("mZm9v", return_encoding=True)
+    decode_str("mZg")
+
+    snapshot = metrics.snapshot()
+    assert set(snapshot["encode"]) == set(list_encodings())
+    encoded = snapshot["encode"]["base64"]
+    assert encoded["calls"] == 3
+    assert encoded["bytes_in"] == 10
+    assert encoded["bytes_out"] == 9 + 5 + 3
+    assert encoded["errors"] == {}
+    assert sum(encoded["latency"]["counts"]) == 3
+    assert len(encoded["latency"]["counts"]) == len(encoded["latency"]["buckets"]) + 1
+    decoded = snapshot["decode"]["base64"]
+    assert decoded["calls"] == 3
+    assert decoded["bytes_in"] == 9 + 5 + 3
+    assert decoded["bytes_out"] == 10
+    assert snapshot["encode"]["base32"]["calls"] == 0
+
+
+def test_counts_into_calls_and_cache_hits():
+    metrics.enable()
+    out = bytearray(16)
+    assert Encoder("base64").encode_into(out, b"foobar") == 9
+    assert decode_into(out, b"mZm9vYmFy") == 6
+    assert Decoder(["base64"]).decode_into(out, b"mZm9v", return_encoding=True) == ("base64", 3)
+    with pytest.raises(DecodingError):
+        Decoder().decode_into(out, b"mZm9v!")
+    decoder = CachingDecoder()
+    for _ in range(3):
+        assert decoder.decode(b"mZm9v") == b"foo"
+
+    snapshot = metrics.snapshot()
+    encoded = snapshot["encode"]["base64"]
+    assert (encoded["calls"], encoded["bytes_in"], encoded["bytes_out"]) == (1, 6, 9)
+    decoded = snapshot["decode"]["base64"]
+    # The cache miss is decoded and counted as a call, the two hits only as hits
+    assert (decoded["calls"], decoded["bytes_in"], decoded["bytes_out"]) == (4, 9 + 5 + 6 + 5, 6 + 3 + 3)
+    assert decoded["errors"] == {"DecodingError": 1}
+    assert decoded["cache_hits"] == 2
+    assert snapshot["decode"]["base32"]["cache_hits"] == 0
+
+
+def test_counts_errors():
+    metrics.enable()
+    with pytest.raises(DecodingError):
+        decode("mZm9v!")
+    with pytest.raises(InvalidMultibaseStringError):
+        decode("qfoo")
+    with pytest.raises(UnsupportedEncodingError):
+        encode("base1", b"foo")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["decode"]["base64"]["errors"] == {"DecodingError": 1}
+    assert snapshot["decode"]["unknown"]["errors"] == {"InvalidMultibaseStringError": 1}
+    assert snapshot["encode"]["unknown"]["errors"] == {"UnsupportedEncodingError": 1}
+
+
+def test_latency_buckets():
+    metrics.enable(latency_buckets=[0.0, 3600.0])
+    encode("base16", b"foo")
+    assert metrics.snapshot()["encode"]["base16"]["latency"] == {"buckets": [0.0, 3600.0], "counts": [0, 1, 0]}
+
+
+def test_slow_call_callback():
+    calls = []
+    metrics.enable(slow_call_seconds=0.0, on_slow_call=lambda *args: calls.append(args))
+    encode("base58btc", b"foo")
+    decode("z4tjq")
+    assert [(operation, encoding, size) for operation, encoding, _, size in calls] == [
+        ("encode", "base58btc", 3),
+        ("decode", "base58btc", 5),
+    ]
+
+    with pytest.raises(ValueError):
+        metrics.enable(slow_call_seconds=1.0)
+
+
+def test_reset_and_disable():
+    metrics.enable()
+    encode("base64", b"foo")
+    metrics.reset()
+    assert metrics.is_enabled()
+    assert metrics.snapshot()["encode"]["base64"]["calls"] == 0
+    metrics.disable()
+    assert metrics.snapshot() == {}
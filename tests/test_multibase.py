@@ -2,27 +2,48 @@
 
 """Tests for `multibase` package."""
 
+import array
+import base64
+import os
+import subprocess
+import sys
+
 import pytest
 from morphys import ensure_bytes
 
 from multibase import (
+    CacheInfo,
+    CachingDecoder,
     Decoder,
     DecodingError,
     Encoder,
     InvalidMultibaseStringError,
     UnsupportedEncodingError,
     decode,
+    decode_into,
+    decode_many,
+    decode_str,
     encode,
+    encode_many,
+    encode_shortest,
+    encode_str,
+    encoded_length,
     get_encoding_info,
     is_encoded,
     is_encoding_supported,
     list_encodings,
+    max_decoded_length,
+    transcode,
+    validate,
 )
 
 TEST_FIXTURES = (
     ("identity", "yes mani !", "\x00yes mani !"),
-    ("base2", "yes mani !", "01111001011001010111001100100000011011010110000101101110011010010010000000100001"),
-    ("base8", "yes mani !", "7171312714403326055632220041"),
+    ("base2", "yes mani !", "001111001011001010111001100100000011011010110000101101110011010010010000000100001"),
+    ("base2", "\x00\x01", "00000000000000001"),
+    ("base8", "yes mani !", "7362625631006654133464440102"),
+    ("base8", "f", "7314"),
+    ("base8", "fo", "7314674"),
     ("base10", "yes mani !", "9573277761329450583662625"),
     ("base16", "yes mani !", "f796573206d616e692021"),
     ("base16", "\x01", "f01"),
@@ -84,6 +105,12 @@ TEST_FIXTURES = (
     ("base36upper", "Decentralize everything!!!", "KM552NG4DABI4NEU1OO8L4I5MNDWMPC3MKUKWTXY9"),
     ("base58flickr", "yes mani !", "Z7Pznk19XTTzBtx"),
     ("base58btc", "yes mani !", "z7paNL19xttacUY"),
+    # Leading zero bytes are kept as leading "1"s
+    ("base58flickr", "\x00yes mani !", "Z17Pznk19XTTzBtx"),
+    ("base58btc", "\x00yes mani !", "z17paNL19xttacUY"),
+    ("base58btc", "\x00\x00yes mani !", "z117paNL19xttacUY"),
+    ("base58btc", "\x00", "z1"),
+    ("base58btc", "", "z"),
     ("base64", "÷ïÿ", "mw7fDr8O/"),
     ("base64", "f", "mZg"),
     ("base64", "fo", "mZm8"),
@@ -135,6 +162,13 @@ def test_decode_incorrect_encoding(encoded_data):
     assert "Can not determine encoding" in str(excinfo.value)
 
 
+@pytest.mark.parametrize("encoded_data", ("f666", "F666F6", "f0"))
+def test_decode_base16_odd_length(encoded_data):
+    # Odd-length base16 used to be read as a number with an implied leading zero digit
+    with pytest.raises(DecodingError, match="Odd number of hex digits"):
+        decode(encoded_data)
+
+
 @pytest.mark.parametrize("_,data,encoded_data", TEST_FIXTURES)
 def test_is_encoded(_, data, encoded_data):
     assert is_encoded(encoded_data)
@@ -145,6 +179,74 @@ def test_is_encoded_incorrect_encoding(encoded_data):
     assert not is_encoded(encoded_data)
 
 
+@pytest.mark.parametrize("encoding,data,encoded_data", TEST_FIXTURES)
+def test_validate(encoding, data, encoded_data):
+    assert validate(encoded_data).encoding == encoding
+    assert is_encoded(encoded_data, strict=True)
+
+
+INVALID_PAYLOADS = (
+    "zinvalid!!!",  # "0", "I", "l" and "!" are not base58btc characters
+    "bmzxw6=",  # padding on an unpadded encoding
+    "cmzxw6",  # missing padding
+    "cmzxw6====",  # too much padding
+    "bm",  # impossible partial group length
+    "mZm9vY",  # impossible partial group length
+    "f666",  # odd number of hex digits
+    "f66zz",
+    "7314674=",
+    "🚀🚀a",
+)
+
+
+@pytest.mark.parametrize("encoded_data", INVALID_PAYLOADS)
+def test_validate_invalid_payload(encoded_data):
+    with pytest.raises(InvalidMultibaseStringError):
+        validate(encoded_data)
+    assert is_encoded(encoded_data)
+    assert not is_encoded(encoded_data, strict=True)
+
+
+def test_validate_unknown_prefix():
+    with pytest.raises(InvalidMultibaseStringError):
+        validate("!qweqweqeqw")
+
+
+def test_encode_many():
+    encodings = sorted({encoding for encoding, _, _ in TEST_FIXTURES})
+    for encoding in encodings:
+        fixtures = [(data, encoded) for e, data, encoded in TEST_FIXTURES if e == encoding]
+        assert encode_many(encoding, [data for data, _ in fixtures]) == [ensure_bytes(e) for _, e in fixtures]
+
+
+def test_encode_many_incorrect_encoding():
+    with pytest.raises(UnsupportedEncodingError):
+        encode_many("base999", ["test data"])
+
+
+def test_decode_many():
+    """Test that mixed-prefix batches come back in input order."""
+    encoded = [encoded_data for _, _, encoded_data in TEST_FIXTURES]
+    assert decode_many(encoded) == [ensure_bytes(data) for _, data, _ in TEST_FIXTURES]
+    assert decode_many(encoded, return_encoding=True) == [
+        (encoding, ensure_bytes(data)) for encoding, data, _ in TEST_FIXTURES
+    ]
+
+
+def test_decode_many_errors():
+    items = ["mZm9v", "!qweqweqeqw", "mZm9v!", "f666f"]
+    with pytest.raises(InvalidMultibaseStringError):
+        decode_many(items)
+    with pytest.raises(DecodingError):
+        decode_many(items[2:])
+
+    results = decode_many(items, return_exceptions=True)
+    assert results[0] == b"foo"
+    assert isinstance(results[1], InvalidMultibaseStringError)
+    assert isinstance(results[2], DecodingError)
+    assert results[3] == b"fo"
+
+
 def test_decode_return_encoding():
     """Test decode with return_encoding parameter."""
     encoding, decoded = decode("f796573206d616e692021", return_encoding=True)
@@ -231,3 +333,429 @@ def test_composed_decoder_all_fail():
         composed.decode("invalid")
     assert "All decoders failed" in str(excinfo.value)
     assert "Last error" in str(excinfo.value)
+
+
+BIT_PACKED_ENCODINGS = (
+    "base2",
+    "base8",
+    "base32hex",
+    "base32hexupper",
+    "base32hexpad",
+    "base32hexpadupper",
+    "base32",
+    "base32upper",
+    "base32pad",
+    "base32padupper",
+    "base64",
+    "base64pad",
+    "base64url",
+    "base64urlpad",
+)
+
+
+@pytest.mark.parametrize("encoding", BIT_PACKED_ENCODINGS)
+def test_bit_packed_roundtrip(encoding):
+    """Test round trips across every partial group length, including leading zero bytes."""
+    for length in range(0, 33):
+        data = b"\x00" + os.urandom(length)
+        assert decode(encode(encoding, data)) == data
+
+
+@pytest.mark.parametrize(
+    "encoding,reference",
+    (
+        ("base32pad", lambda d: base64.b32encode(d).lower()),
+        ("base32hexpadupper", base64.b32hexencode),
+        ("base64pad", base64.b64encode),
+        ("base64url", lambda d: base64.urlsafe_b64encode(d).rstrip(b"=")),
+    ),
+)
+def test_bit_packed_matches_stdlib(encoding, reference):
+    """Test the bit-packing engine against the stdlib RFC 4648 implementation."""
+    data = os.urandom(4099)
+    assert encode(encoding, data)[1:] == reference(data)
+
+
+@pytest.mark.parametrize("encoded_data", ("mZm9v!", "bmzxw6=", "7318", "00102"))
+def test_bit_packed_decode_invalid_character(encoded_data):
+    """Test that characters outside the alphabet are rejected."""
+    with pytest.raises(DecodingError):
+        decode(encoded_data)
+
+
+BIG_INTEGER_ENCODINGS = ("base10", "base32z", "base36", "base36upper", "base58flickr", "base58btc")
+
+
+@pytest.mark.parametrize("encoding", BIG_INTEGER_ENCODINGS)
+@pytest.mark.parametrize("length", (1, 7, 64, 1000, 20000))
+def test_big_integer_roundtrip(encoding, length):
+    """Test round trips on payloads large enough to exercise the divide and conquer split."""
+    data = b"\x01" + os.urandom(length)
+    assert decode(encode(encoding, data)) == data
+
+
+@pytest.mark.parametrize("encoding", ("base58btc", "base58flickr"))
+@pytest.mark.parametrize("length", (0, 1, 2, 33, 34, 36, 37, 64, 127, 128, 129, 300))
+@pytest.mark.parametrize("zeros", (0, 1, 3))
+def test_base58_leading_zeros(encoding, length, zeros):
+    """Test round trips on both sides of the small-input threshold, with leading zero bytes kept as zero digits."""
+    data = b"\x00" * zeros + (b"\x01" + os.urandom(length - 1) if length else b"")
+    encoded = encode(encoding, data)
+    assert len(encoded) - len(encoded[1:].lstrip(b"1")) - 1 == zeros
+    assert decode(encoded) == data
+    assert len(encoded) <= encoded_length(encoding, len(data))
+    assert len(data) <= max_decoded_length(encoded) <= len(data) + 1
+
+
+@pytest.mark.parametrize("encoded_data", ("z0OIl", "9123a", "k12-3"))
+def test_big_integer_decode_invalid_character(encoded_data):
+    """Test that characters outside the alphabet are rejected."""
+    with pytest.raises(DecodingError):
+        decode(encoded_data)
+
+
+@pytest.mark.parametrize("encoding", list_encodings())
+@pytest.mark.parametrize("wrap", (bytearray, memoryview, lambda data: memoryview(bytearray(b"xx" + data))[2:]))
+def test_buffer_inputs(encoding, wrap):
+    """Test that any buffer-protocol object is accepted as input, and not mistaken for its repr."""
+    data = b"\x00\x01yes mani !"
+    encoded = encode(encoding, data)
+    assert encode(encoding, wrap(data)) == encoded
+    assert Encoder(encoding).encode(wrap(data)) == encoded
+    assert decode(wrap(encoded)) == decode(encoded)
+
+
+def test_buffer_input_multidimensional():
+    data = array.array("I", [1, 2, 3])
+    assert decode(encode("base32", data)) == data.tobytes()
+
+
+@pytest.mark.parametrize("encoding", list_encodings())
+def test_encode_into_decode_into(encoding):
+    data = b"\x01yes mani !"
+    encoded = encode(encoding, data)
+    out = bytearray(len(encoded) + 10)
+    assert Encoder(encoding).encode_into(out, data) == len(encoded)
+    assert out[: len(encoded)] == encoded
+
+    out = bytearray(len(data) + 10)
+    assert decode_into(memoryview(out)[5:], encoded) == len(data)
+    assert out[5 : 5 + len(data)] == data
+    assert Decoder().decode_into(out, encoded, return_encoding=True) == (encoding, len(data))
+
+
+def test_encode_into_decode_into_too_small():
+    with pytest.raises(ValueError, match="too small"):
+        Encoder("base64").encode_into(bytearray(4), b"foobar")
+    for encoding in list_encodings():
+        # Nothing is written when the output doesn't fit
+        out = bytearray(len(encode(encoding, b"foobar")) - 1)
+        with pytest.raises(ValueError, match="too small"):
+            Encoder(encoding).encode_into(out, b"foobar")
+        assert out == bytearray(len(out))
+    with pytest.raises(DecodingError, match="too small"):
+        decode_into(bytearray(2), "mZm9vYmFy")
+
+
+def test_import_builds_no_tables():
+    # Tables are built and the modules only some features need are imported on first use,
+    # so a fresh import must not have any
+    code = (
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        "import multibase\n"
+        "loaded = {'functools', 'math', 'mmap', 'threading', 'multibase.stream'} & (set(sys.modules) - before)\n"
+        "assert not loaded, loaded\n"
+        "built = [c.encoding for c in multibase.ENCODINGS if set(vars(c.converter)) & "
+        "{'_decode_table', '_alphabet_table', 'emoji_to_byte'}]\n"
+        "assert not built, built\n"
+        "assert 'morphys' not in sys.modules\n"
+        "assert multibase.decode(multibase.encode('base32', b'yes')) == b'yes'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("encoding", list_encodings())
+@pytest.mark.parametrize("data", [b"", b"\x00\x00yes mani !", os.urandom(100)])
+def test_encode_str_decode_str(encoding, data):
+    if encoding == "identity":
+        data = data.replace(b"\x00", b"").decode("latin-1").encode("utf-8")
+    encoded = encode_str(encoding, data)
+    assert encoded == encode(encoding, data).decode("utf-8")
+    assert Encoder(encoding).encode_str(data) == encoded
+    assert decode_str(encoded) == decode(encoded)
+    assert Decoder().decode_str(encoded, return_encoding=True) == (encoding, decode(encoded))
+
+
+@pytest.mark.parametrize("encoded", ["zé1", "f0g", "mZm9v\u00e9", "🚀🚀x"])
+def test_decode_str_invalid(encoded):
+    with pytest.raises(DecodingError):
+        decode_str(encoded)
+
+
+def test_decode_str_invalid_prefix():
+    with pytest.raises(InvalidMultibaseStringError):
+        decode_str("qfoo")
+    with pytest.raises(InvalidMultibaseStringError):
+        decode_str("")
+
+
+@pytest.mark.parametrize("encoding", ["base16", "base16upper"])
+@pytest.mark.parametrize("data", [b"\x00", b"\x00\x00\x00", b"\x00\x00\x01\xff", b"\x00" + os.urandom(31)])
+def test_base16_leading_zero_bytes(encoding, data):
+    encoded = encode(encoding, data)
+    assert encoded[1:].lower() == data.hex().encode()
+    assert decode(encoded) == data
+    assert decode_str(encoded.decode()) == data
+
+
+@pytest.mark.parametrize("encoded", ["f00FFaB", "F00ffAb"])
+def test_base16_decode_mixed_case(encoded):
+    assert decode(encoded) == b"\x00\xff\xab"
+
+
+@pytest.mark.parametrize("encoded", ["f0", "f0g", "f00 1", "F0é"])
+def test_base16_decode_invalid(encoded):
+    with pytest.raises(DecodingError):
+        decode(encoded)
+
+
+def test_base256emoji_vector():
+    encoded = "🚀🏃✋🌈😅🌷🤤😻🌟😅👏"
+    assert encode("base256emoji", "yes mani !") == encoded.encode("utf-8")
+    assert decode(encoded) == b"yes mani !"
+
+
+def test_base256emoji_every_byte():
+    data = bytes(range(256))
+    encoded = encode("base256emoji", data)
+    assert len(set(encoded.decode("utf-8")[1:])) == 256
+    assert decode(encoded) == data
+
+
+@pytest.mark.parametrize("char", ["a", "é", "\x00", "�", "🦄"])
+def test_base256emoji_decode_invalid(char):
+    with pytest.raises(DecodingError, match=f"Non-base256emoji character: {char}"):
+        decode("🚀🚀" + char + "🚀")
+
+
+def test_caching_decoder():
+    decoder = CachingDecoder(max_entries=2)
+    assert decoder.decode("zStV1DL6CwTryKyV") == b"hello world"
+    assert decoder.decode("zStV1DL6CwTryKyV", return_encoding=True) == ("base58btc", b"hello world")
+    assert decoder.decode(bytearray(b"mZm9v")) == b"foo"
+    assert decoder.decode_str("mZm9v") == b"foo"
+    assert decoder.cache_info() == CacheInfo(hits=2, misses=2, evictions=0, entries=2, size=16 + 11 + 5 + 3)
+    assert decoder.decode("f00") == b"\x00"
+    assert decoder.cache_info().evictions == 1
+
+    decoder.cache_clear()
+    assert decoder.cache_info() == CacheInfo(0, 0, 0, 0, 0)
+
+
+def test_caching_decoder_limits():
+    decoder = CachingDecoder(max_bytes=20, max_input_size=10)
+    decoder.decode("f" + "00" * 20)
+    assert decoder.cache_info().misses == 0
+    decoder.decode("mZm9vYmFy")
+    decoder.decode("mYmFyYmF6")
+    assert decoder.cache_info() == CacheInfo(hits=0, misses=2, evictions=1, entries=1, size=15)
+
+
+def test_caching_decoder_errors_not_cached():
+    decoder = CachingDecoder()
+    for _ in range(2):
+        with pytest.raises(DecodingError):
+            decoder.decode("mZm9v!")
+    assert decoder.cache_info().entries == 0
+
+
+def test_restricted_decoder():
+    decoder = Decoder(encodings=["base32", "base58btc"])
+    assert decoder.encodings == ["base32", "base58btc"]
+    assert decoder.decode("zStV1DL6CwTryKyV") == b"hello world"
+    assert decoder.decode_str("bmzxw6", return_encoding=True) == ("base32", b"foo")
+    out = bytearray(3)
+    assert decoder.decode_into(out, "bmzxw6") == 3
+    for method in (decoder.decode, decoder.decode_str, lambda data: decoder.decode_into(out, data)):
+        with pytest.raises(InvalidMultibaseStringError, match="base64 is not accepted"):
+            method("mZm9v")
+    with pytest.raises(InvalidMultibaseStringError, match="Can not determine encoding"):
+        decoder.decode("qfoo")
+    with pytest.raises(UnsupportedEncodingError):
+        Decoder(encodings=["base1"])
+    assert Decoder().encodings == list_encodings()
+
+
+def test_composed_decoder_dispatch():
+    composed = Decoder(encodings=["base32"]).or_(Decoder(encodings=["base64"])).or_(Decoder(encodings=["base16"]))
+    assert composed._dispatch.encodings == ["base32", "base64", "base16"]
+    assert composed.decode("mZm9v", return_encoding=True) == ("base64", b"foo")
+    assert composed.decode("f666f6f") == b"foo"
+    with pytest.raises(DecodingError, match=r"All decoders failed.*base58btc is not accepted"):
+        composed.decode("zStV1DL6CwTryKyV")
+    with pytest.raises(DecodingError, match=r"All decoders failed.*Non-alphabet"):
+        composed.decode("mZm9v!")
+
+    assert Decoder(encodings=["base32"]).or_(Decoder())._dispatch.encodings == list_encodings()
+
+
+def test_composed_decoder_without_dispatch():
+    class PrefixStrippingDecoder(Decoder):
+        def decode(self, data, return_encoding=False):
+            return super().decode(data[1:], return_encoding=return_encoding)
+
+    composed = Decoder(encodings=["base32"]).or_(PrefixStrippingDecoder())
+    assert composed._dispatch is None
+    assert composed.decode("bmzxw6") == b"foo"
+    assert composed.decode("xmZm9v") == b"foo"
+    with pytest.raises(DecodingError, match="All decoders failed"):
+        composed.decode("xqfoo")
+
+
+def test_caching_decoder_restricted():
+    decoder = CachingDecoder(encodings=["base32"])
+    assert decoder.decode("bmzxw6") == b"foo"
+    with pytest.raises(InvalidMultibaseStringError):
+        decoder.decode("mZm9v")
+    assert decoder.cache_info().entries == 1
+
+
+STDLIB_BACKED_ENCODINGS = tuple(e for e in BIT_PACKED_ENCODINGS if e.startswith(("base32", "base64")))
+
+
+def engine_twin(encoding):
+    """Return the stdlib-backed converter of ``encoding`` and the same converter without the stdlib backend."""
+    converter = get_encoding_info(encoding).converter
+    return converter, type(converter)(converter.digits, pad=converter.pad, stdlib=False)
+
+
+def outcome(function, *args):
+    try:
+        return function(*args)
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.parametrize("encoding", STDLIB_BACKED_ENCODINGS)
+def test_stdlib_backend_matches_engine(encoding):
+    converter, engine = engine_twin(encoding)
+    for length in (*range(12), 127, 128, 129, 1000, 4099):
+        data = os.urandom(length)
+        encoded = engine.encode(data)
+        assert converter.encode(data) == encoded
+        assert converter.encode_str(data) == encoded.decode()
+        out = bytearray(len(encoded))
+        assert converter.encode_into(out, data) == len(encoded)
+        assert out == encoded
+        assert converter.decode(encoded) == engine.decode(encoded) == data
+        out = bytearray(length)
+        assert converter.decode_into(out, encoded) == length
+        assert out == data
+
+
+MANGLERS = [lambda e: e[:-1], lambda e: e + e[-1:], lambda e: e[:-1] + b"=", lambda e: e + b"="]
+
+
+@pytest.mark.parametrize("encoding", STDLIB_BACKED_ENCODINGS)
+@pytest.mark.parametrize("mangle", MANGLERS)
+def test_stdlib_backend_matches_engine_on_bad_input(encoding, mangle):
+    converter, engine = engine_twin(encoding)
+    for length in range(12):
+        encoded = mangle(engine.encode(os.urandom(length)))
+        assert outcome(converter.decode, encoded) == outcome(engine.decode, encoded)
+
+
+@pytest.mark.parametrize("encoding", STDLIB_BACKED_ENCODINGS)
+def test_stdlib_backend_rejects_foreign_characters(encoding):
+    converter, _ = engine_twin(encoding)
+    encoded = converter.encode(b"foobar")
+    # Characters of the other variants' alphabets, which the stdlib codecs would take
+    for char in b"+/-_aA0=":
+        if char not in converter.digits.encode():
+            with pytest.raises(ValueError):
+                converter.decode(encoded[:2] + bytes([char]) + encoded[3:])
+
+
+@pytest.mark.parametrize("encoding", list_encodings())
+@pytest.mark.parametrize("length", [0, 1, 2, 3, 4, 5, 31, 100])
+def test_size_estimation(encoding, length):
+    data = b"\x01" + os.urandom(length)
+    encoded = encode(encoding, data)
+    info = get_encoding_info(encoding)
+    if info.group_chars is None:
+        # Upper bounds
+        assert len(encoded) <= encoded_length(encoding, len(data))
+        assert len(data) <= max_decoded_length(encoded) <= len(data) + (len(data) if encoding == "base256emoji" else 1)
+    else:
+        assert len(encoded) == encoded_length(encoding, len(data))
+        assert max_decoded_length(encoded) == len(data)
+    if encoding == "base256emoji" or (info.group_chars is not None and encoding != "identity"):
+        # Exact for str, where the emoji can be counted
+        assert max_decoded_length(encoded.decode()) == len(data)
+
+
+def test_encoding_metadata():
+    base64pad = get_encoding_info("base64pad")
+    assert (base64pad.bits_per_char, base64pad.group_bytes, base64pad.group_chars, base64pad.padded) == (6, 3, 4, True)
+    base58btc = get_encoding_info("base58btc")
+    assert base58btc.bits_per_char == pytest.approx(5.858, abs=1e-3)
+    assert (base58btc.group_bytes, base58btc.group_chars, base58btc.padded) == (None, None, False)
+    # Still a plain (encoding, code, converter) tuple
+    encoding, code, _ = base64pad
+    assert (encoding, code) == ("base64pad", b"M")
+
+
+def test_size_estimation_errors():
+    with pytest.raises(UnsupportedEncodingError):
+        encoded_length("base1", 10)
+    with pytest.raises(ValueError):
+        encoded_length("base64", -1)
+    with pytest.raises(InvalidMultibaseStringError):
+        max_decoded_length(b"qfoo")
+    with pytest.raises(InvalidMultibaseStringError):
+        max_decoded_length("")
+
+
+def test_encode_shortest():
+    data = b"hello world"
+    assert encode_shortest(data) == encode("base64", data)
+    assert encode_shortest(data, ["base2", "base16", "base36"]) == encode("base36", data)
+    # Ties go to the first candidate
+    assert encode_shortest(data, ["base64url", "base64"]) == encode("base64url", data)
+    with pytest.raises(ValueError):
+        encode_shortest(data, [])
+    with pytest.raises(UnsupportedEncodingError):
+        encode_shortest(data, ["base64", "base1"])
+
+
+@pytest.mark.parametrize("source", list_encodings())
+@pytest.mark.parametrize("target", ["base16upper", "base32", "base32hexpad", "base64url", "base58btc", "base256emoji"])
+def test_transcode(source, target):
+    for length in range(8):
+        data = b"\x01" + os.urandom(length)
+        assert transcode(encode(source, data), target) == encode(target, data)
+    assert transcode(encode_str(source, b"\x01foo"), target) == encode(target, b"\x01foo")
+
+
+@pytest.mark.parametrize(
+    "encoded,target,expected",
+    [
+        # Non-canonical trailing bits and characters that decode to nothing are normalized away
+        ("mZh", "base64url", b"uZg"),
+        ("MZh=", "base64urlpad", b"UZg=="),
+        ("bmzq", "base32upper", b"BMY"),
+        ("f0A", "base16", b"f0a"),
+        ("mZ", "base32", b"b"),
+    ],
+)
+def test_transcode_normalizes(encoded, target, expected):
+    assert transcode(encoded, target) == expected == encode(target, decode(encoded))
+
+
+@pytest.mark.parametrize("encoded", ["f0", "mZm9v!", "MZm=9v", "bm1", "qfoo"])
+def test_transcode_invalid(encoded):
+    with pytest.raises((DecodingError, InvalidMultibaseStringError)):
+        transcode(encoded, "base64url")
+    with pytest.raises(UnsupportedEncodingError):
+        transcode("mZm9v", "base1")
@@ -0,0 +1,86 @@
+"""Tests for `multibase.np`."""
+
+import os
+
+import pytest
+
+from multibase import (
+    DecodingError,
+    Encoder,
+    InvalidMultibaseStringError,
+    UnsupportedEncodingError,
+    decode,
+    get_encoding_info,
+    list_encodings,
+)
+
+numpy = pytest.importorskip("numpy")
+from multibase import np as multibase_np  # noqa: E402
+
+POWER_OF_TWO_ENCODINGS = tuple(e for e in list_encodings() if get_encoding_info(e).group_chars not in (None, 1))
+
+
+def random_rows(rows, length):
+    return numpy.frombuffer(os.urandom(rows * length), dtype=numpy.uint8).reshape(rows, length)
+
+
+@pytest.mark.parametrize("encoding", POWER_OF_TWO_ENCODINGS)
+@pytest.mark.parametrize("length", (0, 1, 2, 3, 4, 5, 7, 32, 36))
+def test_array_roundtrip(encoding, length):
+    arr = random_rows(20, length)
+    encoded = multibase_np.encode_array(encoding, arr)
+    expected = [Encoder(encoding).encode(bytes(row)) for row in arr]
+    assert encoded.shape == (20,)
+    assert list(encoded) == expected
+    assert multibase_np.encode_array(encoding, arr, contiguous=True) == b"".join(expected)
+
+    decoded = multibase_np.decode_array(encoded)
+    assert decoded.dtype == numpy.uint8
+    assert (decoded == arr).all()
+    assert multibase_np.decode_array(numpy.array(expected), contiguous=True) == arr.tobytes()
+    as_rows = numpy.frombuffer(b"".join(expected), dtype=numpy.uint8).reshape(20, -1)
+    assert multibase_np.decode_array(as_rows, return_encoding=True)[0] == encoding
+
+
+@pytest.mark.parametrize("encoding", POWER_OF_TWO_ENCODINGS)
+@pytest.mark.parametrize("length", (0, 1, 32))
+def test_array_no_rows(encoding, length):
+    encoded = multibase_np.encode_array(encoding, random_rows(0, length))
+    assert encoded.shape == (0,)
+    assert encoded.dtype.itemsize == len(Encoder(encoding).encode(bytes(length)))
+    assert multibase_np.encode_array(encoding, random_rows(0, length), contiguous=True) == b""
+
+    assert multibase_np.decode_array(encoded).shape == (0, 0)
+    assert multibase_np.decode_array(encoded, return_encoding=True, contiguous=True) == (None, b"")
+    assert multibase_np.decode_array(numpy.zeros((0, 8), dtype=numpy.uint8)).shape == (0, 0)
+
+
+def test_decode_array_matches_decode():
+    # Mixed case base16 and non-canonical trailing bits decode like decode() does
+    values = [b"f0aFf", b"f00AB"]
+    assert multibase_np.decode_array(numpy.array(values), contiguous=True) == b"".join(map(decode, values))
+    assert multibase_np.decode_array(numpy.array([b"mZh", b"mZg"]), contiguous=True) == b"ff"
+
+
+def test_array_errors():
+    with pytest.raises(UnsupportedEncodingError):
+        multibase_np.encode_array("base58btc", random_rows(2, 4))
+    with pytest.raises(UnsupportedEncodingError):
+        multibase_np.encode_array("base1", random_rows(2, 4))
+    with pytest.raises(ValueError):
+        multibase_np.encode_array("base32", numpy.zeros(4, dtype=numpy.uint8))
+    with pytest.raises(ValueError):
+        multibase_np.encode_array("base32", numpy.zeros((2, 4), dtype=numpy.int32))
+
+    with pytest.raises(InvalidMultibaseStringError):
+        multibase_np.decode_array(numpy.array([b"mZm9v", b"uZm9v"]))
+    with pytest.raises(UnsupportedEncodingError):
+        multibase_np.decode_array(numpy.array([b"zStV", b"zStV"]))
+    with pytest.raises(DecodingError):
+        multibase_np.decode_array(numpy.array([b"mZm9v", b"mZm!v"]))
+    with pytest.raises(DecodingError):
+        multibase_np.decode_array(numpy.array([b"MZg==", b"MZgA="]))
+    with pytest.raises(DecodingError):
+        multibase_np.decode_array(numpy.array([b"f0a0", b"f0a"]))
+    with pytest.raises(DecodingError, match="odd number"):
+        multibase_np.decode_array(numpy.array([b"f0ab", b"f0bc"]))
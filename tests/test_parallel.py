@@ -0,0 +1,53 @@
+"""Tests for multi-process encoding and decoding."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from multibase import DecodingError, UnsupportedEncodingError, decode, encode, parallel
+
+ENCODINGS = ("base2", "base16upper", "base32hexpad", "base64", "base64urlpad", "base256emoji", "identity")
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+@pytest.mark.parametrize("length", (0, 1, 1000, 4099))
+def test_parallel_roundtrip(executor, encoding, length):
+    data = os.urandom(length)
+    encoded = parallel.encode(encoding, data, workers=3, executor=executor, threshold=0)
+    assert encoded == encode(encoding, data)
+    assert parallel.decode(encoded, workers=3, executor=executor, threshold=0) == data
+    assert parallel.decode(encoded, return_encoding=True, workers=3, executor=executor, threshold=0) == (
+        encoding,
+        data,
+    )
+
+
+def test_parallel_below_threshold():
+    """Small payloads never reach the process pool."""
+    encoded = parallel.encode("base32", b"hello", workers=4)
+    assert encoded == encode("base32", b"hello")
+    assert parallel.decode(encoded, workers=4) == b"hello"
+
+
+def test_parallel_own_executor():
+    data = os.urandom(10000)
+    encoded = parallel.encode("base64", data, workers=2, threshold=0)
+    assert decode(encoded) == data
+
+
+def test_parallel_non_shardable_encoding():
+    with pytest.raises(UnsupportedEncodingError):
+        parallel.encode("base58btc", b"hello")
+
+
+@pytest.mark.parametrize("encoded_data", (b"MZm9v!Zm9v", b"MZg==Zm9vYmFy"))
+def test_parallel_invalid_data(executor, encoded_data):
+    with pytest.raises(DecodingError):
+        parallel.decode(encoded_data, workers=3, executor=executor, threshold=0)
@@ -0,0 +1,198 @@
+"""Tests for the streaming encoder and decoder."""
+
+import io
+import os
+
+import pytest
+
+from multibase import (
+    DecodingError,
+    FileConversion,
+    IncrementalDecoder,
+    IncrementalEncoder,
+    InvalidMultibaseStringError,
+    UnsupportedEncodingError,
+    decode,
+    decode_file,
+    encode,
+    encode_file,
+    list_encodings,
+    open_decoder,
+    open_encoder,
+)
+
+NON_STREAMABLE_ENCODINGS = ("base10", "base32z", "base36", "base36upper", "base58flickr", "base58btc")
+STREAMABLE_ENCODINGS = tuple(e for e in list_encodings() if e not in NON_STREAMABLE_ENCODINGS)
+
+
+@pytest.mark.parametrize("encoding", STREAMABLE_ENCODINGS)
+@pytest.mark.parametrize("length", (0, 1, 2, 7, 100, 1001))
+def test_stream_roundtrip(encoding, length):
+    data = b"\x00" * (length % 3) + os.urandom(length)
+    out = io.BytesIO()
+    # Small, odd-sized writes and chunks to exercise partial groups at every boundary
+    with open_encoder(out, encoding, chunk_size=13) as stream:
+        for start in range(0, len(data), 11):
+            stream.write(data[start : start + 11])
+    assert out.getvalue() == encode(encoding, data)
+
+    out.seek(0)
+    with open_decoder(out, chunk_size=7) as stream:
+        assert stream.encoding == encoding
+        assert stream.read(5) + stream.read() == data
+
+
+class TrickleReader:
+    """Raw-stream stand-in whose reads return only one or two bytes, like a slow pipe or socket."""
+
+    def __init__(self, data):
+        self._data = data
+        self._reads = 0
+
+    def read(self, size=-1):
+        self._reads += 1
+        size = 1 + self._reads % 2
+        data, self._data = self._data[:size], self._data[size:]
+        return data
+
+
+@pytest.mark.parametrize("encoding", STREAMABLE_ENCODINGS)
+def test_stream_decoder_short_reads(encoding):
+    data = os.urandom(50)
+    with open_decoder(TrickleReader(encode(encoding, data))) as stream:
+        assert stream.encoding == encoding
+        assert stream.read() == data
+
+
+@pytest.mark.parametrize("encoding", NON_STREAMABLE_ENCODINGS)
+def test_stream_non_streamable_encoding(encoding):
+    with pytest.raises(UnsupportedEncodingError) as excinfo:
+        open_encoder(io.BytesIO(), encoding)
+    assert "can not be streamed" in str(excinfo.value)
+
+    with pytest.raises(UnsupportedEncodingError):
+        open_decoder(io.BytesIO(encode(encoding, b"hello")))
+
+
+def test_stream_leaves_fileobj_open():
+    out = io.BytesIO()
+    with open_encoder(out, "base64") as stream:
+        stream.write(b"hello")
+    assert not out.closed
+    assert decode(out.getvalue()) == b"hello"
+
+
+def test_stream_decoder_unknown_prefix():
+    with pytest.raises(InvalidMultibaseStringError):
+        open_decoder(io.BytesIO(b"!qweqweqeqw"))
+
+
+@pytest.mark.parametrize("encoded_data", (b"mZm9v!", b"MZg==Zm8="))
+def test_stream_decoder_invalid_data(encoded_data):
+    with pytest.raises(DecodingError):
+        open_decoder(io.BytesIO(encoded_data), chunk_size=4).read()
+
+
+@pytest.mark.parametrize("encoded_data", (b"MQQ======", b"MQUE=====", b"cme=========", b"M====", b"TC4======"))
+@pytest.mark.parametrize("chunk_size", (1, 2, 3, 4, 8, 100))
+def test_stream_decoder_extra_padding(encoded_data, chunk_size):
+    assert open_decoder(io.BytesIO(encoded_data), chunk_size=chunk_size).read() == decode(encoded_data)
+    decoder = IncrementalDecoder()
+    chunks = [encoded_data[start : start + chunk_size] for start in range(0, len(encoded_data), chunk_size)]
+    assert b"".join(decoder.feed(chunk) for chunk in chunks) + decoder.flush() == decode(encoded_data)
+
+
+@pytest.mark.parametrize("encoding", STREAMABLE_ENCODINGS)
+@pytest.mark.parametrize("length", (0, 1, 7, 1001))
+def test_file_roundtrip(tmp_path, encoding, length):
+    data = b"\x00" * (length % 3) + os.urandom(length)
+    src, encoded, decoded = tmp_path / "src", tmp_path / "encoded", tmp_path / "decoded"
+    src.write_bytes(data)
+
+    result = encode_file(src, encoded, encoding, block_size=13)
+    assert encoded.read_bytes() == encode(encoding, data)
+    assert result == FileConversion(encoding, len(data), encoded.stat().st_size)
+
+    result = decode_file(encoded, decoded, block_size=7)
+    assert decoded.read_bytes() == data
+    assert result == FileConversion(encoding, encoded.stat().st_size, len(data))
+
+
+def test_file_errors(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.write_bytes(b"")
+    with pytest.raises(UnsupportedEncodingError):
+        encode_file(src, dst, "base58btc")
+    with pytest.raises(InvalidMultibaseStringError):
+        decode_file(src, dst)
+    assert not dst.exists()
+
+    src.write_bytes(b"mZm9v!")
+    with pytest.raises(DecodingError):
+        decode_file(src, dst, block_size=4)
+
+
+def feed_in_pieces(coder, data, sizes):
+    """Feed ``data`` to ``coder`` in pieces cycling through ``sizes``, then flush it."""
+    output = []
+    start = 0
+    for size in sizes * (len(data) + 1):
+        if start >= len(data):
+            break
+        output.append(coder.feed(data[start : start + size]))
+        start += size
+    return output, b"".join(output) + coder.flush()
+
+
+@pytest.mark.parametrize("encoding", STREAMABLE_ENCODINGS)
+@pytest.mark.parametrize("length", (0, 1, 2, 7, 100, 1001))
+def test_incremental_roundtrip(encoding, length):
+    data = b"\x00" * (length % 3) + os.urandom(length)
+    encoder = IncrementalEncoder(encoding)
+    _, encoded = feed_in_pieces(encoder, data, [0, 1, 5, 13])
+    assert encoded == encode(encoding, data)
+
+    decoder = IncrementalDecoder()
+    _, decoded = feed_in_pieces(decoder, encoded, [1, 0, 3, 7])
+    assert decoded == data
+    assert decoder.encoding is None
+
+
+def test_incremental_output_as_soon_as_determined():
+    encoder = IncrementalEncoder("base64")
+    assert encoder.feed(b"he") == b"m"
+    assert encoder.feed(b"llo") == b"aGVs"
+    assert encoder.flush() == b"bG8"
+    # Ready for the next message
+    assert encoder.feed(b"") == b"m"
+    assert encoder.flush() == b""
+
+    decoder = IncrementalDecoder()
+    assert decoder.feed("🚀".encode()[:3]) == b""
+    assert decoder.encoding is None
+    assert decoder.feed("🚀".encode()[3:] + "🚀🚀".encode()[:6]) == b"\x00"
+    assert decoder.encoding == "base256emoji"
+    assert decoder.feed("🚀🚀".encode()[6:]) == b"\x00"
+    assert decoder.flush() == b""
+
+    assert decoder.feed(b"MZm9vYm") == b"foo"
+    assert decoder.encoding == "base64pad"
+    assert decoder.flush() == b"b"
+
+
+def test_incremental_errors():
+    with pytest.raises(UnsupportedEncodingError):
+        IncrementalEncoder("base58btc")
+    decoder = IncrementalDecoder()
+    with pytest.raises(UnsupportedEncodingError):
+        decoder.feed(b"zStV1DL6CwTryKyV")
+    with pytest.raises(InvalidMultibaseStringError):
+        decoder.feed(b"!foo")
+    with pytest.raises(InvalidMultibaseStringError):
+        decoder.flush()
+    with pytest.raises(DecodingError):
+        decoder.feed(b"mZm9v!mFy")
+    decoder.reset()
+    decoder.feed(b"MZm8=")
+    with pytest.raises(DecodingError, match="after padding"):
+        decoder.feed(b"Zm9v")